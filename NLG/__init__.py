@@ -0,0 +1,140 @@
+# NOTICE
+# 
+# This software was produced for the U.S. Government under
+# contract SB-1341-14-CQ-0010, and is subject to the Rights
+# in Data-General Clause 52.227-14, Alt. IV (DEC 2007)
+#
+# (c) 2018 The MITRE Corporation. All Rights Reserved.
+
+
+#====================================================
+# CASE NLG VERIFIER v0.1.0
+
+"""
+The Natural Language Glossary (NLG) is an alphabetical list of types of CASE classes (categories of CASE types).
+The functions of this package create CASE objects (instances of such types) while automatically checking ontology and type.
+The API (case.py) could be used directly to create non-typed objects if ontology and type checking are not requirements.
+However, we advise against this to maintain consistency across community usage of the ontology.
+
+Note that different versions of the NLG exist for different realizations of the Unified Cyber Ontology.
+The human legible NLG corresponding to this version of CASE (one realization of UCO) can be found here:
+https://casework.github.io/case/case-v0.1.0-natural-language-glossary.html
+
+-----------------------------------------------------
+NOTES ON FUNCTION STRUCTURE
+
+    CASE objects:         Search "CREATE A CASE OBJECT" in the API (case.py) to understand the high-level CASE objects.
+    Parameters:           All parameters use underscores coming in and are set by default to MISSING (a case.Missing object).
+    Required parameters:  The CASE Document class is passed in ('_sub' functions also require their superseding CASE class).
+    Ontology parameters:  All other parameters are specified by the CASE ontology, and may be required or optional.
+    Function docstrings:  'Any number of' = must be a list or other iterable, e.g. a generator (otherwise pass in a single Python object)
+                          'Exactly one' or 'At least one' = required parameter
+                          'At most one' = optional parameter
+    Checks table:         A Checks table above each function lists its checked parameters (see NLG/checks.py):
+                          1) superseding CASE class/type (if applicable)
+                          2) required and optional parameters, in signature order
+                          The body passes the parameters to the table's check() before creating the object.
+    Return:               The desired object is instantiated with properties(), which adds the parameters under their
+                          CamelCase predicates for JSON-LD output (see NLG/predicates.py).
+
+    See examples/NLG_template.txt for a list of all instances of function definitions, docstrings, and assert statements found in the NLG.
+
+-----------------------------------------------------
+ORGANIZATION FOR DEVELOPERS
+
+As development of the ontology moves forward new functions and API classes may be added.
+If you wish to contribute to improvement, follow these note-taking standards to help us stay on the same proverbial page.
+    - #TODO:NothingElseToCheck - If no parameters are checked (incomplete ontology or ambiguity).
+    - #NOCHECK:<param_name>    - If a parameter does not have a check (but at least one other parameter does).
+    - #TODO:<type_name>        - If a standard has not been defined yet for a type check (e.g. #TODO:URI).
+                                 Custom functions for such types may be found in the last section of NLG/checks.py.
+    - There are two 'Identity' NLG types, one a 'core_' and one a 'propbundle_'.
+      In Checks tables state which is required via 'core:Identity' or 'propbundle:Identity'.
+
+-----------------------------------------------------
+PACKAGE LAYOUT
+
+    NLG/core.py           core_<Type>                 NLG/checks.py        Checks tables, ValidationError
+    NLG/context.py        context_<Type>              NLG/predicates.py    PREDICATES, properties()
+    NLG/propbundle.py     propbundle_<Type>           NLG/constructors.py  Document.create(), NLG.batch
+    NLG/duck.py           duck_<Type>
+    NLG/sub.py            <kind>_sub_<Type>
+
+    The function modules are imported on first use of one of their names, e.g. NLG.core_Tool
+    imports NLG/core.py; 'from NLG import *' and NLG.load() import all of them.
+"""
+
+
+import importlib
+import sys
+
+import case
+
+from NLG.checks import (Missing, MISSING, VALUE_TYPES, OBJECT_KINDS, TYPE_PARENTS, ValidationError,
+                        Violation, Checks, column_values, check_column)
+from NLG.predicates import PREDICATES
+from NLG.constructors import Factory, FACTORIES, factories, create, BatchConstructors, batch
+
+
+#====================================================
+#-- LAZY LOADING
+#
+# The NLG functions and their Checks tables are split by category into modules that are
+# imported the first time one of their names is looked up on NLG (module __getattr__).
+# Python versions without module __getattr__ (before 3.7) import all of them up front.
+
+# Name prefix -> module, the children prefixes first.
+_MODULES = (
+    ('core_sub_',       'sub'),
+    ('context_sub_',    'sub'),
+    ('propbundle_sub_', 'sub'),
+    ('duck_sub_',       'sub'),
+    ('core_',           'core'),
+    ('context_',        'context'),
+    ('propbundle_',     'propbundle'),
+    ('duck_',           'duck'),
+)
+
+CATEGORIES = ('core', 'context', 'propbundle', 'duck', 'sub')
+
+
+def _category(name):
+    """Returns the module defining the NLG function or Checks table name (None if none does)."""
+    function = name[1:] if name.startswith('_') else name
+    for prefix, category in _MODULES:
+        if function.startswith(prefix):
+            return category
+    return None
+
+
+def load(*categories):
+    """
+    Imports NLG function modules and adds their names to NLG.
+
+    Args:
+        categories: Names from CATEGORIES; all of them if none are given.
+    """
+    namespace = globals()
+    for category in categories or CATEGORIES:
+        module = importlib.import_module('NLG.' + category)
+        namespace.update((name, value) for name, value in vars(module).items()
+                         if _category(name) is not None)
+
+
+def __getattr__(name):
+    if name == '__all__':
+        load()
+        return sorted(name for name in globals() if not name.startswith('_') and name not in CATEGORIES
+                      and name not in ('checks', 'predicates', 'constructors'))
+    category = _category(name)
+    if category is None:
+        raise AttributeError("module 'NLG' has no attribute '{0}'".format(name))
+    load(category)
+    try:
+        return globals()[name]
+    except KeyError:
+        raise AttributeError("module 'NLG' has no attribute '{0}'".format(name))
+
+
+if sys.version_info < (3, 7):
+    load()
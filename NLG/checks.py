@@ -0,0 +1,616 @@
+# NOTICE
+# 
+# This software was produced for the U.S. Government under
+# contract SB-1341-14-CQ-0010, and is subject to the Rights
+# in Data-General Clause 52.227-14, Alt. IV (DEC 2007)
+#
+# (c) 2018 The MITRE Corporation. All Rights Reserved.
+
+
+#====================================================
+# CASE NLG VERIFIER v0.1.0 - PARAMETER CHECKS
+
+"""The Checks tables of the NLG functions and the type checks of batch columns."""
+
+import array
+import case
+import collections
+import operator
+import datetime
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Shared with case.py so that unset parameters are dropped by case.Node.add().
+Missing = case.Missing
+MISSING = case.MISSING
+
+
+#====================================================
+#-- PARAMETER CHECKS
+#
+# The ontology constraints of an NLG function are listed in a Checks table above it,
+# one row per checked parameter:
+#
+#     (parameter, required, list, type)
+#
+#   required: The parameter must be supplied ('Exactly one', 'At least one').
+#   list:     The value must be a list or other iterable ('Any number of') whose items are of
+#             the type. Generators are checked while Node.add() consumes them.
+#   type:     One of VALUE_TYPES, '<kind>:<Type>' for an object created by the NLG
+#             (e.g. 'core:Action', 'duck:Hash', 'propbundle:Identity'), which also accepts
+#             objects whose type derives from it in TYPE_PARENTS, a bare '<kind>' for any
+#             object of that kind, or None to only check that it is supplied.
+#
+# Each table is compiled into a plain Python function the first time it is used.
+# Failures raise ValidationError, which is an AssertionError like the assert statements
+# the tables replace, but the checks also run under python -O.
+#
+# How much is checked follows the validation level of the Document (case.VALIDATION_LEVELS),
+# set with Document(validation=...) or the Document.validation_level() context manager.
+
+try:
+    _LONG = (int, long)
+except NameError:
+    _LONG = int
+
+VALUE_TYPES = {
+    'String': str,
+    'Integer': int,
+    'PositiveInteger': int,
+    'Long': _LONG,
+    'Bool': bool,
+    'Float': float,
+    'Datetime': datetime.datetime,
+}
+
+OBJECT_KINDS = {
+    'core': case.CoreObject,
+    'context': case.ContextObject,
+    'duck': case.DuckObject,
+    'propbundle': case.PropertyBundle,
+    'sub': case.SubObject,
+}
+
+
+# Direct parents of the classes of the CASE ontology (rdfs:subClassOf in case.ttl), so that
+# a check for a type also accepts objects of its subclasses, e.g. a ForensicAction where
+# an Action is expected. autogen-api.py writes the same table from its class tree.
+TYPE_PARENTS = {
+    'AFFImage':                     ('PropertyBundle',),
+    'Account':                      ('PropertyBundle',),
+    'AccountAuthentication':        ('PropertyBundle',),
+    'AccountType':                  ('Enumeration',),
+    'Action':                       ('UcoObject',),
+    'ActionLifecycle':              ('ArrayOfAction', 'UcoObject'),
+    'ActionReferences':             ('PropertyBundle',),
+    'ActionStatus':                 ('Enumeration',),
+    'AndroidPackage':               ('PropertyBundle',),
+    'Annotation':                   ('Assertion',),
+    'Application':                  ('PropertyBundle',),
+    'ApplicationAccount':           ('PropertyBundle',),
+    'ArchiveFile':                  ('PropertyBundle',),
+    'Assertion':                    ('UcoObject',),
+    'Attachment':                   ('PropertyBundle',),
+    'Attorney':                     ('BenevolentRole',),
+    'Audio':                        ('PropertyBundle',),
+    'Authorization':                ('PropertyBundle',),
+    'AuthorizationType':            ('Enumeration',),
+    'AutonomousSystem':             ('PropertyBundle',),
+    'BDEVolume':                    ('PropertyBundle',),
+    'BenevolentRole':               ('Role',),
+    'BirthInformation':             ('PropertyBundle',),
+    'BrowserBookmark':              ('PropertyBundle',),
+    'BrowserCookie':                ('PropertyBundle',),
+    'BrowserHistory':               ('PropertyBundle',),
+    'Bundle':                       ('UcoObject',),
+    'ByteOrder':                    ('Enumeration',),
+    'Calendar':                     ('PropertyBundle',),
+    'CalendarEntry':                ('PropertyBundle',),
+    'Compression':                  ('PropertyBundle',),
+    'CompressionMethod':            ('Enumeration',),
+    'ComputerSpecification':        ('PropertyBundle',),
+    'ConfigurationSetting':         ('SupportingClasses',),
+    'Contact':                      ('PropertyBundle',),
+    'ContentData':                  ('PropertyBundle',),
+    'CountriesOfResidence':         ('IdentityPropertyBundle',),
+    'DataRange':                    ('PropertyBundle',),
+    'DataType':                     ('Enumeration',),
+    'Device':                       ('PropertyBundle',),
+    'DeviceType':                   ('Enumeration',),
+    'DictionaryItem':               ('SupportingClasses',),
+    'DigitalAccount':               ('PropertyBundle',),
+    'Disk':                         ('PropertyBundle',),
+    'DiskPartition':                ('PropertyBundle',),
+    'DiskPartitionType':            ('Enumeration',),
+    'DiskType':                     ('Enumeration',),
+    'DomainName':                   ('SupportingClasses',),
+    'EWFImage':                     ('PropertyBundle',),
+    'EXIF':                         ('PropertyBundle',),
+    'EmailAccount':                 ('PropertyBundle',),
+    'EmailAddress':                 ('SupportingClasses',),
+    'EmailMessage':                 ('PropertyBundle',),
+    'Encoding':                     ('PropertyBundle',),
+    'EncodingMethod':               ('Enumeration',),
+    'Encryption':                   ('PropertyBundle',),
+    'EncryptionMethod':             ('Enumeration',),
+    'EncryptionMode':               ('Enumeration',),
+    'Error':                        ('PropertyBundle',),
+    'ErrorType':                    ('Enumeration',),
+    'Event':                        ('PropertyBundle',),
+    'Examiner':                     ('BenevolentRole',),
+    'ExtInode':                     ('PropertyBundle',),
+    'ExtractedFeatures':            ('PropertyBundle',),
+    'ExtractedString':              ('PropertyBundle',),
+    'FVDEEncryption':               ('PropertyBundle',),
+    'File':                         ('PropertyBundle',),
+    'FileMetadataMismatch':         ('PropertyBundle',),
+    'FileMismatchType':             ('Enumeration',),
+    'FilePath':                     ('SupportingClasses',),
+    'FilePermissions':              ('PropertyBundle',),
+    'FileSystem':                   ('PropertyBundle',),
+    'FileSystemType':               ('Enumeration',),
+    'ForensicAction':               ('Action',),
+    'Fragment':                     ('PropertyBundle',),
+    'GeoLocationEntry':             ('PropertyBundle',),
+    'GeoLocationLog':               ('PropertyBundle',),
+    'GeoLocationTrack':             ('PropertyBundle',),
+    'GlobalFlagType':               ('Enumeration',),
+    'HFSFileSystem':                ('PropertyBundle',),
+    'HTTPConnection':               ('PropertyBundle',),
+    'Hash':                         ('PropertyBundle',),
+    'HashMethod':                   ('Enumeration',),
+    'ICMPConnection':               ('PropertyBundle',),
+    'IOSPackage':                   ('PropertyBundle',),
+    'IPv4Address':                  ('SupportingClasses',),
+    'IPv6Address':                  ('SupportingClasses',),
+    'Identity':                     ('UcoObject',),
+    'IdentityPropertyBundle':       ('PropertyBundle',),
+    'Image':                        ('PropertyBundle',),
+    'ImageCompressionMethod':       ('Enumeration',),
+    'ImageType':                    ('Enumeration',),
+    'Investigation':                ('UcoObject',),
+    'Investigator':                 ('BenevolentRole',),
+    'LVMVolume':                    ('PropertyBundle',),
+    'Language':                     ('Enumeration',),
+    'LatLongCoordinates':           ('PropertyBundle',),
+    'LinuxPackage':                 ('PropertyBundle',),
+    'Location':                     ('UcoObject',),
+    'MACAddress':                   ('SupportingClasses',),
+    'MaliciousRole':                ('Role',),
+    'Memory':                       ('PropertyBundle',),
+    'Message':                      ('PropertyBundle',),
+    'MessageThread':                ('PropertyBundle',),
+    'MftRecord':                    ('PropertyBundle',),
+    'MimePartType':                 ('Enumeration',),
+    'MimeType':                     ('Enumeration',),
+    'Mutex':                        ('PropertyBundle',),
+    'NTFSFileSystem':               ('PropertyBundle',),
+    'NetworkConnection':            ('PropertyBundle',),
+    'NetworkLocation':              ('PropertyBundle',),
+    'NetworkPacket':                ('PropertyBundle',),
+    'NetworkRoute':                 ('PropertyBundle',),
+    'NetworkSocket':                ('PropertyBundle',),
+    'NetworkSubnet':                ('PropertyBundle',),
+    'NeutralRole':                  ('Role',),
+    'Occupation':                   ('IdentityPropertyBundle',),
+    'OperatingSystem':              ('PropertyBundle',),
+    'OrganizationDetails':          ('IdentityPropertyBundle',),
+    'PDFFile':                      ('PropertyBundle',),
+    'PEType':                       ('Enumeration',),
+    'Package':                      ('PropertyBundle',),
+    'PasswordType':                 ('Enumeration',),
+    'PathRelation':                 ('PropertyBundle',),
+    'PhoneAccount':                 ('PropertyBundle',),
+    'PhoneCall':                    ('PropertyBundle',),
+    'Process':                      ('PropertyBundle',),
+    'ProvenanceRecord':             ('UcoObject',),
+    'QCOWImage':                    ('PropertyBundle',),
+    'RasterPicture':                ('PropertyBundle',),
+    'ReceivedEvent':                ('SupportingClasses',),
+    'Relationship':                 ('UcoObject',),
+    'Role':                         ('UcoObject',),
+    'SMSMessage':                   ('PropertyBundle',),
+    'SQLiteBlob':                   ('PropertyBundle',),
+    'ServiceStatus':                ('Enumeration',),
+    'Servicetype':                  ('Enumeration',),
+    'SimpleAddress':                ('PropertyBundle',),
+    'SimpleName':                   ('PropertyBundle',),
+    'StartType':                    ('Enumeration',),
+    'Subject':                      ('MaliciousRole',),
+    'SymbolicLink':                 ('PropertyBundle',),
+    'System':                       ('PropertyBundle',),
+    'TCPConnection':                ('PropertyBundle',),
+    'Tool':                         ('UcoObject',),
+    'ToolArguments':                ('PropertyBundle',),
+    'ToolConfiguration':            ('PropertyBundle',),
+    'Trace':                        ('UcoObject',),
+    'UDPConnection':                ('PropertyBundle',),
+    'UNIXAccount':                  ('PropertyBundle',),
+    'UNIXNetworkRoute':             ('PropertyBundle',),
+    'UNIXProcess':                  ('PropertyBundle',),
+    'UNIXVolume':                   ('PropertyBundle',),
+    'URI':                          ('SupportingClasses',),
+    'UserAccount':                  ('PropertyBundle',),
+    'VShadow':                      ('PropertyBundle',),
+    'Victim':                       ('NeutralRole',),
+    'VisibilityType':               ('Enumeration',),
+    'Volume':                       ('PropertyBundle',),
+    'WHOIS':                        ('PropertyBundle',),
+    'WindowsAccount':               ('PropertyBundle',),
+    'WindowsActiveDirectoryAccount':('PropertyBundle',),
+    'WindowsComputerSpecification': ('PropertyBundle',),
+    'WindowsMutex':                 ('PropertyBundle',),
+    'WindowsNetworkRoute':          ('PropertyBundle',),
+    'WindowsPEBinaryFile':          ('PropertyBundle',),
+    'WindowsPEFileHeader':          ('SupportingClasses',),
+    'WindowsPEOptionalHeader':      ('SupportingClasses',),
+    'WindowsPESection':             ('SupportingClasses',),
+    'WindowsPackage':               ('PropertyBundle',),
+    'WindowsPrefetch':              ('PropertyBundle',),
+    'WindowsProcess':               ('PropertyBundle',),
+    'WindowsRegistryHive':          ('PropertyBundle',),
+    'WindowsRegistryKey':           ('PropertyBundle',),
+    'WindowsRegistryValue':         ('SupportingClasses',),
+    'WindowsService':               ('PropertyBundle',),
+    'WindowsSystem':                ('PropertyBundle',),
+    'WindowsVolume':                ('PropertyBundle',),
+    'X509Certificate':              ('PropertyBundle',),
+    'X509V3Extensions':             ('SupportingClasses',),
+}
+
+case.register_types(TYPE_PARENTS)
+
+
+class ValidationError(AssertionError):
+    """Raised when a parameter of an NLG function does not match the ontology."""
+
+    def __init__(self, function, parameter, message):
+        AssertionError.__init__(self, message)
+        self.function = function
+        self.parameter = parameter
+
+
+# Entry of Document.validation_errors, recorded by Document.validate().
+Violation = collections.namedtuple('Violation', ('function', 'parameter', 'uri'))
+
+
+class Checks(object):
+    """The parameter constraints of one NLG function (see PARAMETER CHECKS above)."""
+
+    def __init__(self, function, rows):
+        """
+        Args:
+            function: Name of the NLG function, used in error messages.
+            rows: (parameter, required, list, type) tuples.
+        """
+        self.function = function
+        self.rows = tuple(rows)
+        self._compiled = None
+        self._collect = None
+        self._item_tests = {}
+        # Rows of list parameters with an item type.
+        self._iterable_rows = tuple(index for index, row in enumerate(self.rows) if row[2] and row[3])
+        for name, required, many, value_type in self.rows:
+            if value_type is not None and _type_test(value_type, 'v', {}) is None:
+                raise ValueError('[{0}] unknown type {1!r} for {2}.'.format(function, value_type, name))
+
+
+    def check(self, document, *values):
+        """Checks the values of the parameters, given in table order, at the validation
+        level of document (a case.Document, or None for 'strict').
+        Raises ValidationError for the first one that does not match.
+
+        If the document defers validation, the values are handed to it instead and
+        checked later by collect().
+        """
+        # The compiled function replaces this method on the instance on first use.
+        if self._compiled is None:
+            self._compiled = self.check = self.compile()
+        return self._compiled(document, *values)
+
+
+    def collect(self, entries, errors, level='strict'):
+        """Checks many calls at once, appending a Violation to errors for every
+        parameter that does not match.
+
+        Args:
+            entries: (values, uri) pairs, values in table order and uri that of the created node.
+            errors: List to append to.
+            level: 'strict' or 'fast' (see case.VALIDATION_LEVELS).
+        """
+        if level == 'off':
+            return
+        if self._collect is None:
+            self._collect = self.compile(collect=True)
+        self._collect(entries, errors, level)
+
+
+    def item_test(self, index):
+        """Returns a function testing one item of the list parameter of row index."""
+        test = self._item_tests.get(index)
+        if test is None:
+            test = self._item_tests[index] = _item_test(self.rows[index][3])
+        return test
+
+
+    def items(self, values, index):
+        """Checks the items of values, an iterable other than a list given for row index.
+        array.array and NumPy arrays are checked by their type code or dtype (see
+        check_column()); one-shot iterables (generators) are left to check_later()."""
+        if isinstance(values, _COLUMNS):
+            if not check_column(self.rows[index][3], values, True):
+                self.fail(index)
+        elif iter(values) is not values and not all(map(self.item_test(index), values)):
+            self.fail(index)
+
+
+    def check_later(self, values, index):
+        """Has Node.add() check the items of values, a one-shot iterable given for row
+        index, as it consumes them. Only called once every other check of the call has
+        passed, so that the case.check_items() entry is always consumed."""
+        case.check_items(values, self.item_test(index), lambda node: self.fail(index))
+
+
+    def items_ok(self, values, index):
+        """items() for collect(): True unless values can be iterated again and has a bad item
+        (one-shot iterables were checked by defer() as they were consumed)."""
+        if isinstance(values, _COLUMNS):
+            return check_column(self.rows[index][3], values, True)
+        return iter(values) is values or all(map(self.item_test(index), values))
+
+
+    def defer(self, document, values):
+        """Hands the values of an NLG call to document.defer(). One-shot iterables cannot be
+        checked later, so their items are checked as they are added instead, recording a
+        Violation on failure."""
+        if document.validation == 'strict':
+            for index in self._iterable_rows:
+                value = values[index]
+                if not isinstance(value, list) and case.is_multiple(value) and iter(value) is value:
+                    case.check_items(value, self.item_test(index), self._record(document, index))
+        document.defer(self, values)
+
+
+    def _record(self, document, index):
+        def record(node):
+            document.validation_errors.append(Violation(self.function, self.rows[index][0], node.uri))
+        return record
+
+
+    def message(self, index, missing):
+        """Error message for row index (missing: the value was not supplied)."""
+        name, required, many, value_type = self.rows[index]
+        if missing:
+            return '[{0}] {1} is required.'.format(self.function, name)
+        type_name = (value_type or 'any type').split(':')[-1]
+        if type_name in OBJECT_KINDS:
+            type_name = OBJECT_KINDS[type_name].__name__
+        if many:
+            type_name = 'List of ' + type_name
+        return '[{0}] {1} must be of type {2}.'.format(self.function, name, type_name)
+
+
+    def fail(self, index, missing=False):
+        raise ValidationError(self.function, self.rows[index][0], self.message(index, missing))
+
+
+    def compile(self, collect=False):
+        """Returns a function checking the rows with straight-line code.
+
+        By default its first argument is the Document (or None), whose validation level
+        selects which checks run; it raises on the first failure. With collect=True it
+        loops over the entries given to collect() and records every failure instead.
+        Either way the required parameters are checked first, which is all 'fast' does;
+        'strict' goes on to the type of each parameter and then the items of list
+        parameters. Lists are checked inline, other iterables by items() and items_ok().
+        One-shot iterables are handed to check_later() after everything else has passed.
+        """
+        namespace = {'_M': MISSING, '_Missing': Missing, '_fail': self.fail, '_checks': self,
+                     '_Violation': Violation, '_is_multiple': case.is_multiple}
+        names = [row[0] for row in self.rows]
+        if collect:
+            lines = ['def collect(_entries, _errors, _level):',
+                     '    _deep = _level == {0!r}'.format('strict'),
+                     '    for ({0},), _uri in _entries:'.format(', '.join(names))]
+            indent = '        '
+            fail = '_errors.append(_Violation({0!r}, {{0!r}}, _uri))'.format(self.function)
+            stop = '; break'
+        else:
+            lines = ['def check(_document, {0}):'.format(', '.join(names)),
+                     "    if _document is None: _level = 'strict'",
+                     '    else:',
+                     '        _level = _document.validation',
+                     "        if _level == 'off': return None",
+                     '        if _document.deferred is not None:',
+                     '            return _checks.defer(_document, ({0},))'.format(', '.join(names))]
+            indent = '    '
+            fail = '_fail({1}{2})'
+            stop = ''
+        types = []
+        items = []
+        later = []
+        for index, (name, required, many, value_type) in enumerate(self.rows):
+            failed = fail.format(name, index, '')
+            if required:
+                lines.append(indent + 'if {0} is _M or isinstance({0}, _Missing): {1}'.format(
+                    name, fail.format(name, index, ', True')))
+            if value_type is None and not many:
+                continue
+            if many:
+                test = 'isinstance({0}, list) or _is_multiple({0})'.format(name)
+                if value_type is not None:
+                    item_test = _type_test(value_type, '_i', namespace)
+                    items.append(indent + '    if isinstance({0}, list):'.format(name))
+                    tag = _type_tag(value_type)
+                    if tag is None:
+                        items.append(indent + '        for _i in {0}:'.format(name))
+                        items.append(indent + '            if not ({0}): {1}{2}'.format(item_test, failed, stop))
+                    else:
+                        # Nodes of the type share one interned tag; the full test only runs
+                        # for other items (such as nodes of a subclass). Items without a tag
+                        # are not nodes.
+                        namespace['_tag{0}'.format(index)] = tag
+                        items.append(indent + '        try:')
+                        items.append(indent + '            for _i in {0}:'.format(name))
+                        items.append(indent + '                if _i.type_tag is not _tag{0} and not ({1}): {2}{3}'.format(
+                            index, item_test, failed, stop))
+                        items.append(indent + '        except AttributeError: {0}'.format(failed))
+                    # Other iterables: see items() and items_ok(). collect() has recorded values that
+                    # are not iterable (or are strings) above, and goes on to the next parameter.
+                    if collect:
+                        items.append(indent + '    elif _is_multiple({0}) and not _checks.items_ok({0}, {1}): {2}'.format(
+                            name, index, failed))
+                    else:
+                        supplied = '{0} is not _M and not isinstance({0}, _Missing)'.format(name)
+                        items.append(indent + '    elif {0}: _checks.items({1}, {2})'.format(supplied, name, index))
+                        later.append(indent + 'if {0} and not isinstance({1}, list) and iter({1}) is {1}: '
+                                     '_checks.check_later({1}, {2})'.format(supplied, name, index))
+            else:
+                test = _type_test(value_type, name, namespace)
+            if required and not collect:
+                # Supplied, or check() would have raised above.
+                types.append(indent + 'if not ({0}): {1}'.format(test, failed))
+            else:
+                # Type first: Missing is only looked at when the test fails.
+                types.append(indent + 'if {0} is not _M and not ({1}) and not isinstance({0}, _Missing): {2}'.format(
+                    name, test, failed))
+        if types:
+            if collect:
+                lines.append(indent + 'if _deep:')
+                lines.extend('    ' + line for line in types)
+            else:
+                lines.append(indent + "if _level == 'fast': return None")
+                lines.extend(types)
+                # Undo the extra indentation of the items, which only collect() needs.
+                items = [line[4:] for line in items]
+            lines.extend(items)
+            lines.extend(later)
+        if not collect:
+            lines.append('    return None')
+        exec(compile('\n'.join(lines), '<checks for {0}>'.format(self.function), 'exec'), namespace)
+        return namespace['collect' if collect else 'check']
+
+
+def _type_test(value_type, name, namespace):
+    """Returns a Python expression testing the variable name against value_type,
+    adding the classes it needs to namespace (None if value_type is unknown)."""
+    kind, _, type_name = value_type.partition(':')
+    if kind in OBJECT_KINDS:
+        namespace['_' + kind] = OBJECT_KINDS[kind]
+        if not type_name:
+            return 'isinstance({0}, _{1})'.format(name, kind)
+        # An object of the type, or a node of any kind whose type derives from it.
+        bit = '_bit{0}'.format(case.type_id(type_name))
+        namespace['_Node'] = case.Node
+        namespace[bit] = case.type_bit(type_name)
+        return 'isinstance({0}, _{1}) and {0}.type == {2!r} or isinstance({0}, _Node) and {0}.type_tag.ancestors & {3}'.format(
+            name, kind, type_name, bit)
+    if value_type in VALUE_TYPES:
+        namespace['_' + value_type] = VALUE_TYPES[value_type]
+        if value_type == 'PositiveInteger':
+            return 'isinstance({0}, _{1}) and {0} > 0'.format(name, value_type)
+        return 'isinstance({0}, _{1})'.format(name, value_type)
+    return None
+
+
+def _type_tag(value_type):
+    """Returns the case.type_tag() of the nodes the NLG creates for an object type
+    such as 'core:Action' (None for bare kinds and value types)."""
+    kind, _, type_name = value_type.partition(':')
+    if kind in OBJECT_KINDS and type_name:
+        return case.type_tag(OBJECT_KINDS[kind], type_name)
+    return None
+
+
+# Homogeneous arrays, whose item type is known without looking at the items.
+_COLUMNS = (array.array,) if numpy is None else (array.array, numpy.ndarray)
+
+# array.array type codes and NumPy dtype kinds holding values of a VALUE_TYPES type.
+_INTEGER_CODES = frozenset('bBhHiIlLqQ')
+_ARRAY_CODES = {
+    'Integer': _INTEGER_CODES,
+    'PositiveInteger': _INTEGER_CODES,
+    'Long': _INTEGER_CODES,
+    'Float': frozenset('fd'),
+}
+_NUMPY_KINDS = {
+    'Integer': 'iu',
+    'PositiveInteger': 'iu',
+    'Long': 'iu',
+    'Float': 'f',
+    'Bool': 'b',
+    'String': 'U',
+}
+
+
+def _item_test(value_type):
+    """Returns a function testing one value against value_type."""
+    namespace = {}
+    return eval('lambda v: ' + _type_test(value_type, 'v', namespace), namespace)
+
+
+def column_values(column):
+    """Returns column as a sequence of Python objects (array.array and NumPy arrays are converted)."""
+    if isinstance(column, array.array) or (numpy is not None and isinstance(column, numpy.ndarray)):
+        return column.tolist()
+    return column
+
+
+def check_column(value_type, column, required=False):
+    """
+    Checks that every item of column is of value_type without a Python-level loop.
+
+    array.array and NumPy columns are checked by their type code or dtype. Other
+    sequences are checked by the set of their item classes (and, for NLG types, the
+    set of their case.TypeTag tags), which map() and set() build in C.
+
+    Args:
+        value_type: A type of a Checks row (see PARAMETER CHECKS).
+        column: Sequence of values.
+        required: If False, None and MISSING items are accepted.
+
+    Returns:
+        True if all items match.
+    """
+    if isinstance(column, array.array):
+        if column.typecode not in _ARRAY_CODES.get(value_type, ()):
+            return False
+        return value_type != 'PositiveInteger' or not column or min(column) > 0
+    if numpy is not None and isinstance(column, numpy.ndarray):
+        if column.dtype.kind != 'O':
+            if column.dtype.kind not in _NUMPY_KINDS.get(value_type, ''):
+                return False
+            return value_type != 'PositiveInteger' or not column.size or column.min() > 0
+        column = column.tolist()
+    classes = set(map(type, column))
+    absent = set(cls for cls in classes if cls is type(None) or issubclass(cls, Missing))
+    if absent:
+        if required:
+            return False
+        classes -= absent
+        column = [value for value in column if value is not None and not isinstance(value, Missing)]
+    kind, _, type_name = value_type.partition(':')
+    expected = OBJECT_KINDS[kind] if kind in OBJECT_KINDS else VALUE_TYPES[value_type]
+    if type_name:
+        # Objects of the type, or nodes of any kind whose type derives from it.
+        if not all(issubclass(cls, case.Node) for cls in classes):
+            return False
+        bit = case.type_bit(type_name)
+        return all(issubclass(tag.cls, expected) and tag.type == type_name or tag.ancestors & bit
+                   for tag in set(map(_TYPE_TAG, column)))
+    if not all(issubclass(cls, expected) for cls in classes):
+        return False
+    if value_type == 'PositiveInteger':
+        return not column or min(column) > 0
+    return True
+
+_TYPE_TAG = operator.attrgetter('type_tag')
+
+
+#====================================================
+#-- SPECIAL TYPE-CHECKING FUNCTIONS
+
+    # URI, HexBinary, CyberAction, StructureText
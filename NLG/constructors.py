@@ -0,0 +1,265 @@
+# NOTICE
+# 
+# This software was produced for the U.S. Government under
+# contract SB-1341-14-CQ-0010, and is subject to the Rights
+# in Data-General Clause 52.227-14, Alt. IV (DEC 2007)
+#
+# (c) 2018 The MITRE Corporation. All Rights Reserved.
+
+
+#====================================================
+# CASE NLG VERIFIER v0.1.0 - CONSTRUCTORS
+
+"""Document.create() and NLG.batch: the NLG functions reached by name at run time."""
+
+import case
+import collections
+
+import NLG
+from NLG.checks import MISSING, Missing, ValidationError, check_column, column_values, _item_test, _COLUMNS
+
+
+#====================================================
+#-- GENERIC FACTORY
+#
+# Document.create(kind, type, **parameters) creates an object from names that are only
+# known at run time, such as type names read from a CSV file:
+#
+#     doc.create('propbundle', 'File', uco_object=trace, filename=['report.pdf'])
+#
+# It is backed by FACTORIES, filled on first use of each type by recording the create
+# call its NLG function makes, so the parameters are checked and named exactly as by
+# the function.
+
+# An NLG function as data:
+#   function:   Name of the NLG function.
+#   rdf_type:   Type of the created object.
+#   cls:        The case class of the created object.
+#   checks:     The function's Checks table (None if it checks nothing).
+#   parameters: Names of the checked parameters, in table order.
+#   predicates: Parameter name -> tuple of the properties its value is added as
+#               (empty for parameters the function does not add, such as uco_object).
+Factory = collections.namedtuple('Factory', ('function', 'rdf_type', 'cls', 'checks', 'parameters', 'predicates'))
+
+# (kind, type) -> Factory, e.g. FACTORIES['propbundle', 'File']. See factories().
+FACTORIES = {}
+
+_KINDS = ('core_sub', 'core', 'context', 'duck_sub', 'duck', 'propbundle_sub', 'propbundle')
+
+
+class _Parameter(object):
+    """Stands in for the value of a parameter while recording an NLG function."""
+
+    __slots__ = ('name',)
+
+    def __init__(self, name):
+        self.name = name
+
+
+class _Recorder(object):
+    """Stands in for the Document (and for the object a PropertyBundle is added to)
+    while recording the create call of an NLG function."""
+
+    validation = 'off'
+    deferred = None
+
+    def __init__(self):
+        self.document = self
+        self.call = None
+
+    def _record(cls):
+        def create(self, _type=None, **kwargs):
+            self.call = (cls, _type, kwargs)
+        return create
+
+    create_CoreObject = _record(case.CoreObject)
+    create_ContextObject = _record(case.ContextObject)
+    create_DuckObject = _record(case.DuckObject)
+    create_SubObject = _record(case.SubObject)
+    create_PropertyBundle = _record(case.PropertyBundle)
+    del _record
+
+
+def _factory(kind, type_name):
+    """Records the NLG function <kind>_<type_name> into FACTORIES and returns its Factory."""
+    name = '{0}_{1}'.format(kind, type_name)
+    function = getattr(NLG, name)
+    code = function.__code__
+    names = code.co_varnames[:code.co_argcount]
+    recorder = _Recorder()
+    # The first parameter is the Document, or the object a PropertyBundle is added to.
+    function(recorder, **dict((n, _Parameter(n)) for n in names[1:]))
+    cls, rdf_type, kwargs = recorder.call
+    predicates = dict((n, ()) for n in names)
+    for predicate, value in sorted(kwargs.items()):
+        predicates[value.name] += (predicate,)
+    checks = getattr(NLG, '_' + name, None)
+    factory = FACTORIES[kind, type_name] = Factory(
+        name, rdf_type, cls, checks, tuple(row[0] for row in checks.rows) if checks else (), predicates)
+    return factory
+
+
+def factories():
+    """Returns FACTORIES after recording every NLG function (create() only records the ones it uses)."""
+    NLG.load()
+    for name in list(vars(NLG)):
+        kind = next((kind for kind in _KINDS if name.startswith(kind + '_')), None)
+        if kind is not None and (kind, name[len(kind) + 1:]) not in FACTORIES:
+            _factory(kind, name[len(kind) + 1:])
+    return FACTORIES
+
+
+def create(document, kind, type_name, parameters):
+    """
+    Creates an object the way the NLG function <kind>_<type_name> does (see Document.create()).
+
+    Args:
+        document: The Document to create the object in.
+        kind: Prefix of the NLG function ('core', 'core_sub', 'context', 'duck', 'duck_sub',
+              'propbundle' or 'propbundle_sub').
+        type_name: The rest of its name, e.g. 'File'.
+        parameters: Dictionary of its parameters except the first; propbundle types take
+                    the object to add the bundle to as uco_object. Other names are added as
+                    properties, like the **kwargs of the NLG functions.
+
+    Returns:
+        The created object.
+    """
+    factory = FACTORIES.get((kind, type_name))
+    if factory is None:
+        if kind not in _KINDS or not callable(getattr(NLG, '{0}_{1}'.format(kind, type_name), None)):
+            raise ValueError('No NLG function {0}_{1}.'.format(kind, type_name))
+        factory = _factory(kind, type_name)
+    if factory.checks is not None:
+        owner = parameters.get('uco_object') if factory.cls is case.PropertyBundle else document
+        factory.checks.check(getattr(owner, 'document', document),
+                             *[parameters.get(name, MISSING) for name in factory.parameters])
+    predicates = factory.predicates
+    properties = {}
+    for name, value in parameters.items():
+        for predicate in predicates.get(name, (name,)):
+            properties[predicate] = value
+    if factory.cls is case.PropertyBundle:
+        return parameters['uco_object'].create_PropertyBundle(factory.rdf_type, **properties)
+    return document._create(factory.cls, factory.rdf_type, properties)
+
+
+#====================================================
+#-- BATCH CONSTRUCTORS
+
+class BatchConstructors(object):
+    """
+    Columnar versions of the NLG functions, reached as NLG.batch.<function name>.
+
+    Each takes the same parameters as the NLG function, but every parameter except
+    uco_document is a column: a list, tuple, array.array or NumPy array with one
+    value per object to create (None or MISSING to leave a parameter out for that
+    object). For 'Any number of' parameters each value is itself a list or other
+    iterable, as for the NLG functions; one-shot iterables such as generators are read
+    into lists, so that they can be checked before anything is created.
+
+        files = NLG.batch.propbundle_File(traces, filename=[[name] for name in names],
+                                          size_in_bytes=array.array('q', sizes))
+
+    Every column is checked once against the function's Checks table (see check_column())
+    before anything is created; the objects are then created in one Document.batch()
+    with per-call validation off. Returns the list of created objects.
+    """
+
+    def __getattr__(self, name):
+        if name.startswith('_') or name.split('_')[0] not in ('core', 'context', 'propbundle', 'duck'):
+            raise AttributeError(name)
+        function = getattr(NLG, name, None)
+        if not callable(function):
+            raise AttributeError(name)
+        constructor = _batch_constructor(function, getattr(NLG, '_' + name, None))
+        setattr(self, name, constructor)
+        return constructor
+
+
+def _batch_constructor(function, checks):
+    code = function.__code__
+    positional = code.co_varnames[:code.co_argcount]
+    rows = checks.rows if checks is not None else ()
+
+    def constructor(*args, **kwargs):
+        columns = dict(zip(positional, args))
+        columns.update(kwargs)
+        document = columns.pop('uco_document', None)
+        lengths = set(len(column) for column in columns.values())
+        if len(lengths) > 1:
+            raise ValueError('[{0}] columns have different lengths: {1}'.format(
+                function.__name__, sorted(lengths)))
+        count = lengths.pop() if lengths else 0
+
+        for index, (name, required, many, value_type) in enumerate(rows):
+            if name not in columns:
+                if required and count:
+                    checks.fail(index, True)
+                continue
+            if many:
+                columns[name] = _reiterable(columns[name])
+            column = columns[name]
+            if not _check_batch_column(required, many, value_type, column):
+                # Finds and reports the first bad value.
+                test = _item_test(value_type) if value_type else None
+                for row, value in enumerate(column_values(column)):
+                    _check_batch_value(checks, index, row, required, many, test, value)
+
+        names = list(columns)
+        values = [column_values(columns[name]) for name in names]
+        if document is None and columns:
+            # propbundle_ functions: the document of the objects the bundles are added to.
+            owners = columns[positional[0]]
+            document = getattr(owners[0], 'document', None) if len(owners) else None
+            if document is None:
+                return [function(**dict(zip(names, row))) for row in zip(*values)]
+            with document.batch(), document.validation_level('off'):
+                return [function(**dict(zip(names, row))) for row in zip(*values)]
+        with document.batch(), document.validation_level('off'):
+            return [function(document, **dict(zip(names, row))) for row in zip(*values)]
+
+    constructor.__name__ = function.__name__
+    constructor.__doc__ = function.__doc__
+    return constructor
+
+
+def _reiterable(column):
+    """Returns column with its one-shot iterables (such as generators) read into lists."""
+    if isinstance(column, _COLUMNS):
+        return column
+    return [list(value) if case.is_multiple(value) and iter(value) is value else value for value in column]
+
+
+def _check_batch_column(required, many, value_type, column):
+    """True if the whole column passes, checked with check_column()."""
+    if not many:
+        if value_type is not None:
+            return check_column(value_type, column, required)
+        return not required or not any(value is None or isinstance(value, Missing) for value in column)
+    for value in column:
+        if value is None or isinstance(value, Missing):
+            if required:
+                return False
+        elif not case.is_multiple(value) or (value_type and not check_column(value_type, value, True)):
+            return False
+    return True
+
+
+def _check_batch_value(checks, index, row, required, many, test, value):
+    """Raises ValidationError if value, the row-th of its column, does not match."""
+    if value is None or isinstance(value, Missing):
+        if required:
+            raise ValidationError(checks.function, checks.rows[index][0],
+                                  '{0} (row {1})'.format(checks.message(index, True), row))
+        return
+    if many:
+        valid = case.is_multiple(value) and (test is None or all(map(test, column_values(value))))
+    else:
+        valid = test is None or test(value)
+    if not valid:
+        raise ValidationError(checks.function, checks.rows[index][0],
+                              '{0} (row {1})'.format(checks.message(index, False), row))
+
+
+batch = BatchConstructors()
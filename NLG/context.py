@@ -0,0 +1,86 @@
+# NOTICE
+# 
+# This software was produced for the U.S. Government under
+# contract SB-1341-14-CQ-0010, and is subject to the Rights
+# in Data-General Clause 52.227-14, Alt. IV (DEC 2007)
+#
+# (c) 2018 The MITRE Corporation. All Rights Reserved.
+
+#====================================================
+# CASE NLG VERIFIER v0.1.0 - CONTEXT
+
+"""NLG functions creating ContextObjects (context_<Type>)."""
+
+from NLG import predicates
+from NLG.checks import Checks, MISSING
+from NLG.predicates import properties
+
+
+#====================================================
+#-- CONTEXT IN ALPHABETICAL ORDER
+
+_context_Grouping = Checks('context_Grouping', (
+    ('context_strings', True,  True,  'String'),
+))
+
+def context_Grouping(uco_document, context_strings=MISSING, **kwargs):
+    '''
+    :param Context: At least one value of type String.
+    :return: A ContextObject object.
+    '''
+
+    _context_Grouping.check(uco_document, context_strings)
+
+    return uco_document.create_ContextObject('Grouping', **properties(kwargs,
+                                             context_strings=context_strings))
+
+
+_context_Investigation = Checks('context_Investigation', (
+    ('investigation_form',   True,  False, 'core:ControlledVocabulary'),
+    ('investigation_status', False, False, 'core:ControlledVocabulary'),
+    ('start_time',           False, False, 'Datetime'),
+    ('end_time',             False, False, 'Datetime'),
+    ('focus',                False, True,  'String'),
+    ('object_refs',          False, True,  'core'),
+))
+
+def context_Investigation(uco_document, investigation_form=MISSING, investigation_status=MISSING,
+                          start_time=MISSING, end_time=MISSING, focus=MISSING, object_refs=MISSING, **kwargs):
+    '''
+    :param InvestigationForm: Exactly one occurrence of type ControlledVocabulary.
+    :param InvestigationStatus: At most one occurrence of type ControlledVocabulary.
+    :param StartTime: At most one value of type Datetime.
+    :param EndTime: At most one value of type Datetime.
+    :param Focus: Any number of values of type String.
+    :param ObjectRefs: Any number of occurrences of type CoreObject.
+    :return: A ContextObject object.
+    '''
+
+    _context_Investigation.check(uco_document, investigation_form, investigation_status, start_time,
+                                 end_time, focus, object_refs)
+
+    return uco_document.create_ContextObject('Investigation', **properties(kwargs,
+                                             investigation_form=investigation_form,
+                                             investigation_status=investigation_status, start_time=start_time,
+                                             end_time=end_time, focus=focus, object_refs=object_refs))
+
+
+_context_ProvenanceRecord = Checks('context_ProvenanceRecord', (
+    ('exhibit_number', False, False, 'String'),
+    ('object_refs',    False, True,  'core'),
+))
+
+def context_ProvenanceRecord(uco_document, exhibit_number=MISSING, object_refs=MISSING, **kwargs):
+    '''
+    :param ExhibitNumber: At most one value of type String.
+    :param ObjectRefs: Any number of occurrences of type CoreObject.
+    :return: A ContextObject object.
+    '''
+
+    _context_ProvenanceRecord.check(uco_document, exhibit_number, object_refs)
+
+    return uco_document.create_ContextObject('ProvenanceRecord', **properties(kwargs,
+                                             exhibit_number=exhibit_number, object_refs=object_refs))
+
+
+predicates.register(globals())
@@ -0,0 +1,215 @@
+# NOTICE
+# 
+# This software was produced for the U.S. Government under
+# contract SB-1341-14-CQ-0010, and is subject to the Rights
+# in Data-General Clause 52.227-14, Alt. IV (DEC 2007)
+#
+# (c) 2018 The MITRE Corporation. All Rights Reserved.
+
+#====================================================
+# CASE NLG VERIFIER v0.1.0 - CORE
+
+"""NLG functions creating CoreObjects (core_<Type>)."""
+
+from NLG import predicates
+from NLG.checks import Checks, MISSING
+from NLG.predicates import properties
+
+
+#====================================================
+#-- CORE IN ALPHABETICAL ORDER
+
+_core_Action = Checks('core_Action', (
+    ('action_status',  False, False, 'core:ControlledVocabulary'),
+    ('start_time',     False, False, 'Datetime'),
+    ('end_time',       False, False, 'Datetime'),
+    ('action_count',   False, False, 'PositiveInteger'),
+    ('subaction_refs', False, True,  'core:Action'),
+))
+
+def core_Action(uco_document, action_status=MISSING, start_time=MISSING, end_time=MISSING, errors=MISSING,
+                action_count=MISSING, subaction_refs=MISSING, **kwargs):
+    '''
+    :param ActionStatus: At most one occurrence of type ControlledVocabulary.
+    :param StartTime: At most one value of type Datetime.
+    :param EndTime: At most one value of type Datetime.
+    :param Errors: Any number of values of any type.
+    :param ActionCount: At most one value of type PositiveInteger.
+    :param SubactionRefs: Any number of occurrences of type Action.
+    :return: A CoreObject object.
+    '''
+
+    #NOCHECK:errors
+    _core_Action.check(uco_document, action_status, start_time, end_time, action_count, subaction_refs)
+
+    return uco_document.create_CoreObject('Action', **properties(kwargs, action_status=action_status,
+                                          start_time=start_time, end_time=end_time, errors=errors,
+                                          action_count=action_count, subaction_refs=subaction_refs))
+
+
+def core_Assertion(uco_document, **kwargs):
+    '''
+    :return: A CoreObject object.
+    '''
+
+    #TODO:NothingElseToCheck
+
+    return uco_document.create_CoreObject('Assertion', **kwargs)
+
+
+def core_Bundle(uco_document, **kwargs):
+    '''
+    :return: A CoreObject object.
+    '''
+
+    #TODO:NothingElseToCheck
+
+    return uco_document.create_CoreObject('Bundle', **kwargs)
+
+
+_core_ControlledVocabulary = Checks('core_ControlledVocabulary', (
+    ('value',                        True,  False, 'String'),
+    ('constraining_vocabulary_name', False, False, 'String'),
+))
+
+def core_ControlledVocabulary(uco_document, value=MISSING, constraining_vocabulary_name=MISSING,
+                              constraining_vocabulary_ref=MISSING, **kwargs):
+    '''
+    :param Value: Exactly one value of type String.
+    :param ConstrainingVocabularyName: At most one value of type String.
+    :param ConstrainingVocabularyReference: At most one value of type URI.
+    :return: A CoreObject object.
+    '''
+
+    #TODO:URI
+    _core_ControlledVocabulary.check(uco_document, value, constraining_vocabulary_name)
+
+    return uco_document.create_CoreObject('ControlledVocabulary', **properties(kwargs, value=value,
+                                          constraining_vocabulary_name=constraining_vocabulary_name,
+                                          constraining_vocabulary_ref=constraining_vocabulary_ref))
+
+
+def core_Identity(uco_document, **kwargs):
+    '''
+    :return: A CoreObject object.
+    '''
+
+    #TODO:NothingElseToCheck
+
+    return uco_document.create_CoreObject('Identity', **kwargs)
+
+
+def core_Location(uco_document, **kwargs):
+    '''
+    :return: A CoreObject object.
+    '''
+
+    #TODO:NothingElseToCheck
+
+    return uco_document.create_CoreObject('Location', **kwargs)
+
+
+_core_MarkingDefinition = Checks('core_MarkingDefinition', (
+    ('definition_type', True,  False, 'String'),
+    ('definition',      False, True,  'duck:MarkingModel'),
+))
+
+def core_MarkingDefinition(uco_document, definition_type=MISSING, definition=MISSING, **kwargs):
+    '''
+    :param DefinitionType: Exactly one value of type String.
+    :param Definition: Any number of occurrences of type MarkingModel.
+    :return: A CoreObject object.
+    '''
+
+    _core_MarkingDefinition.check(uco_document, definition_type, definition)
+
+    return uco_document.create_CoreObject('MarkingDefinition', **properties(kwargs,
+                                          definition_type=definition_type, definition=definition))
+
+
+_core_Relationship = Checks('core_Relationship', (
+    ('is_directional',       True,  False, 'Bool'),
+    ('target_ref',           True,  False, 'core'),
+    ('source_ref',           True,  True,  'core'),
+    ('start_time',           False, True,  'Datetime'),
+    ('end_time',             False, True,  'Datetime'),
+    ('kind_of_relationship', False, False, 'core:ControlledVocabulary'),
+))
+
+def core_Relationship(uco_document, is_directional=MISSING, target_ref=MISSING, source_ref=MISSING,
+                      start_time=MISSING, end_time=MISSING, kind_of_relationship=MISSING, **kwargs):
+    '''
+    :param IsDirectional: Exactly one value of type Bool.
+    :param TargetRef: Exactly one ocurrence of type CoreObject.
+    :param SourceRef: At least one ocurrence of type CoreObject.
+    :param StartTime: Any number of values of type Datetime.
+    :param EndTime: Any number of values of Datetime.
+    :param KindOfRelationship: At most one occurrence of type ControlledVocabulary.
+    :return: A CoreObject object.
+    '''
+
+    _core_Relationship.check(uco_document, is_directional, target_ref, source_ref, start_time, end_time,
+                             kind_of_relationship)
+
+    return uco_document.create_CoreObject('Relationship', **properties(kwargs, is_directional=is_directional,
+                                          target_ref=target_ref, source_ref=source_ref, start_time=start_time,
+                                          end_time=end_time, kind_of_relationship=kind_of_relationship))
+
+
+def core_Role(uco_document, **kwargs):
+    '''
+    :return: A CoreObject object.
+    '''
+
+    #TODO:NothingElseToCheck
+
+    return uco_document.create_CoreObject('Role', **kwargs)
+
+
+_core_Tool = Checks('core_Tool', (
+    ('name',         False, False, 'String'),
+    ('version',      False, False, 'String'),
+    ('tool_type',    False, False, 'String'),
+    ('service_pack', False, False, 'String'),
+    ('creator',      False, False, 'String'),
+))
+
+def core_Tool(uco_document, name=MISSING, version=MISSING, tool_type=MISSING, service_pack=MISSING,
+              creator=MISSING, references=MISSING, **kwargs):
+    '''
+    :param Name: At most one value of type String.
+    :param Version: At most one value of type String.
+    :param ToolType: At most one value of type String.
+    :param ServicePack: At most one value of type String.
+    :param Creator: At most one value of type String.
+    :param References: Any number of values of URI.
+    :return: A CoreObject object.
+    '''
+
+    #TODO:URI
+    #check for list and then URI type
+    _core_Tool.check(uco_document, name, version, tool_type, service_pack, creator)
+
+    return uco_document.create_CoreObject('Tool', **properties(kwargs, name=name, version=version,
+                                          tool_type=tool_type, service_pack=service_pack, creator=creator,
+                                          references=references))
+
+
+_core_Trace = Checks('core_Trace', (
+    ('has_changed', True,  False, 'Bool'),
+    ('state',       False, False, 'core:ControlledVocabulary'),
+))
+
+def core_Trace(uco_document, has_changed=MISSING, state=MISSING, **kwargs):
+    '''
+    :param HasChanged: Exactly one value of type Bool.
+    :param State: At most one occurrence of type ControlledVocabulary.
+    :return: A CoreObject object.
+    '''
+
+    _core_Trace.check(uco_document, has_changed, state)
+
+    return uco_document.create_CoreObject('Trace', **properties(kwargs, has_changed=has_changed, state=state))
+
+
+predicates.register(globals())
@@ -0,0 +1,819 @@
+# NOTICE
+# 
+# This software was produced for the U.S. Government under
+# contract SB-1341-14-CQ-0010, and is subject to the Rights
+# in Data-General Clause 52.227-14, Alt. IV (DEC 2007)
+#
+# (c) 2018 The MITRE Corporation. All Rights Reserved.
+
+#====================================================
+# CASE NLG VERIFIER v0.1.0 - DUCK
+
+"""NLG functions creating DuckObjects (duck_<Type>)."""
+
+from NLG import predicates
+from NLG.checks import Checks, MISSING
+from NLG.predicates import properties
+
+
+#====================================================
+#-- DUCK IN ALPHABETICAL ORDER
+
+_duck_AlternateDataStream = Checks('duck_AlternateDataStream', (
+    ('name',   True,  False, 'String'),
+    ('hashes', False, False, 'duck:AlternateDataStream'),
+    ('size',   False, False, 'Integer'),
+))
+
+def duck_AlternateDataStream(uco_document, name=MISSING, hashes=MISSING, size=MISSING, **kwargs):
+    '''
+    :param Name: Exactly one value of type String.
+    :param Hashes: At most one occurrence of type ArrayOfHash.
+    :param Size: At most one value of type Integer.
+    :return: A DuckObject object.
+    '''
+
+    _duck_AlternateDataStream.check(uco_document, name, hashes, size)
+
+    return uco_document.create_DuckObject('AlternateDataStream', **properties(kwargs, name=name, hashes=hashes,
+                                          size=size))
+
+
+_duck_ArrayOfHash = Checks('duck_ArrayOfHash', (
+    ('hashes', True,  True,  'duck:Hash'),
+))
+
+def duck_ArrayOfHash(uco_document, hashes=MISSING, **kwargs):
+    '''
+    :param Hashes: At least one occurrence of type Hash.
+    :return: A DuckObject object.
+    '''
+
+    _duck_ArrayOfHash.check(uco_document, hashes)
+
+    return uco_document.create_DuckObject('ArrayOfHash', **properties(kwargs, hashes=hashes))
+
+
+_duck_ArrayOfObject = Checks('duck_ArrayOfObject', (
+    ('objects', True,  True,  'core'),
+))
+
+def duck_ArrayOfObject(uco_document, objects=MISSING, **kwargs):
+    '''
+    :param Objects: At least one occurrence of type CoreObject.
+    :return: A DuckObject object.
+    '''
+
+    _duck_ArrayOfObject.check(uco_document, objects)
+
+    return uco_document.create_DuckObject('ArrayOfObject', **properties(kwargs, objects=objects))
+
+
+_duck_ArrayOfString = Checks('duck_ArrayOfString', (
+    ('strings', True,  True,  'String'),
+))
+
+def duck_ArrayOfString(uco_document, strings=MISSING, **kwargs):
+    '''
+    :param strings: At least one value of type String.
+    :return: A DuckObject object.
+    '''
+
+    _duck_ArrayOfString.check(uco_document, strings)
+
+    return uco_document.create_DuckObject('ArrayOfString', **properties(kwargs, strings=strings))
+
+
+_duck_BuildConfigurationType = Checks('duck_BuildConfigurationType', (
+    ('configuration_setting_description', False, False, 'String'),
+    ('configuration_settings',            False, True,  'duck:ConfigurationSettingType'),
+))
+
+def duck_BuildConfigurationType(uco_document, configuration_setting_description=MISSING,
+                                configuration_settings=MISSING, **kwargs):
+    '''
+    :param ConfigurationSettingDescription: At most one value of type String.
+    :param ConfigurationSettings: Any number of occurrences of type ConfigurationSettingType.
+    :return: A DuckObject object.
+    '''
+
+    _duck_BuildConfigurationType.check(uco_document, configuration_setting_description,
+                                       configuration_settings)
+
+    return uco_document.create_DuckObject('BuildConfigurationType', **properties(kwargs,
+                                          configuration_setting_description=configuration_setting_description,
+                                          configuration_settings=configuration_settings))
+
+
+_duck_BuildInformationType = Checks('duck_BuildInformationType', (
+    ('build_id',            False, False, 'String'),
+    ('build_project',       False, False, 'String'),
+    ('build_utility',       False, False, 'duck:BuildUtilityType'),
+    ('build_version',       False, False, 'String'),
+    ('build_label',         False, False, 'String'),
+    ('compilers',           False, True,  'duck:CompilerType'),
+    ('compilation_date',    False, False, 'Datetime'),
+    ('build_configuration', False, True,  'duck:BuildConfigurationType'),
+    ('build_script',        False, False, 'String'),
+    ('libraries',           False, True,  'duck:LibraryType'),
+    ('build_output_log',    False, False, 'String'),
+))
+
+def duck_BuildInformationType(uco_document, build_id=MISSING, build_project=MISSING, build_utility=MISSING,
+                              build_version=MISSING, build_label=MISSING, compilers=MISSING,
+                              compilation_date=MISSING, build_configuration=MISSING, build_script=MISSING,
+                              libraries=MISSING, build_output_log=MISSING, **kwargs):
+    '''
+    :param BuildID: At most one value of type String.
+    :param BuildProject: At most one value of type String.
+    :param BuildUtility: At most one occurrence of type BuildUtilityType.
+    :param BuildVersion: At most one value of type String.
+    :param BuildLabel: At most one value of type String.
+    :param Compilers: Any number of occurrences of type CompilerType.
+    :param CompilationDate: At most one value of type Datetime.
+    :param BuildConfiguration: At most one occurrence of type BuildConfigurationType.
+    :param BuildScript: At most one value of type String.
+    :param Libraries: Any number of occurrences of type LibraryType.
+    :param BuildOutputLog: At most one value of type String.
+    :return: A DuckObject object.
+    '''
+
+    _duck_BuildInformationType.check(uco_document, build_id, build_project, build_utility, build_version,
+                                     build_label, compilers, compilation_date, build_configuration,
+                                     build_script, libraries, build_output_log)
+
+    return uco_document.create_DuckObject('BuildInformationType', **properties(kwargs, build_id=build_id,
+                                          build_project=build_project, build_utility=build_utility,
+                                          build_version=build_version, build_label=build_label,
+                                          compilers=compilers, compilation_date=compilation_date,
+                                          build_configuration=build_configuration, build_script=build_script,
+                                          libraries=libraries, build_output_log=build_output_log))
+
+
+_duck_BuildUtilityType = Checks('duck_BuildUtilityType', (
+    ('build_utility_name', True,  False, 'String'),
+    ('swid',               False, False, 'String'),
+    ('cpeid',              False, False, 'String'),
+))
+
+def duck_BuildUtilityType(uco_document, build_utility_name=MISSING, swid=MISSING, cpeid=MISSING, **kwargs):
+    '''
+    :param BuildUtilityName: Exactly one value of type String.
+    :param SWID: At most one value of type String.
+    :param CPEID: At most one value of type String.
+    :return: A DuckObject object.
+    '''
+
+    _duck_BuildUtilityType.check(uco_document, build_utility_name, swid, cpeid)
+
+    return uco_document.create_DuckObject('BuildUtilityType', **properties(kwargs,
+                                          build_utility_name=build_utility_name, swid=swid, cpeid=cpeid))
+
+
+_duck_CompilerType = Checks('duck_CompilerType', (
+    ('swid',  False, False, 'String'),
+    ('cpeid', False, False, 'String'),
+))
+
+def duck_CompilerType(uco_document, compiler_informal_description=MISSING, swid=MISSING, cpeid=MISSING, **kwargs):
+    '''
+    :param CompilerInformalDescription: At most one value of any type.
+    :param SWID: At most one value of type String.
+    :param CPEID: At most one value of type String.
+    :return: A DuckObject object.
+    '''
+
+    #NOCHECK:compiler_informal_description
+    _duck_CompilerType.check(uco_document, swid, cpeid)
+
+    return uco_document.create_DuckObject('CompilerType', **properties(kwargs,
+                                          compiler_informal_description=compiler_informal_description,
+                                          swid=swid, cpeid=cpeid))
+
+
+_duck_ConfigurationSettingType = Checks('duck_ConfigurationSettingType', (
+    ('item_name',        True,  False, 'String'),
+    ('item_value',       True,  False, 'String'),
+    ('item_type',        False, False, 'String'),
+    ('item_description', False, False, 'String'),
+))
+
+def duck_ConfigurationSettingType(uco_document, item_name=MISSING, item_value=MISSING, item_type=MISSING,
+                                  item_description=MISSING, **kwargs):
+    '''
+    :param ItemName: Exactly one value of type String.
+    :param ItemValue: Exactly one value of type String.
+    :param ItemType: At most one value of type String.
+    :param ItemDescriptipn: At most one value of type String.
+    :return: A DuckObject object.
+    '''
+
+    _duck_ConfigurationSettingType.check(uco_document, item_name, item_value, item_type, item_description)
+
+    return uco_document.create_DuckObject('ConfigurationSettingType', **properties(kwargs, item_name=item_name,
+                                          item_value=item_value, item_type=item_type,
+                                          item_description=item_description))
+
+
+_duck_ControlledDictionary = Checks('duck_ControlledDictionary', (
+    ('entry', True,  True,  'duck:ControlledDictionaryEntry'),
+))
+
+def duck_ControlledDictionary(uco_document, entry=MISSING, **kwargs):
+    '''
+    :param Entry: At least one occurrence of type ControlledDictionaryEntry.
+    :return: A DuckObject object.
+    '''
+
+    _duck_ControlledDictionary.check(uco_document, entry)
+
+    return uco_document.create_DuckObject('ControlledDictionary', **properties(kwargs, entry=entry))
+
+
+_duck_ControlledDictionaryEntry = Checks('duck_ControlledDictionaryEntry', (
+    ('key',   True,  False, 'core:ControlledVocabulary'),
+    ('value', True,  False, 'String'),
+))
+
+def duck_ControlledDictionaryEntry(uco_document, key=MISSING, value=MISSING, **kwargs):
+    '''
+    :param Key: Exactly one occurrence of type ControlledVocabulary.
+    :param Value: Exactly one value of type String.
+    :return: A DuckObject object.
+    '''
+
+    _duck_ControlledDictionaryEntry.check(uco_document, key, value)
+
+    return uco_document.create_DuckObject('ControlledDictionaryEntry', **properties(kwargs, key=key,
+                                          value=value))
+
+
+_duck_DataRange = Checks('duck_DataRange', (
+    ('range_offset_type', False, False, 'String'),
+    ('range_offset',      False, False, 'Integer'),
+    ('range_size',        False, False, 'Long'),
+))
+
+def duck_DataRange(uco_document, range_offset_type=MISSING, range_offset=MISSING, range_size=MISSING, **kwargs):
+    '''
+    :param RangeOffsetType: At most one value of type String.
+    :param RangeOffset: At most one value of type Integer.
+    :param RangeSize: At most one value of type Long.
+    :return: A DuckObject object.
+    '''
+
+    _duck_DataRange.check(uco_document, range_offset_type, range_offset, range_size)
+
+    return uco_document.create_DuckObject('DataRange', **properties(kwargs,
+                                          range_offset_type=range_offset_type, range_offset=range_offset,
+                                          range_size=range_size))
+
+
+_duck_DependencyType = Checks('duck_DependencyType', (
+    ('dependency_type', False, False, 'String'),
+))
+
+def duck_DependencyType(uco_document, dependency_description=MISSING, dependency_type=MISSING, **kwargs):
+    '''
+    :param DependencyDescription: Exactly one value of any type.
+    :param DependencyType: At most one value of type String.
+    :return: A DuckObject object.
+    '''
+
+    #NOCHECK:dependency_description
+    _duck_DependencyType.check(uco_document, dependency_type)
+
+    return uco_document.create_DuckObject('DependencyType', **properties(kwargs,
+                                          dependency_description=dependency_description,
+                                          dependency_type=dependency_type))
+
+
+_duck_Dictionary = Checks('duck_Dictionary', (
+    ('entry', True,  False, 'duck:DictionaryEntry'),
+))
+
+def duck_Dictionary(uco_document, entry=MISSING, **kwargs):
+    '''
+    :param Entry: At least one occurrence of type DictionaryEntry.
+    :return: A DuckObject object.
+    '''
+
+    _duck_Dictionary.check(uco_document, entry)
+
+    return uco_document.create_DuckObject('Dictionary', **properties(kwargs, entry=entry))
+
+
+_duck_DictionaryEntry = Checks('duck_DictionaryEntry', (
+    ('key',   True,  False, 'String'),
+    ('value', True,  False, 'String'),
+))
+
+def duck_DictionaryEntry(uco_document, key=MISSING, value=MISSING, **kwargs):
+    '''
+    :param Key: Exactly one value of type String.
+    :param Value: Exactly one value of type String.
+    :return: A DuckObject object.
+    '''
+
+    _duck_DictionaryEntry.check(uco_document, key, value)
+
+    return uco_document.create_DuckObject('DictionaryEntry', **properties(kwargs, key=key, value=value))
+
+
+_duck_GlobalFlagType = Checks('duck_GlobalFlagType', (
+    ('abbreviation',  False, False, 'String'),
+    ('destination',   False, False, 'String'),
+    ('symbolic_name', False, False, 'String'),
+))
+
+def duck_GlobalFlagType(uco_document, abbreviation=MISSING, destination=MISSING, hexadecimal_value=MISSING,
+                        symbolic_name=MISSING, **kwargs):
+    '''
+    :param Abbrevation: At most one value of type String.
+    :param Destination: At most one value of type String.
+    :param HexadecimalValue: At most one value of type HexBinary.
+    :param SymbolicName: At most one value of type String.
+    :return: A DuckObject object.
+    '''
+
+    #TODO:HexBinary
+    _duck_GlobalFlagType.check(uco_document, abbreviation, destination, symbolic_name)
+
+    return uco_document.create_DuckObject('GlobalFlagType', **properties(kwargs, abbreviation=abbreviation,
+                                          destination=destination, hexadecimal_value=hexadecimal_value,
+                                          symbolic_name=symbolic_name))
+
+
+_duck_GranularMarking = Checks('duck_GranularMarking', (
+    ('content_selectors',  False, True,  'String'),
+    ('marking_references', False, True,  'core:MarkingDefinition'),
+))
+
+def duck_GranularMarking(uco_document, content_selectors=MISSING, marking_references=MISSING, **kwargs):
+    '''
+    :param ContentSelectors: Any number of values of type String.
+    :param MarkingReferences: Any number of occurrences of type MarkingDefinition.
+    :return: A DuckObject object.
+    '''
+
+    _duck_GranularMarking.check(uco_document, content_selectors, marking_references)
+
+    return uco_document.create_DuckObject('GranularMarking', **properties(kwargs,
+                                          content_selectors=content_selectors,
+                                          marking_references=marking_references))
+
+
+_duck_Hash = Checks('duck_Hash', (
+    ('hash_method', True,  False, 'core:ControlledVocabulary'),
+))
+
+def duck_Hash(uco_document, hash_method=MISSING, hash_value=MISSING, **kwargs):
+    '''
+    :param HashMethod: Exactly one occurrence of type ControlledVocabulary.
+    :param HashValue: Exactly one value of type HexBinary.
+    :return: A DuckObject object.
+    '''
+
+    #TODO:HexBinary
+    _duck_Hash.check(uco_document, hash_method)
+
+    return uco_document.create_DuckObject('Hash', **properties(kwargs, hash_method=hash_method,
+                                          hash_value=hash_value))
+
+
+_duck_IComHandlerActionType = Checks('duck_IComHandlerActionType', (
+    ('com_data',     False, False, 'String'),
+    ('com_class_id', False, False, 'String'),
+))
+
+def duck_IComHandlerActionType(uco_document, com_data=MISSING, com_class_id=MISSING, **kwargs):
+    '''
+    :param ComData: At most one value of type String.
+    :param ComClassID: At most one value of type String.
+    :return: A DuckObject object.
+    '''
+
+    _duck_IComHandlerActionType.check(uco_document, com_data, com_class_id)
+
+    return uco_document.create_DuckObject('IComHandlerActionType', **properties(kwargs, com_data=com_data,
+                                          com_class_id=com_class_id))
+
+
+_duck_LibraryType = Checks('duck_LibraryType', (
+    ('library_name',    True,  False, 'String'),
+    ('library_version', True,  False, 'String'),
+))
+
+def duck_LibraryType(uco_document, library_name=MISSING, library_version=MISSING, **kwargs):
+    '''
+    :param LibraryName: Exactly one value of type String.
+    :param LibraryVersion: Exactly one value of type String.
+    :return: A DuckObject object.
+    '''
+
+    _duck_LibraryType.check(uco_document, library_name, library_version)
+
+    return uco_document.create_DuckObject('LibraryType', **properties(kwargs, library_name=library_name,
+                                          library_version=library_version))
+
+
+def duck_MarkingModel(uco_document, **kwargs):
+    '''
+    :return: A DuckObject object.
+    '''
+
+    #TODO:NothingElseToCheck
+
+    return uco_document.create_DuckObject('MarkingModel', **kwargs)
+
+
+_duck_MIMEPartType = Checks('duck_MIMEPartType', (
+    ('body',                False, False, 'String'),
+    ('content_type',        False, False, 'String'),
+    ('body_raw_ref',        False, False, 'core:Trace'),
+    ('content_disposition', False, False, 'String'),
+))
+
+def duck_MIMEPartType(uco_document, body=MISSING, content_type=MISSING, body_raw_ref=MISSING,
+                      content_disposition=MISSING, **kwargs):
+    '''
+    :param Body: At most one value of type String.
+    :param ContentType: At most one value of type String.
+    :param BodyRawRef: At most one occurrence of type Trace.
+    :param ContentDisposition: At most one value of type String.
+    :return: A DuckObject object.
+    '''
+
+    _duck_MIMEPartType.check(uco_document, body, content_type, body_raw_ref, content_disposition)
+
+    return uco_document.create_DuckObject('MIMEPartType', **properties(kwargs, body=body,
+                                          content_type=content_type, body_raw_ref=body_raw_ref,
+                                          content_disposition=content_disposition))
+
+
+_duck_TaskActionType = Checks('duck_TaskActionType', (
+    ('action_id',            False, False, 'String'),
+    ('iemail_action_ref',    False, False, 'core:Trace'),
+    ('icom_handler_action',  False, False, 'duck:IComHandlerActionType'),
+    ('iexec_action',         False, False, 'duck:IExecActionType'),
+    ('ishow_message_action', False, False, 'duck:IShowMessageActionType'),
+))
+
+def duck_TaskActionType(uco_document, action_id=MISSING, iemail_action_ref=MISSING, icom_handler_action=MISSING,
+                        iexec_action=MISSING, ishow_message_action=MISSING, **kwargs):
+    '''
+    :param ActionID: At most one value of type String.
+    :param iEmailActionRef: At most one occurrence of type Trace.
+    :param iComHandlerAction: At most one occurrence of type IComHandlerActionType.
+    :param iExecAction: At most one occurrence of type IExecActionType.
+    :param iShowMessageAction: At most one occurrence of type IShowMessageActionType.
+    :return: A DuckObject object.
+    '''
+
+    _duck_TaskActionType.check(uco_document, action_id, iemail_action_ref, icom_handler_action, iexec_action,
+                               ishow_message_action)
+
+    return uco_document.create_DuckObject('TaskActionType', **properties(kwargs, action_id=action_id,
+                                          iemail_action_ref=iemail_action_ref,
+                                          icom_handler_action=icom_handler_action, iexec_action=iexec_action,
+                                          ishow_message_action=ishow_message_action))
+
+
+_duck_TriggerType = Checks('duck_TriggerType', (
+    ('is_enabled',                  False, False, 'Bool'),
+    ('trigger_begin_time',          False, False, 'Datetime'),
+    ('trigger_delay',               False, False, 'String'),
+    ('trigger_end_time',            False, False, 'Datetime'),
+    ('trigger_max_run_time',        False, False, 'String'),
+    ('trigger_session_change_type', False, False, 'String'),
+))
+
+def duck_TriggerType(uco_document, is_enabled=MISSING, trigger_begin_time=MISSING, trigger_delay=MISSING,
+                     trigger_end_time=MISSING, trigger_max_run_time=MISSING,
+                     trigger_session_change_type=MISSING, **kwargs):
+    '''
+    :param IsEnabled: At most one value of type Bool.
+    :param TriggerBeginTime: At most one value of type Datetime.
+    :param TriggerDelay: At most one value of type String.
+    :param TriggerEndTime: At most one value of type Datetime.
+    :param TriggerMaxRunTime: At most one value of type String.
+    :param TriggerSessionChangeType: At most one value of type String.
+    :return: A DuckObject object.
+    '''
+
+    _duck_TriggerType.check(uco_document, is_enabled, trigger_begin_time, trigger_delay, trigger_end_time,
+                            trigger_max_run_time, trigger_session_change_type)
+
+    return uco_document.create_DuckObject('TriggerType', **properties(kwargs, is_enabled=is_enabled,
+                                          trigger_begin_time=trigger_begin_time, trigger_delay=trigger_delay,
+                                          trigger_end_time=trigger_end_time,
+                                          trigger_max_run_time=trigger_max_run_time,
+                                          trigger_session_change_type=trigger_session_change_type))
+
+
+_duck_WhoIsContactType = Checks('duck_WhoIsContactType', (
+    ('contact_id',           False, False, 'String'),
+    ('contact_name',         False, False, 'String'),
+    ('email_address_ref',    False, False, 'core:Trace'),
+    ('phone_number_ref',     False, False, 'core:Trace'),
+    ('fax_number_ref',       False, False, 'core:Trace'),
+    ('address_ref',          False, False, 'core:Location'),
+    ('contact_organization', False, False, 'core:Identity'),
+))
+
+def duck_WhoIsContactType(uco_document, contact_id=MISSING, contact_name=MISSING, email_address_ref=MISSING,
+                          phone_number_ref=MISSING, fax_number_ref=MISSING, address_ref=MISSING,
+                          contact_organization=MISSING, **kwargs):
+    '''
+    :param ContactID: At most one value of type String.
+    :param ContactName: At most one value of type String.
+    :param EmailAddressRef: At most one occurrence of type Trace.
+    :param PhoneNumberRef: At most one occurrence of type Trace.
+    :param FaxNumberRef: At most one occurrence of type Trace.
+    :param AddressRef: At most one occurrence of type Location.
+    :param ContactOrganization: At most one occurrence of type Identity (core).
+    :return: A DuckObject object.
+    '''
+
+    _duck_WhoIsContactType.check(uco_document, contact_id, contact_name, email_address_ref, phone_number_ref,
+                                 fax_number_ref, address_ref, contact_organization)
+
+    return uco_document.create_DuckObject('WhoIsContactType', **properties(kwargs, contact_id=contact_id,
+                                          contact_name=contact_name, email_address_ref=email_address_ref,
+                                          phone_number_ref=phone_number_ref, fax_number_ref=fax_number_ref,
+                                          contact_organization=contact_organization))
+
+
+_duck_WhoIsRegistrarInfoType = Checks('duck_WhoIsRegistrarInfoType', (
+    ('registrar_id',      False, False, 'String'),
+    ('registrar_guid',    False, False, 'String'),
+    ('who_is_server_ref', False, False, 'core:Trace'),
+    ('referral_url_ref',  False, False, 'core:Trace'),
+    ('registrar_name',    False, False, 'String'),
+    ('email_address_ref', False, False, 'core:Trace'),
+    ('phone_number_ref',  False, False, 'core:Trace'),
+    ('address_ref',       False, False, 'core:Location'),
+    ('contact_info_refs', False, True,  'duck:WhoIsContactType'),
+))
+
+def duck_WhoIsRegistrarInfoType(uco_document, registrar_id=MISSING, registrar_guid=MISSING,
+                                who_is_server_ref=MISSING, referral_url_ref=MISSING,
+                                registrar_name=MISSING, email_address_ref=MISSING, phone_number_ref=MISSING,
+                                address_ref=MISSING, contact_info_refs=MISSING, **kwargs):
+    '''
+    :param RegistrarID: At most one value of type String.
+    :param RegistrarGUID: At most one value of type String.
+    :param WhoIsServerRef: At most one occurrence of type Trace.
+    :param ReferralURLRef: At most one occurrence of type Trace.
+    :param RegistrarName: At most one value of type String.
+    :param EmailAddressRef: At most one occurrence of type Trace.
+    :param PhoneNumberRef: At most one occurrence of type Trace.
+    :param AddressRef: At most one occurrence of type Location.
+    :param ContactInfoRefs: Any number of occurrences of type WhoIsContactType.
+    :return: A DuckObject object.
+    '''
+
+    _duck_WhoIsRegistrarInfoType.check(uco_document, registrar_id, registrar_guid, who_is_server_ref,
+                                       referral_url_ref, registrar_name, email_address_ref, phone_number_ref,
+                                       address_ref, contact_info_refs)
+
+    return uco_document.create_DuckObject('WhoIsRegistrarInfoType', **properties(kwargs,
+                                          registrar_id=registrar_id, registrar_guid=registrar_guid,
+                                          who_is_server_ref=who_is_server_ref,
+                                          referral_url_ref=referral_url_ref, registrar_name=registrar_name,
+                                          email_address_ref=email_address_ref,
+                                          phone_number_ref=phone_number_ref, address_ref=address_ref,
+                                          contact_info_refs=contact_info_refs))
+
+
+_duck_WindowsPEFileHeader = Checks('duck_WindowsPEFileHeader', (
+    ('hashes', False, True,  'duck:Hash'),
+))
+
+def duck_WindowsPEFileHeader(uco_document, machine=MISSING, number_of_sections=MISSING, time_date_stamp=MISSING,
+                             pointer_to_symbol_table=MISSING, number_of_symbols=MISSING,
+                             size_of_optional_header=MISSING, characteristics=MISSING,
+                             hashes=MISSING, **kwargs):
+    '''
+    :param Machine: Exactly one value of type HexBinary.
+    :param NumberOfSections: At most one value of type HexBinary.
+    :param TimeDateStamp: At most one value of any type.
+    :param PointerToSymbolTable: At most one value of type HexBinary.
+    :param NumberOfSymbols: At most one value of type HexBinary.
+    :param SizeOfOptionalHeader: At most one value ot type HexBinary.
+    :param Characteristics: At most one value of type HexBinary.
+    :param Hashes: Any number of occurences of type Hash.
+    :return: A DuckObject object.
+    '''
+
+    #TODO:HexBinary #REQUIRED
+    #TODO:HexBinary
+    #NOCHECK:time_date_stamp
+    #TODO:HexBinary
+    #TODO:HexBinary
+    #TODO:HexBinary
+    #TODO:HexBinary
+    _duck_WindowsPEFileHeader.check(uco_document, hashes)
+
+    return uco_document.create_DuckObject('WindowsPEFileHeader', **properties(kwargs, machine=machine,
+                                          number_of_sections=number_of_sections,
+                                          time_date_stamp=time_date_stamp,
+                                          pointer_to_symbol_table=pointer_to_symbol_table,
+                                          number_of_symbols=number_of_symbols,
+                                          size_of_optional_header=size_of_optional_header,
+                                          characteristics=characteristics, hashes=hashes))
+
+
+_duck_WindowsPEOptionalHeader = Checks('duck_WindowsPEOptionalHeader', (
+    ('hashes', False, True,  'duck:Hash'),
+))
+
+def duck_WindowsPEOptionalHeader(uco_document, magic=MISSING, major_linker_version=MISSING,
+                                 minor_linker_version=MISSING, size_of_code=MISSING,
+                                 size_of_initialized_data=MISSING, size_of_uninitialized_data=MISSING,
+                                 address_of_entry_point=MISSING, base_of_code=MISSING, image_base=MISSING,
+                                 section_alignment=MISSING, file_alignment=MISSING, major_os_version=MISSING,
+                                 minor_os_version=MISSING, major_image_version=MISSING,
+                                 minor_image_version=MISSING, major_subsystem_version=MISSING,
+                                 minor_subsystem_version=MISSING, win32_version_value=MISSING,
+                                 size_of_image=MISSING, size_of_headers=MISSING, checksum=MISSING,
+                                 subsystem=MISSING, dll_characteristics=MISSING, size_of_stack_reserve=MISSING,
+                                 size_of_stack_commit=MISSING, size_of_heap_reserve=MISSING,
+                                 size_of_heap_commit=MISSING, loader_flags=MISSING,
+                                 number_of_rva_and_sizes=MISSING, hashes=MISSING, **kwargs):
+    '''
+    :param Magic: At most one value of type HexBinary.
+    :param MajorLinkerVersion: At most one value of type HexBinary.
+    :param MinorLinkerVersion: At most one value of type HexBinary.
+    :param SizeOfCode: At most one value of type HexBinary.
+    :param SizeOfInitializedData: At most one value of type HexBinary.
+    :param SizeOfUninitializedData: At most one value of type HexBinary.
+    :param AddressOfEntryPoint: At most one value of type HexBinary.
+    :param BaseOfCode: At most one value of type HexBinary.
+    :param ImageBase: At most one value of type HexBinary.
+    :param SectionAlignment: At most one value of type HexBinary.
+    :param FileAlignment: At most one value of type HexBinary.
+    :param MajorOSVersion: At most one value of type HexBinary.
+    :param MinorOSVersion: At most one value of type HexBinary.
+    :param MajorImageVersion: At most one value of type HexBinary.
+    :param MinorImageVersion: At most one value of type HexBinary.
+    :param MajorSubsystemVersion: At most one value of type HexBinary.
+    :param MinorSubsystemVersion: At most one value of type HexBinary.
+    :param Win32VersionValue: At most one value of type HexBinary.
+    :param SizeOfImage: At most one value of type HexBinary.
+    :param SizeOfHeaders: At most one value of type HexBinary.
+    :param Checksum: At most one value of type HexBinary.
+    :param Subsystem: At most one value of type HexBinary.
+    :param DLLCharacteristics: At most one value of type HexBinary.
+    :param SizeOfStackReserve: At most one value of type HexBinary.
+    :param SizeOfStackCommit: At most one value of type HexBinary.
+    :param SizeOfHeapReserve: At most one value of type HexBinary.
+    :param SizeOfHeapCommit: At most one value of type HexBinary.
+    :param LoaderFlags: At most one value of type HexBinary.
+    :param NumberOfRVAAndSizes: At most one value of type HexBinary.
+    :param Hashes: Any number of occurrences of type Hash.
+    :return: A DuckObject object.
+    '''
+
+    # ALL THE HEXBINARY
+    #TODO:HexBinary
+    _duck_WindowsPEOptionalHeader.check(uco_document, hashes)
+
+    return uco_document.create_DuckObject('WindowsPEOptionalHeader', **properties(kwargs, magic=magic,
+                                          major_linker_version=major_linker_version,
+                                          minor_linker_version=minor_linker_version, size_of_code=size_of_code,
+                                          size_of_initialized_data=size_of_initialized_data,
+                                          size_of_uninitialized_data=size_of_uninitialized_data,
+                                          address_of_entry_point=address_of_entry_point,
+                                          base_of_code=base_of_code, image_base=image_base,
+                                          section_alignment=section_alignment, file_alignment=file_alignment,
+                                          major_os_version=major_os_version, minor_os_version=minor_os_version,
+                                          major_image_version=major_image_version,
+                                          minor_image_version=minor_image_version,
+                                          major_subsystem_version=major_subsystem_version,
+                                          minor_subsystem_version=minor_subsystem_version,
+                                          win32_version_value=win32_version_value, size_of_image=size_of_image,
+                                          size_of_headers=size_of_headers, checksum=checksum,
+                                          subsystem=subsystem, dll_characteristics=dll_characteristics,
+                                          size_of_stack_reserve=size_of_stack_reserve,
+                                          size_of_stack_commit=size_of_stack_commit,
+                                          size_of_heap_reserve=size_of_heap_reserve,
+                                          size_of_heap_commit=size_of_heap_commit, loader_flags=loader_flags,
+                                          number_of_rva_and_sizes=number_of_rva_and_sizes, hashes=hashes))
+
+
+_duck_WindowsPESection = Checks('duck_WindowsPESection', (
+    ('name',    True,  False, 'String'),
+    ('size',    False, False, 'Integer'),
+    ('entropy', False, False, 'Float'),
+    ('hashes',  False, True,  'duck:Hash'),
+))
+
+def duck_WindowsPESection(uco_document, name=MISSING, size=MISSING, entropy=MISSING, hashes=MISSING, **kwargs):
+    '''
+    :param Name: Exactly one value of type String.
+    :param Size: At most one value of type Integer.
+    :param Entropy: At most one value of type Float.
+    :param Hashes: Any number of occurrences of type Hash.
+    :return: A DuckObject object.
+    '''
+
+    _duck_WindowsPESection.check(uco_document, name, size, entropy, hashes)
+
+    return uco_document.create_DuckObject('WindowsPESection', **properties(kwargs, name=name, size=size,
+                                          entropy=entropy, hashes=hashes))
+
+
+_duck_WindowsRegistryValue = Checks('duck_WindowsRegistryValue', (
+    ('name',      True,  False, 'String'),
+    ('data',      False, False, 'String'),
+    ('data_type', False, False, 'core:ControlledVocabulary'),
+))
+
+def duck_WindowsRegistryValue(uco_document, name=MISSING, data=MISSING, data_type=MISSING, **kwargs):
+    '''
+    :param Name: Exactly one value of type String.
+    :param Data: At most one value of type String.
+    :param DataType: At most one occurrence of type ControlledVocabulary.
+    :return: A DuckObject object.
+    '''
+
+    _duck_WindowsRegistryValue.check(uco_document, name, data, data_type)
+
+    return uco_document.create_DuckObject('WindowsRegistryValue', **properties(kwargs, name=name, data=data,
+                                          data_type=data_type))
+
+
+_duck_X509V3Extensions = Checks('duck_X509V3Extensions', (
+    ('basic_constraints',                   False, False, 'String'),
+    ('name_constraints',                    False, False, 'String'),
+    ('policy_constraints',                  False, False, 'String'),
+    ('key_usage',                           False, False, 'String'),
+    ('extended_key_usage',                  False, False, 'String'),
+    ('subject_key_identifier',              False, False, 'String'),
+    ('authority_key_identifier',            False, False, 'String'),
+    ('subject_alternative_name',            False, False, 'String'),
+    ('issuer_alternative_name',             False, False, 'String'),
+    ('subject_directory_attributes',        False, False, 'String'),
+    ('crl_distribution_points',             False, False, 'String'),
+    ('inhibit_any_policy',                  False, False, 'String'),
+    ('private_key_usage_period_not_before', False, False, 'Datetime'),
+    ('private_key_usage_period_not_after',  False, False, 'Datetime'),
+    ('certificate_policies',                False, False, 'String'),
+    ('policy_mappings',                     False, False, 'String'),
+))
+
+def duck_X509V3Extensions(uco_document, basic_constraints=MISSING, name_constraints=MISSING,
+                          policy_constraints=MISSING, key_usage=MISSING, extended_key_usage=MISSING,
+                          subject_key_identifier=MISSING, authority_key_identifier=MISSING,
+                          subject_alternative_name=MISSING, issuer_alternative_name=MISSING,
+                          subject_directory_attributes=MISSING, crl_distribution_points=MISSING,
+                          inhibit_any_policy=MISSING, private_key_usage_period_not_before=MISSING,
+                          private_key_usage_period_not_after=MISSING, certificate_policies=MISSING,
+                          policy_mappings=MISSING, **kwargs):
+    '''
+    :param BasicConstraints: At most one value of type String.
+    :param NameConstraints: At most one value of type String.
+    :param PolicyConstraints: At most one value of type String.
+    :param KeyUsage: At most one value of type String.
+    :param ExtendedKeyUsage: At most one value of type String.
+    :param SubjectKeyIdentifier: At most one value of type String.
+    :param AuthorityKeyIdentifier: At most one value of type String.
+    :param SubjectAlternativeName: At most one value of type String.
+    :param IssuerAlternativeName: At most one value of type String.
+    :param SubjectDirectoryAttributes: At most one value of type String.
+    :param CRLDistributionPoints: At most one value of type String.
+    :param InhibitAnyPolicy: At most one value of type String.
+    :param PrivateKeyUsagePeriodNotBefore: At most one value of type Datetime.
+    :param PrivateKeyUsagePeriodNotAfter: At most one value of type Datetime.
+    :param CertificatePolicies: At most one value of type String.
+    :param PolicyMappings: At most one value of type String.
+    :return: A DuckObject object.
+    '''
+
+    _duck_X509V3Extensions.check(uco_document, basic_constraints, name_constraints, policy_constraints,
+                                 key_usage, extended_key_usage, subject_key_identifier,
+                                 authority_key_identifier, subject_alternative_name, issuer_alternative_name,
+                                 subject_directory_attributes, crl_distribution_points, inhibit_any_policy,
+                                 private_key_usage_period_not_before, private_key_usage_period_not_after,
+                                 certificate_policies, policy_mappings)
+
+    return uco_document.create_DuckObject('X509V3Extensions', **properties(kwargs,
+                                          basic_constraints=basic_constraints,
+                                          name_constraints=name_constraints,
+                                          policy_constraints=policy_constraints, key_usage=key_usage,
+                                          extended_key_usage=extended_key_usage,
+                                          subject_key_identifier=subject_key_identifier,
+                                          authority_key_identifier=authority_key_identifier,
+                                          subject_alternative_name=subject_alternative_name,
+                                          issuer_alternative_name=issuer_alternative_name,
+                                          subject_directory_attributes=subject_directory_attributes,
+                                          crl_distribution_points=crl_distribution_points,
+                                          inhibit_any_policy=inhibit_any_policy,
+                                          private_key_usage_period_not_before=private_key_usage_period_not_before,
+                                          private_key_usage_period_not_after=private_key_usage_period_not_after,
+                                          certificate_policies=certificate_policies,
+                                          policy_mappings=policy_mappings))
+
+
+predicates.register(globals())
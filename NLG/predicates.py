@@ -0,0 +1,181 @@
+# NOTICE
+# 
+# This software was produced for the U.S. Government under
+# contract SB-1341-14-CQ-0010, and is subject to the Rights
+# in Data-General Clause 52.227-14, Alt. IV (DEC 2007)
+#
+# (c) 2018 The MITRE Corporation. All Rights Reserved.
+
+
+#====================================================
+# CASE NLG VERIFIER v0.1.0 - PREDICATES
+
+"""The predicates the parameters of the NLG functions are added as."""
+
+import case
+
+
+#====================================================
+#-- PREDICATES
+#
+# The NLG functions hand their parameters to the create functions of case.py through
+# properties(), keyed by their predicate URIRefs, so case.Node.add() uses them as they are.
+# Each URIRef is built once and shared by every triple using it. The predicate of a
+# parameter is its name in CamelCase (has_changed -> HasChanged) unless listed below.
+# Other properties (the **kwargs of the NLG functions) keep their own names.
+
+_PREDICATE_NAMES = {
+    'account_id':                      'AccountID',
+    'action_id':                       'ActionID',
+    'aslr_enabled':                    'ASLREnabled',
+    'available_ram':                   'AvailableRAM',
+    'bcc_refs':                        'BCCRefs',
+    'bios_date':                       'BIOSDate',
+    'bios_manufacturer':               'BIOSManufacturer',
+    'bios_release_date':               'BIOSReleaseDate',
+    'bios_serial_number':              'BIOSSerialNumber',
+    'bios_version':                    'BIOSVersion',
+    'build_id':                        'BuildID',
+    'build_utility':                   'BuildUtilities',
+    'cc_refs':                         'CCRefs',
+    'com_class_id':                    'ComClassID',
+    'contact_id':                      'ContactID',
+    'cpeid':                           'CPEID',
+    'cpu':                             'CPU',
+    'cpu_family':                      'CPUFamily',
+    'crl_distribution_points':         'CRLDistributionPoints',
+    'data_payload_ref_url':            'DataPayloadRefURL',
+    'dep_enabled':                     'DEPEnabled',
+    'dhcp_lease_expires':              'DHCPLeaseExpires',
+    'dhcp_lease_obtained':             'DHCPLeaseObtained',
+    'dhcp_server_refs':                'DHCPServerRefs',
+    'dll_characteristics':             'DLLCharacteristics',
+    'domain_id':                       'DomainID',
+    'effective_group_id':              'EffectiveGroupID',
+    'encryption_iv':                   'EncryptionIV',
+    'entry_id':                        'EntryID',
+    'event_id':                        'EventID',
+    'exif_data':                       'EXIFData',
+    'gid':                             'GID',
+    'gpu_family':                      'GPUFamily',
+    'hdop':                            'HDOP',
+    'http_message_body_data_ref':      'HTTPMessageBodyDataRef',
+    'http_message_body_length':        'HTTPMessageBodyLength',
+    'http_request_header':             'HTTPRequestHeader',
+    'http_request_version':            'HTTPRequestVersion',
+    'icmp_code':                       'ICMPCode',
+    'icmp_type':                       'ICMPType',
+    'icom_handler_action':             'iComHandlerAction',
+    'iemail_action_ref':               'iEmailActionRef',
+    'iexec_action':                    'iExecAction',
+    'inode_id':                        'InodeID',
+    'ip_address_ref':                  'IPAddressRef',
+    'ip_gateway_refs':                 'IPGatewayRefs',
+    'ip_refs':                         'IPRefs',
+    'ipfix':                           'IPFIX',
+    'is_mime_encoded':                 'IsMIMEEncoded',
+    'is_tld':                          'IsTLD',
+    'ishow_message_action':            'iShowMessageAction',
+    'mac_address_ref':                 'MACAddressRef',
+    'major_os_version':                'MajorOSVersion',
+    'message_id':                      'MessageID',
+    'message_id_ref':                  'MessageIDRef',
+    'mft_file_id':                     'MFTFileID',
+    'mft_filename_accessed_time':      'MFTFileNameAccessedTime',
+    'mft_filename_created_time':       'MFTFileNameCreatedTime',
+    'mft_filename_length':             'MFTFileNameLength',
+    'mft_filename_modified_time':      'MFTFileNameModifiedTime',
+    'mft_filename_record_change_time': 'MFTFileNameRecordChangeTime',
+    'mft_flags':                       'MFTFlags',
+    'mft_parent_id':                   'MFTParentID',
+    'mft_record_change_time':          'MFTRecordChangeTime',
+    'mime_class':                      'MIMEClass',
+    'mime_type':                       'MIMEType',
+    'minor_os_version':                'MinorOSVersion',
+    'ms_product_id':                   'MsProductID',
+    'net_bios_name':                   'NetBIOSName',
+    'ntfs_hard_link_count':            'NTFSHardLinkCount',
+    'ntfs_owner_id':                   'NTFSOwnerID',
+    'ntfs_owner_sid':                  'NTFSOwnerSID',
+    'number_of_rva_and_sizes':         'NumberOfRVAAndSizes',
+    'object_guid':                     'ObjectGUID',
+    'owner_sid':                       'OwnerSID',
+    'partition_id':                    'PartitionID',
+    'pdf_id_one':                      'PDFIDOne',
+    'pdf_id_zero':                     'PDFIDZero',
+    'pdop':                            'PDOP',
+    'pe_type':                         'PEType',
+    'pid':                             'PID',
+    'referral_url_ref':                'ReferralURLRef',
+    'registrant_ids':                  'RegistrantIDs',
+    'registrar_guid':                  'RegistrarGUID',
+    'registrar_id':                    'RegistrarID',
+    'ruid':                            'RUID',
+    'session_id':                      'SessionID',
+    'sgid':                            'SGID',
+    'sid':                             'SID',
+    'ssid':                            'SSID',
+    'suid':                            'SUID',
+    'swid':                            'SWID',
+    'tdop':                            'TDOP',
+    'thread_id':                       'ThreadID',
+    'timezone_dst':                    'TimezoneDST',
+    'total_ram':                       'TotalRAM',
+    'url':                             'URL',
+    'url_targeted':                    'URLTargeted',
+    'vdop':                            'VDOP',
+    'volume_id':                       'VolumeID',
+    'x509V3Extensions':                'Extensions',
+    'x_mailer':                        'xMailer',
+    'x_originating_ip':                'xOriginatingIP',
+}
+
+
+
+def _camel_case(name):
+    return ''.join(part[:1].upper() + part[1:] for part in name.split('_'))
+
+
+def predicate_name(parameter):
+    """Returns the name of the CASE predicate of an NLG parameter, e.g. 'AccountID' for 'account_id'."""
+    return _PREDICATE_NAMES.get(parameter) or _camel_case(parameter)
+
+
+# Parameter name -> predicate name in the CASE namespace, e.g. PREDICATES['account_id'] == 'AccountID'.
+# Complete once every category is loaded (see NLG.load()).
+PREDICATES = {}
+
+# Parameter name -> predicate URIRef, filled as parameters are first used.
+_uris = {}
+
+
+def register(namespace):
+    """
+    Adds the parameters of the NLG functions in namespace to PREDICATES.
+
+    Args:
+        namespace: The globals() of an NLG module, e.g. NLG.core.
+    """
+    for name, function in namespace.items():
+        if name.split('_')[0] in ('core', 'context', 'duck', 'propbundle') and callable(function):
+            code = function.__code__
+            for parameter in code.co_varnames[:code.co_argcount]:
+                if not parameter.startswith('uco_'):
+                    PREDICATES[parameter] = predicate_name(parameter)
+
+
+def properties(kwargs, **parameters):
+    """
+    Returns the properties an NLG function creates its object with: kwargs, plus each
+    parameter under its predicate URIRef (case.Node.add() drops the unset ones).
+
+    Args:
+        kwargs: The **kwargs of the NLG function, added under their own names.
+        parameters: The ontology parameters of the NLG function.
+    """
+    for name, value in parameters.items():
+        uri = _uris.get(name)
+        if uri is None:
+            uri = _uris[name] = case.predicate(predicate_name(name))
+        kwargs[uri] = value
+    return kwargs
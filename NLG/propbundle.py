@@ -0,0 +1,2783 @@
+# NOTICE
+# 
+# This software was produced for the U.S. Government under
+# contract SB-1341-14-CQ-0010, and is subject to the Rights
+# in Data-General Clause 52.227-14, Alt. IV (DEC 2007)
+#
+# (c) 2018 The MITRE Corporation. All Rights Reserved.
+
+#====================================================
+# CASE NLG VERIFIER v0.1.0 - PROPERTYBUNDLES
+
+"""NLG functions adding PropertyBundles to CoreObjects (propbundle_<Type>)."""
+
+from NLG import predicates
+from NLG.checks import Checks, MISSING
+from NLG.predicates import properties
+
+
+#====================================================
+#-- PROPERTYBUNDLES IN ALPHABETICAL ORDER
+
+_propbundle_Account = Checks('propbundle_Account', (
+    ('account_id',         True,  False, 'String'),
+    ('expiration_time',    False, False, 'Datetime'),
+    ('created_time',       False, False, 'Datetime'),
+    ('account_type',       False, False, 'core:ControlledVocabulary'),
+    ('account_issuer_ref', False, False, 'core'),
+    ('is_active',          False, False, 'Bool'),
+    ('modified_time',      False, False, 'Datetime'),
+    ('owner_ref',          False, False, 'core'),
+))
+
+def propbundle_Account(uco_object, account_id=MISSING, expiration_time=MISSING, created_time=MISSING,
+                       account_type=MISSING, account_issuer_ref=MISSING, is_active=MISSING,
+                       modified_time=MISSING, owner_ref=MISSING, **kwargs):
+    '''
+    :param AccountID: Exactly one value of type String.
+    :param ExprationTime: At most one value of type Datetime.
+    :param CreatedTime: At most one value of type Datetime.
+    :param AccountType: At most one occurrence of type ControlledVocabulary.
+    :param AccountIssuerRef: At most one occurrence of type CoreObject.
+    :param IsActive: At most one value of type Bool.
+    :param ModifiedTime: At most one value of type Datetime.
+    :param OwnerRef: At most one occurrence of type CoreObject.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_Account.check(uco_object.document, account_id, expiration_time, created_time, account_type,
+                              account_issuer_ref, is_active, modified_time, owner_ref)
+
+    return uco_object.create_PropertyBundle('Account', **properties(kwargs, account_id=account_id,
+                                            expiration_time=expiration_time, created_time=created_time,
+                                            account_type=account_type, account_issuer_ref=account_issuer_ref,
+                                            is_active=is_active, modified_time=modified_time,
+                                            owner_ref=owner_ref))
+
+
+_propbundle_AccountAuthentication = Checks('propbundle_AccountAuthentication', (
+    ('password',              False, False, 'String'),
+    ('password_type',         False, False, 'String'),
+    ('password_last_changed', False, False, 'Datetime'),
+))
+
+def propbundle_AccountAuthentication(uco_object, password=MISSING, password_type=MISSING,
+                                     password_last_changed=MISSING, **kwargs):
+    '''
+    :param Password: At most one value of type String.
+    :param PasswordType: At most one value of type String.
+    :param PasswordLastChanged: At most one value of type Datetime.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_AccountAuthentication.check(uco_object.document, password, password_type,
+                                            password_last_changed)
+
+    return uco_object.create_PropertyBundle('AccountAuthentication', **properties(kwargs, password=password,
+                                            password_type=password_type,
+                                            password_last_changed=password_last_changed))
+
+
+_propbundle_ActionReferences = Checks('propbundle_ActionReferences', (
+    ('environment_ref',  False, False, 'core'),
+    ('result_refs',      False, True,  'core'),
+    ('performer_refs',   False, False, 'core'),
+    ('participant_refs', False, True,  'core'),
+    ('object_refs',      False, True,  'core'),
+    ('location_refs',    False, True,  'core:Location'),
+    ('instrument_refs',  False, True,  'core'),
+))
+
+def propbundle_ActionReferences(uco_object, environment_ref=MISSING, result_refs=MISSING,
+                                performer_refs=MISSING, participant_refs=MISSING,
+                                object_refs=MISSING, location_refs=MISSING, instrument_refs=MISSING, **kwargs):
+    '''
+    :param EnvironmentRef: At most one occurrence of type CoreObject.
+    :param ResultRefs: Any number of occurrences of type CoreObject.
+    :param PerformerRef: At most one occurrence of type CoreObject.
+    :param ParticipantRefs: Any number of occurrences of type CoreObject.
+    :param ObjectRefs: Any number of occurrences of type CoreObject.
+    :param LocationRefs: Any number of occurrences of type Location.
+    :param InstrumentRefs: Any number of occurrences of type CoreObject.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_ActionReferences.check(uco_object.document, environment_ref, result_refs, performer_refs,
+                                       participant_refs, object_refs, location_refs, instrument_refs)
+
+    return uco_object.create_PropertyBundle('ActionReferences', **properties(kwargs,
+                                            environment_ref=environment_ref, result_refs=result_refs,
+                                            performer_refs=performer_refs, participant_refs=participant_refs,
+                                            object_refs=object_refs, location_refs=location_refs,
+                                            instrument_refs=instrument_refs))
+
+
+_propbundle_Application = Checks('propbundle_Application', (
+    ('application_identifier', False, False, 'String'),
+    ('version',                False, False, 'String'),
+    ('operating_system_ref',   False, False, 'core:Trace'),
+    ('number_of_launches',     False, False, 'PositiveInteger'),
+))
+
+def propbundle_Application(uco_object, application_identifier=MISSING, version=MISSING,
+                           operating_system_ref=MISSING, number_of_launches=MISSING, **kwargs):
+    '''
+    :param ApplicationIdentifier: At most one value of type String.
+    :param Version: At most one value of type String.
+    :param OperatingSystemRef: At most one occurrence of type Trace.
+    :param NumberOfLaunches: At most one value of type PositiveInteger.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_Application.check(uco_object.document, application_identifier, version, operating_system_ref,
+                                  number_of_launches)
+
+    return uco_object.create_PropertyBundle('Application', **properties(kwargs,
+                                            application_identifier=application_identifier, version=version,
+                                            operating_system_ref=operating_system_ref,
+                                            number_of_launches=number_of_launches))
+
+
+_propbundle_ApplicationAccount = Checks('propbundle_ApplicationAccount', (
+    ('application_ref', True,  False, 'core:Trace'),
+))
+
+def propbundle_ApplicationAccount(uco_object, application_ref=MISSING, **kwargs):
+    '''
+    :param ApplicationRef: Exactly one occurrence of type Trace.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_ApplicationAccount.check(uco_object.document, application_ref)
+
+    return uco_object.create_PropertyBundle('ApplicationAccount', **properties(kwargs,
+                                            application_ref=application_ref))
+
+
+_propbundle_ArchiveFile = Checks('propbundle_ArchiveFile', (
+    ('version',      False, False, 'String'),
+    ('comment',      False, False, 'String'),
+    ('archive_type', False, False, 'String'),
+))
+
+def propbundle_ArchiveFile(uco_object, version=MISSING, comment=MISSING, archive_type=MISSING, **kwargs):
+    '''
+    :param Version: At most one value of type String.
+    :param Comment: At most one value of type String.
+    :param ArchiveType: At most one value of type String.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_ArchiveFile.check(uco_object.document, version, comment, archive_type)
+
+    return uco_object.create_PropertyBundle('ArchiveFile', **properties(kwargs, version=version,
+                                            comment=comment, archive_type=archive_type))
+
+
+def propbundle_Attachment(uco_object, url, **kwargs):
+    '''
+    :param URL: Exactly one value of type URI.
+    :return: A PropertyBundle object.
+    '''
+
+    #TODO:URL
+
+    return uco_object.create_PropertyBundle('Attachment', **properties(kwargs, url=url))
+
+
+_propbundle_Audio = Checks('propbundle_Audio', (
+    ('audio_format', False, False, 'String'),
+    ('audio_type',   False, False, 'String'),
+    ('bit_rate',     False, False, 'Long'),
+    ('duration',     False, False, 'Long'),
+))
+
+def propbundle_Audio(uco_object, audio_format=MISSING, audio_type=MISSING, bit_rate=MISSING, duration=MISSING, **kwargs):
+    '''
+    :param AudioFormat: At most one value of type String.
+    :param AudioType: At most one value of type String.
+    :param BitRate: At most one value of type Long.
+    :param Duration: At most one value of type Long.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_Audio.check(uco_object.document, audio_format, audio_type, bit_rate, duration)
+
+    return uco_object.create_PropertyBundle('Audio', **properties(kwargs, audio_format=audio_format,
+                                            audio_type=audio_type, bit_rate=bit_rate, duration=duration))
+
+
+_propbundle_Authorization = Checks('propbundle_Authorization', (
+    ('authorization_type',       True,  False, 'core:ControlledVocabulary'),
+    ('authorization_identifier', False, False, 'String'),
+))
+
+def propbundle_Authorization(uco_object, authorization_type=MISSING, authorization_identifier=MISSING, **kwargs):
+    '''
+    :param AuthorizationType: Exactly one occurrence of type ControlledVocabulary.
+    :param AuthorizationIdentifier: At least one value of type String.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_Authorization.check(uco_object.document, authorization_type, authorization_identifier)
+
+    return uco_object.create_PropertyBundle('Authorization', **properties(kwargs,
+                                            authorization_type=authorization_type,
+                                            authorization_identifier=authorization_identifier))
+
+
+_propbundle_AutonomousSystem = Checks('propbundle_AutonomousSystem', (
+    ('number',                     True,  False, 'Integer'),
+    ('as_handle',                  False, False, 'String'),
+    ('regional_internet_registry', False, False, 'core:ControlledVocabulary'),
+))
+
+def propbundle_AutonomousSystem(uco_object, number=MISSING, as_handle=MISSING,
+                                regional_internet_registry=MISSING, **kwargs):
+    '''
+    :param Number: Exactly one value of type Integer.
+    :param AsHandle: At most one value of type String.
+    :param RegionalInternetRegistry: At most one occurrence of type ControlledVocabulary.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_AutonomousSystem.check(uco_object.document, number, as_handle, regional_internet_registry)
+
+    return uco_object.create_PropertyBundle('AutonomousSystem', **properties(kwargs, number=number,
+                                            as_handle=as_handle,
+                                            regional_internet_registry=regional_internet_registry))
+
+
+_propbundle_BrowserBookmark = Checks('propbundle_BrowserBookmark', (
+    ('accessed_time',   False, False, 'Datetime'),
+    ('application_ref', False, False, 'core:Trace'),
+    ('created_time',    False, False, 'Datetime'),
+    ('modified_time',   False, False, 'Datetime'),
+    ('bookmark_path',   False, False, 'String'),
+    ('visit_count',     False, False, 'Integer'),
+))
+
+def propbundle_BrowserBookmark(uco_object, accessed_time=MISSING, application_ref=MISSING,
+                               created_time=MISSING, modified_time=MISSING, bookmark_path=MISSING,
+                               url_targeted=MISSING, visit_count=MISSING, **kwargs):
+    '''
+    :param AccessedTime: At most one value of type Datetime.
+    :param ApplicationRef: At most one occurrence of type Trace.
+    :param CreatedTime: At most one value of type Datetime.
+    :param ModifiedTime: At most one value of type Datetime.
+    :param BookmarkPath: At most one value of type String.
+    :param URLTargeted: At most one occurrence of type URL.
+    :param VisitCount: At most one value of type Integer.
+    :return: A PropertyBundle object.
+    '''
+
+    #TODO:URL
+    _propbundle_BrowserBookmark.check(uco_object.document, accessed_time, application_ref, created_time,
+                                      modified_time, bookmark_path, visit_count)
+
+    return uco_object.create_PropertyBundle('BrowserBookmark', **properties(kwargs,
+                                            accessed_time=accessed_time, application_ref=application_ref,
+                                            created_time=created_time, modified_time=modified_time,
+                                            bookmark_path=bookmark_path, url_targeted=url_targeted,
+                                            visit_count=visit_count))
+
+
+_propbundle_BrowserCookie = Checks('propbundle_BrowserCookie', (
+    ('accessed_time',   False, False, 'Datetime'),
+    ('application_ref', False, False, 'core:Trace'),
+    ('created_time',    False, False, 'Datetime'),
+    ('expiration_time', False, False, 'Datetime'),
+    ('domain_ref',      False, False, 'core:Trace'),
+    ('cookie_name',     False, False, 'String'),
+    ('cookie_path',     False, False, 'String'),
+    ('is_secure',       False, False, 'Bool'),
+))
+
+def propbundle_BrowserCookie(uco_object, accessed_time=MISSING, application_ref=MISSING,
+                             created_time=MISSING, expiration_time=MISSING, domain_ref=MISSING,
+                             cookie_name=MISSING, cookie_path=MISSING, is_secure=MISSING, **kwargs):
+    '''
+    :param AccessedTime: At most one value of type Datetime.
+    :param ApplicationRef: At most one occurrence of type Trace.
+    :param CreatedTime: At most one value of type Datetime.
+    :param ExpirationTime: At most one value of type Datetime.
+    :param DomainRef: At most one occurrence of type Trace.
+    :param CookieName: At most one value of type String.
+    :param CookiePath: At most one value of type String.
+    :param IsSecure: At most one value of type Bool.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_BrowserCookie.check(uco_object.document, accessed_time, application_ref, created_time,
+                                    expiration_time, domain_ref, cookie_name, cookie_path, is_secure)
+
+    return uco_object.create_PropertyBundle('BrowserCookie', **properties(kwargs, accessed_time=accessed_time,
+                                            application_ref=application_ref, created_time=created_time,
+                                            expiration_time=expiration_time, domain_ref=domain_ref,
+                                            cookie_name=cookie_name, cookie_path=cookie_path,
+                                            is_secure=is_secure))
+
+
+_propbundle_Build = Checks('propbundle_Build', (
+    ('build_information', True,  False, 'duck:BuildInformationType'),
+))
+
+def propbundle_Build(uco_object, build_information=MISSING, **kwargs):
+    '''
+    :param BuildInformation: Exactly one occurrence of type BuildInformationType.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_Build.check(uco_object.document, build_information)
+
+    return uco_object.create_PropertyBundle('Build', **properties(kwargs,
+                                            build_information=build_information))
+
+
+_propbundle_Calendar = Checks('propbundle_Calendar', (
+    ('application_ref', False, False, 'core:Trace'),
+    ('owner',           False, False, 'core:Trace'),
+))
+
+def propbundle_Calendar(uco_object, application_ref=MISSING, owner=MISSING, **kwargs):
+    '''
+    :param ApplicationRef: At most one occurrence of type Trace.
+    :param Owner: At most one occurrence of type Trace.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_Calendar.check(uco_object.document, application_ref, owner)
+
+    return uco_object.create_PropertyBundle('Calendar', **properties(kwargs, application_ref=application_ref,
+                                            owner=owner))
+
+
+_propbundle_CalendarEntry = Checks('propbundle_CalendarEntry', (
+    ('application_ref', False, False, 'core:Trace'),
+    ('attendant_refs',  False, True,  'core'),
+    ('categories',      False, True,  'String'),
+    ('created_time',    False, False, 'Datetime'),
+    ('modified_time',   False, False, 'Datetime'),
+    ('duration',        False, False, 'Datetime'),
+    ('end_time',        False, False, 'Datetime'),
+    ('start_time',      False, False, 'Datetime'),
+    ('labels',          False, True,  'String'),
+    ('location_ref',    False, False, 'core:Location'),
+    ('owner_ref',       False, False, 'core:Identity'),
+    ('is_private',      False, False, 'Bool'),
+    ('recurrence',      False, False, 'String'),
+    ('remind_time',     False, False, 'Datetime'),
+    ('event_status',    False, False, 'String'),
+    ('subject',         False, False, 'String'),
+    ('event_type',      False, False, 'String'),
+))
+
+def propbundle_CalendarEntry(uco_object, application_ref=MISSING, attendant_refs=MISSING,
+                             categories=MISSING, created_time=MISSING, modified_time=MISSING, duration=MISSING,
+                             end_time=MISSING, start_time=MISSING, labels=MISSING, location_ref=MISSING,
+                             owner_ref=MISSING, is_private=MISSING, recurrence=MISSING, remind_time=MISSING,
+                             event_status=MISSING, subject=MISSING, event_type=MISSING, **kwargs):
+    '''
+    :param ApplicationRef: At most one occurrence of type Trace.
+    :param AttendantRefs: Any number of occurrences of type CoreObject.
+    :param Categories: Any number of values of type String.
+    :param CreatedTime: At most one value of type Datetime.
+    :param ModifiedTime: At most one value of type Datetime.
+    :param Duration: At most one value of type Long.
+    :param EndTime: At most one value of type Datetime.
+    :param StartTime: At most one value of type Datetime.
+    :param Labels: Any number of values of type String.
+    :param LocationRef: At most one occurrence of type Location.
+    :param OwnerRef: At most one occurrence of type Identity (core).
+    :param IsPrivate: At most one value of type Bool.
+    :param Recurrence: At most one value of type String.
+    :param RemindTime: At most one value of type Datetime.
+    :param EventStatus: At most one value of type String.
+    :param Subject: At most one value of type String.
+    :param EventType: At most one value of type String.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_CalendarEntry.check(uco_object.document, application_ref, attendant_refs, categories,
+                                    created_time, modified_time, duration, end_time, start_time, labels,
+                                    location_ref, owner_ref, is_private, recurrence, remind_time,
+                                    event_status, subject, event_type)
+
+    return uco_object.create_PropertyBundle('CalendarEntry', **properties(kwargs,
+                                            application_ref=application_ref, attendant_refs=attendant_refs,
+                                            categories=categories, created_time=created_time,
+                                            modified_time=modified_time, duration=duration, end_time=end_time,
+                                            start_time=start_time, labels=labels, location_ref=location_ref,
+                                            owner_ref=owner_ref, is_private=is_private, recurrence=recurrence,
+                                            remind_time=remind_time, event_status=event_status,
+                                            subject=subject, event_type=event_type))
+
+
+_propbundle_CompressedStream = Checks('propbundle_CompressedStream', (
+    ('compression_method', False, False, 'String'),
+    ('compression_ratio',  False, False, 'Float'),
+))
+
+def propbundle_CompressedStream(uco_object, compression_method=MISSING, compression_ratio=MISSING, **kwargs):
+    '''
+    :param CompressionMethod: At most one value of type String.
+    :param CompressionRatio: At most one value of type Float.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_CompressedStream.check(uco_object.document, compression_method, compression_ratio)
+
+    return uco_object.create_PropertyBundle('CompressedStream', **properties(kwargs,
+                                            compression_method=compression_method,
+                                            compression_ratio=compression_ratio))
+
+
+_propbundle_ComputerSpecification = Checks('propbundle_ComputerSpecification', (
+    ('available_ram',          False, False, 'Long'),
+    ('bios_date',              False, False, 'Datetime'),
+    ('bios_manufacturer',      False, False, 'String'),
+    ('bios_release_date',      False, False, 'Datetime'),
+    ('bios_serial_number',     False, False, 'String'),
+    ('bios_version',           False, False, 'String'),
+    ('local_time',             False, False, 'Datetime'),
+    ('network_interface_refs', False, True,  'core:Trace'),
+    ('processor_architecture', False, False, 'String'),
+    ('cpu_family',             False, False, 'String'),
+    ('cpu',                    False, False, 'String'),
+    ('gpu_family',             False, False, 'String'),
+    ('gpu',                    False, False, 'String'),
+    ('system_time',            False, False, 'Datetime'),
+    ('timezone_dst',           False, False, 'String'),
+    ('timezone_standard',      False, False, 'String'),
+    ('total_ram',              False, False, 'Long'),
+    ('uptime',                 False, False, 'String'),
+))
+
+def propbundle_ComputerSpecification(uco_object, available_ram=MISSING, bios_date=MISSING,
+                                     bios_manufacturer=MISSING, bios_release_date=MISSING,
+                                     bios_serial_number=MISSING, bios_version=MISSING,
+                                     current_system_date=MISSING, hostname=MISSING,
+                                     local_time=MISSING, network_interface_refs=MISSING,
+                                     processor_architecture=MISSING, cpu_family=MISSING,
+                                     cpu=MISSING, gpu_family=MISSING, gpu=MISSING, system_time=MISSING,
+                                     timezone_dst=MISSING, timezone_standard=MISSING, total_ram=MISSING,
+                                     uptime=MISSING, **kwargs):
+    '''
+    :param AvailableRAM: At most one value of type Long.
+    :param BIOSDate: At most one value of type Datetime.
+    :param BIOSManufacturer: At most one value of type String.
+    :param BIOSReleaseDate: At most one value of type Datetime.
+    :param BIOSSerialNumber: At most one value of type String.
+    :param BIOSVersion: At most one value of type String.
+    :param LocalTime: At most one value of type Datetime.
+    :param NetworkInterfaceRefs: Any number of occurrences of type Trace.
+    :param ProcessorArchitecture: At most one value of type String.
+    :param CPUFamily: At most one value of type String.
+    :param CPU: At most one value of type String.
+    :param GPUFamily: At most one value of type String.
+    :param GPU: At most one value of type String.
+    :param SystemTime: At most one value of type Datetime.
+    :param TimezoneDST: At most one value of type String.
+    :param TimezoneStandard: At most one value of type String.
+    :param TotalRAM: At most one value of type Long.
+    :param Uptime: At most one value of type String.
+    :return: A PropertyBundle object.
+    '''
+
+    #TODO:Why is uptime a string? This needs further clarification. Startup time? Or total time to boot?
+    _propbundle_ComputerSpecification.check(uco_object.document, available_ram, bios_date, bios_manufacturer,
+                                            bios_release_date, bios_serial_number, bios_version, local_time,
+                                            network_interface_refs, processor_architecture, cpu_family, cpu,
+                                            gpu_family, gpu, system_time, timezone_dst, timezone_standard,
+                                            total_ram, uptime)
+
+    return uco_object.create_PropertyBundle('ComputerSpecification', **properties(kwargs,
+                                            available_ram=available_ram, bios_date=bios_date,
+                                            bios_manufacturer=bios_manufacturer,
+                                            bios_release_date=bios_release_date,
+                                            bios_serial_number=bios_serial_number, bios_version=bios_version,
+                                            current_system_date=current_system_date, hostname=hostname,
+                                            local_time=local_time,
+                                            network_interface_refs=network_interface_refs,
+                                            processor_architecture=processor_architecture,
+                                            cpu_family=cpu_family, cpu=cpu, gpu_family=gpu_family,
+                                            system_time=system_time, timezone_dst=timezone_dst,
+                                            timezone_standard=timezone_standard, total_ram=total_ram,
+                                            uptime=uptime))
+
+
+_propbundle_Confidence = Checks('propbundle_Confidence', (
+    ('value', True,  False, 'core:ControlledVocabulary'),
+))
+
+def propbundle_Confidence(uco_object, value=MISSING, **kwargs):
+    '''
+    :param Value: Exactly one occurrence of type ControlledVocabulary.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_Confidence.check(uco_object.document, value)
+
+    return uco_object.create_PropertyBundle('Confidence', **properties(kwargs, value=value))
+
+
+_propbundle_Contact = Checks('propbundle_Contact', (
+    ('application_ref',    False, False, 'core:Trace'),
+    ('contact_id',         False, False, 'String'),
+    ('email_address_refs', False, True,  'core:Trace'),
+    ('first_name',         False, False, 'String'),
+    ('last_name',          False, False, 'String'),
+    ('middle_name',        False, False, 'String'),
+    ('contact_name',       False, False, 'String'),
+    ('phone_numbers',      False, True,  'String'),
+    ('contact_type',       False, False, 'String'),
+    ('screen_name',        False, False, 'String'),
+))
+
+def propbundle_Contact(uco_object, application_ref=MISSING, contact_id=MISSING, email_address_refs=MISSING,
+                       first_name=MISSING, last_name=MISSING, middle_name=MISSING, contact_name=MISSING,
+                       phone_numbers=MISSING, contact_type=MISSING, screen_name=MISSING, **kwargs):
+    '''
+    :param ApplicationRef: At most one occurrence of type Trace.
+    :param ContactID: At most one value of type String.
+    :param EmailAddressRefs: Any number of occurrences of type Trace.
+    :param FirstName: At most one value of type String.
+    :param LastName: At most one value of type String.
+    :param MiddleName: At most one value of type String.
+    :param ContactName: At most one value of type String.
+    :param PhoneNumbers: Any number of values of type String.
+    :param ContactType: At most one value of type String.
+    :param ScreenName: At most one value of type String.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_Contact.check(uco_object.document, application_ref, contact_id, email_address_refs,
+                              first_name, last_name, middle_name, contact_name, phone_numbers, contact_type,
+                              screen_name)
+
+    return uco_object.create_PropertyBundle('Contact', **properties(kwargs, application_ref=application_ref,
+                                            contact_id=contact_id, email_address_refs=email_address_refs,
+                                            first_name=first_name, last_name=last_name,
+                                            middle_name=middle_name, contact_name=contact_name,
+                                            phone_numbers=phone_numbers, contact_type=contact_type,
+                                            screen_name=screen_name))
+
+
+_propbundle_ContentData = Checks('propbundle_ContentData', (
+    ('byte_order',           False, False, 'core:ControlledVocabulary'),
+    ('mime_class',           False, False, 'String'),
+    ('mime_type',            False, False, 'String'),
+    ('magic_number',         False, False, 'String'),
+    ('size_in_bytes',        False, False, 'Long'),
+    ('data_payload',         False, False, 'String'),
+    ('data_payload_ref_url', False, False, 'core:Trace'),
+    ('entropy',              False, False, 'Float'),
+    ('hashes',               False, True,  'duck:Hash'),
+    ('is_encrypted',         False, False, 'Bool'),
+))
+
+def propbundle_ContentData(uco_object, byte_order=MISSING, mime_class=MISSING, mime_type=MISSING,
+                           magic_number=MISSING, size_in_bytes=MISSING, data_payload=MISSING,
+                           data_payload_ref_url=MISSING, entropy=MISSING, hashes=MISSING,
+                           is_encrypted=MISSING, **kwargs):
+    '''
+    :param ByteOrder: At most one occurrence of type ControlledVocabulary.
+    :param MIMEClass: At most one value of type String.
+    :param MIMEType: At most one value of type String.
+    :param MagicNumber: At most one value of type String.
+    :param SizeInBytes: At most one value of type Long.
+    :param DataPayload: At most one value of type String.
+    :param DataPayloadRefURL: At most one occurrence of type Trace.
+    :param Entropy: At most one value of type Float.
+    :param Hashes: Any number of occurrences of type Hash.
+    :param IsEncrypted: At most one value of type Bool.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_ContentData.check(uco_object.document, byte_order, mime_class, mime_type, magic_number,
+                                  size_in_bytes, data_payload, data_payload_ref_url, entropy, hashes,
+                                  is_encrypted)
+
+    return uco_object.create_PropertyBundle('ContentData', **properties(kwargs, byte_order=byte_order,
+                                            mime_class=mime_class, mime_type=mime_type,
+                                            magic_number=magic_number, size_in_bytes=size_in_bytes,
+                                            data_payload=data_payload,
+                                            data_payload_ref_url=data_payload_ref_url, entropy=entropy,
+                                            hashes=hashes, is_encrypted=is_encrypted))
+
+
+_propbundle_Device = Checks('propbundle_Device', (
+    ('device_type',   False, False, 'core:ControlledVocabulary'),
+    ('manufacturer',  False, False, 'String'),
+    ('model',         False, False, 'String'),
+    ('serial_number', False, False, 'String'),
+))
+
+def propbundle_Device(uco_object, device_type=MISSING, manufacturer=MISSING, model=MISSING,
+                      serial_number=MISSING, **kwargs):
+    '''
+    :param DeviceType: At most one occurrence of type ControlledVocabulary.
+    :param Manufacturer: At most one value of type String.
+    :param Model: At most one value of type String.
+    :param SerialNumber: At most one value of type String.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_Device.check(uco_object.document, device_type, manufacturer, model, serial_number)
+
+    return uco_object.create_PropertyBundle('Device', **properties(kwargs, device_type=device_type,
+                                            manufacturer=manufacturer, model=model,
+                                            serial_number=serial_number))
+
+
+_propbundle_DigitalAccount = Checks('propbundle_DigitalAccount', (
+    ('account_login',    False, True,  'String'),
+    ('first_login_time', False, False, 'Datetime'),
+    ('last_login_time',  False, False, 'Datetime'),
+    ('is_disabled',      False, False, 'Bool'),
+    ('display_name',     False, False, 'String'),
+))
+
+def propbundle_DigitalAccount(uco_object, account_login=MISSING, first_login_time=MISSING,
+                              last_login_time=MISSING, is_disabled=MISSING, display_name=MISSING, **kwargs):
+    '''
+    :param AccountLogin: Any number of values of type String.
+    :param FirstLoginTime: At most one value of type Datetime.
+    :param LastLoginTime: At most one value of type Datetime.
+    :param IsDisabled: At most one value of type Bool.
+    :param DisplayName: At most one value of type String.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_DigitalAccount.check(uco_object.document, account_login, first_login_time, last_login_time,
+                                     is_disabled, display_name)
+
+    return uco_object.create_PropertyBundle('DigitalAccount', **properties(kwargs, account_login=account_login,
+                                            first_login_time=first_login_time, last_login_time=last_login_time,
+                                            is_disabled=is_disabled, display_name=display_name))
+
+
+_propbundle_DigitalSignatureInfo = Checks('propbundle_DigitalSignatureInfo', (
+    ('signature_exists',      True,  False, 'Bool'),
+    ('signature_verified',    False, False, 'Bool'),
+    ('certificate_issuer',    False, False, 'core:Identity'),
+    ('certificate_subject',   False, False, 'core:Identity'),
+    ('signature_description', False, False, 'String'),
+))
+
+def propbundle_DigitalSignatureInfo(uco_object, signature_exists=MISSING, signature_verified=MISSING,
+                                    certificate_issuer=MISSING, certificate_subject=MISSING,
+                                    signature_description=MISSING, **kwargs):
+    '''
+    :param SignatureExists: Exactly one value of type Bool.
+    :param SignatureVerified: Exactly one value of type Bool.
+    :param CertificateIssuer: At most one occurrence of type Identity (core).
+    :param CertificateSubject: At most one occurrence of type Identity (core).
+    :param SignatureDescription: At most one value of type String.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_DigitalSignatureInfo.check(uco_object.document, signature_exists, signature_verified,
+                                           certificate_issuer, certificate_subject, signature_description)
+
+    return uco_object.create_PropertyBundle('DigitalSignatureInfo', **properties(kwargs,
+                                            signature_exists=signature_exists,
+                                            signature_verified=signature_verified,
+                                            certificate_issuer=certificate_issuer,
+                                            certificate_subject=certificate_subject,
+                                            signature_description=signature_description))
+
+
+_propbundle_Disk = Checks('propbundle_Disk', (
+    ('disk_size',      False, False, 'Long'),
+    ('disk_type',      False, False, 'duck:ControlledDictionary'),
+    ('free_space',     False, False, 'Long'),
+    ('partition_refs', False, False, 'core:Trace'),
+))
+
+def propbundle_Disk(uco_object, disk_size=MISSING, disk_type=MISSING, free_space=MISSING,
+                    partition_refs=MISSING, **kwargs):
+    '''
+    :param DiskSize: At most one value of type Long.
+    :param DiskType: At most one occurrence of type ControlledVocabulary.
+    :param FreeSpace: At most one value of type Long.
+    :param PartitionRefs: Any number of occurrences of type Trace.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_Disk.check(uco_object.document, disk_size, disk_type, free_space, partition_refs)
+
+    return uco_object.create_PropertyBundle('Disk', **properties(kwargs, disk_size=disk_size,
+                                            disk_type=disk_type, free_space=free_space,
+                                            partition_refs=partition_refs))
+
+
+_propbundle_DiskPartition = Checks('propbundle_DiskPartition', (
+    ('mount_point',         False, False, 'String'),
+    ('partition_id',        False, False, 'Integer'),
+    ('partition_length',    False, False, 'Long'),
+    ('partition_offset',    False, False, 'Long'),
+    ('space_left',          False, False, 'Long'),
+    ('space_used',          False, False, 'Long'),
+    ('total_space',         False, False, 'Long'),
+    ('disk_partition_type', False, False, 'duck:ControlledDictionary'),
+    ('created_time',        False, False, 'Datetime'),
+))
+
+def propbundle_DiskPartition(uco_object, mount_point=MISSING, partition_id=MISSING, partition_length=MISSING,
+                             partition_offset=MISSING, space_left=MISSING, space_used=MISSING,
+                             total_space=MISSING, disk_partition_type=MISSING, created_time=MISSING, **kwargs):
+    '''
+    :param MountPoint: At most one value of type String.
+    :param PartitionID: At most one value of type Integer.
+    :param PartitionLength: At most one value of type Long.
+    :param PartitionOffset: At most one value of type Long.
+    :param SpaceLeft: At most one value of type Long.
+    :param SpaceUsed: At most one value of type Long.
+    :param TotalSpace: At most one value of type Long.
+    :param DiskPartitionType: At most one occurrence of type ControlledVocabulary.
+    :param CreatedTime: At most one value of type Datetime.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_DiskPartition.check(uco_object.document, mount_point, partition_id, partition_length,
+                                    partition_offset, space_left, space_used, total_space,
+                                    disk_partition_type, created_time)
+
+    return uco_object.create_PropertyBundle('DiskPartition', **properties(kwargs, mount_point=mount_point,
+                                            partition_id=partition_id, partition_length=partition_length,
+                                            partition_offset=partition_offset, space_left=space_left,
+                                            space_used=space_used, total_space=total_space,
+                                            disk_partition_type=disk_partition_type,
+                                            created_time=created_time))
+
+
+_propbundle_DomainName = Checks('propbundle_DomainName', (
+    ('value',  True,  False, 'String'),
+    ('is_tld', False, False, 'Bool'),
+))
+
+def propbundle_DomainName(uco_object, value=MISSING, is_tld=MISSING, **kwargs):
+    '''
+    :param Value: Exactly one value of type String.
+    :param IsTLD: At most one value of type Bool.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_DomainName.check(uco_object.document, value, is_tld)
+
+    return uco_object.create_PropertyBundle('DomainName', **properties(kwargs, value=value, is_tld=is_tld))
+
+
+_propbundle_EmailAccount = Checks('propbundle_EmailAccount', (
+    ('email_address_ref', True,  False, 'core:Trace'),
+))
+
+def propbundle_EmailAccount(uco_object, email_address_ref=MISSING, **kwargs):
+    '''
+    :param EmailAddressRef: Exactly one occurrence of type Trace.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_EmailAccount.check(uco_object.document, email_address_ref)
+
+    return uco_object.create_PropertyBundle('EmailAccount', **properties(kwargs,
+                                            email_address_ref=email_address_ref))
+
+
+_propbundle_EmailAddress = Checks('propbundle_EmailAddress', (
+    ('value',        True,  False, 'String'),
+    ('display_name', False, False, 'String'),
+))
+
+def propbundle_EmailAddress(uco_object, value=MISSING, display_name=MISSING, **kwargs):
+    '''
+    :param Value: Exactly one value of type String.
+    :param DisplayName: At most one value of type String.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_EmailAddress.check(uco_object.document, value, display_name)
+
+    return uco_object.create_PropertyBundle('EmailAddress', **properties(kwargs, value=value,
+                                            display_name=display_name))
+
+
+_propbundle_EmailMessage = Checks('propbundle_EmailMessage', (
+    ('is_mime_encoded',     True,  False, 'Bool'),
+    ('is_multipart',        True,  False, 'Bool'),
+    ('application_ref',     False, False, 'core:Trace'),
+    ('bcc_refs',            False, True,  'core:Trace'),
+    ('cc_refs',             False, True,  'core:Trace'),
+    ('body',                False, False, 'String'),
+    ('body_multipart',      False, True,  'duck:MIMEPartType'),
+    ('body_raw_ref',        False, False, 'core:Trace'),
+    ('categories',          False, True,  'String'),
+    ('content_disposition', False, False, 'String'),
+    ('content_type',        False, False, 'String'),
+    ('from_ref',            False, False, 'core:Trace'),
+    ('to_refs',             False, True,  'core:Trace'),
+    ('header_raw_ref',      False, False, 'core:Trace'),
+    ('in_reply_to_refs',    False, False, 'core:Trace'),
+    ('is_read',             False, False, 'Bool'),
+    ('labels',              False, True,  'String'),
+    ('message_id_ref',      False, False, 'core:Trace'),
+    ('modified_time',       False, False, 'Datetime'),
+    ('other_headers',       False, False, 'duck:Dictionary'),
+    ('priority',            False, False, 'String'),
+    ('received_lines',      False, True,  'String'),
+    ('received_time',       False, False, 'Datetime'),
+    ('references',          False, True,  'core:Trace'),
+    ('sender_ref',          False, False, 'core:Trace'),
+    ('sent_time',           False, False, 'Datetime'),
+    ('subject',             False, False, 'String'),
+    ('x_mailer',            False, False, 'String'),
+    ('x_originating_ip',    False, False, 'core:Trace'),
+))
+
+def propbundle_EmailMessage(uco_object, is_mime_encoded=MISSING, is_multipart=MISSING,
+                            application_ref=MISSING, bcc_refs=MISSING, cc_refs=MISSING, body=MISSING,
+                            body_multipart=MISSING, body_raw_ref=MISSING, categories=MISSING,
+                            content_disposition=MISSING, content_type=MISSING, from_ref=MISSING,
+                            to_refs=MISSING, header_raw_ref=MISSING, in_reply_to_refs=MISSING, is_read=MISSING,
+                            labels=MISSING, message_id_ref=MISSING, modified_time=MISSING,
+                            other_headers=MISSING, priority=MISSING, received_lines=MISSING,
+                            received_time=MISSING, references=MISSING, sender_ref=MISSING,
+                            sent_time=MISSING, subject=MISSING, x_mailer=MISSING, x_originating_ip=MISSING, **kwargs):
+    '''
+    :param IsMIMEEncoded: Exactly one value of type Bool.
+    :param IsMultipart: Exactly one value of type Bool.
+    :param ApplicationRef: At most one occurrence of type Trace.
+    :param BCCRefs: Any number of occurrences of type Trace.
+    :param CCRefs: Any number of occurrences of type Trace.
+    :param Body: At most one value of type String.
+    :param BodyMultipart: Any number of occurrences of type MIMEPartType.
+    :param BodyRawRef: At most one occurrence of type Trace.
+    :param Categories: Any number of values of type String.
+    :param ContentDisposition: At most one value of type String.
+    :param ContentType: At most one value of type String.
+    :param FromRef: At most one occurrence of type Trace.
+    :param ToRefs: Any number of occurrences of type Trace.
+    :param HeaderRawRef: At most one occurrence of type Trace.
+    :param InReplyToRefs: At most one occurrence of type Trace.
+    :param IsRead: At most one value of type Bool.
+    :param Labels: Any number of values of type String.
+    :param MessageIDRef: At most one occurrence of type Trace.
+    :param ModifiedTime: At most one value of type Datetime.
+    :param OtherHeaders: At most one occurrence of type Dictionary.
+    :param Priority: At most one value of type String.
+    :param ReceivedLines: Any number of values of type String.
+    :param ReceivedTime: At most one value of type Datetime.
+    :param References: Any number of occurrences of type Trace.
+    :param SenderRef: At most one occurrence of type Trace.
+    :param SentTime: At most one value of type Datetime.
+    :param Subject: At most one value of type String.
+    :param xMailer: At most one value of type String.
+    :param xOriginatingIP: At most one occurrence of type Trace.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_EmailMessage.check(uco_object.document, is_mime_encoded, is_multipart, application_ref,
+                                   bcc_refs, cc_refs, body, body_multipart, body_raw_ref, categories,
+                                   content_disposition, content_type, from_ref, to_refs, header_raw_ref,
+                                   in_reply_to_refs, is_read, labels, message_id_ref, modified_time,
+                                   other_headers, priority, received_lines, received_time, references,
+                                   sender_ref, sent_time, subject, x_mailer, x_originating_ip)
+
+    return uco_object.create_PropertyBundle('EmailMessage', **properties(kwargs,
+                                            is_mime_encoded=is_mime_encoded, is_multipart=is_multipart,
+                                            application_ref=application_ref, bcc_refs=bcc_refs,
+                                            cc_refs=cc_refs, body=body, body_multipart=body_multipart,
+                                            body_raw_ref=body_raw_ref, categories=categories,
+                                            content_disposition=content_disposition, content_type=content_type,
+                                            from_ref=from_ref, to_refs=to_refs, header_raw_ref=header_raw_ref,
+                                            in_reply_to_refs=in_reply_to_refs, is_read=is_read, labels=labels,
+                                            message_id_ref=message_id_ref, modified_time=modified_time,
+                                            other_headers=other_headers, priority=priority,
+                                            received_lines=received_lines, received_time=received_time,
+                                            references=references, sender_ref=sender_ref, sent_time=sent_time,
+                                            subject=subject, x_mailer=x_mailer,
+                                            x_originating_ip=x_originating_ip))
+
+
+_propbundle_EncodedStream = Checks('propbundle_EncodedStream', (
+    ('encoding_method', True,  False, 'String'),
+))
+
+def propbundle_EncodedStream(uco_object, encoding_method=MISSING, **kwargs):
+    '''
+    :param EncodingMethod: Exactly one value of type String.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_EncodedStream.check(uco_object.document, encoding_method)
+
+    return uco_object.create_PropertyBundle('EncodedStream', **properties(kwargs,
+                                            encoding_method=encoding_method))
+
+
+_propbundle_EncryptedStream = Checks('propbundle_EncryptedStream', (
+    ('encryption_method', False, False, 'core:ControlledVocabulary'),
+    ('encryption_mode',   False, False, 'core:ControlledVocabulary'),
+))
+
+def propbundle_EncryptedStream(uco_object, encryption_iv=MISSING, encryption_key=MISSING,
+                               encryption_method=MISSING, encryption_mode=MISSING, **kwargs):
+    '''
+    :param EncryptionIV: At most one value of type HexBinary.
+    :param EncryptionKey: At most one value of type HexBinary.
+    :param EncryptionMethod: At most one occurrence of type ControlledVocabulary.
+    :param EncryptionMode: At most one occurrence of type ControlledVocabulary.
+    :return: A PropertyBundle object.
+    '''
+
+    #TODO:HexBinary
+    #TODO:HexBinary
+    _propbundle_EncryptedStream.check(uco_object.document, encryption_method, encryption_mode)
+
+    return uco_object.create_PropertyBundle('EncryptedStream', **properties(kwargs,
+                                            encryption_iv=encryption_iv, encryption_key=encryption_key,
+                                            encryption_method=encryption_method,
+                                            encryption_mode=encryption_mode))
+
+
+def propbundle_EnvironmentVariable(uco_object, name=MISSING, value=MISSING, **kwargs):
+    '''
+    :param Name: Exactly one value of any type.
+    :param Value: At most one value of any type.
+    :return: A PropertyBundle object.
+    '''
+
+    #TODO:NothingElseToCheck
+
+    return uco_object.create_PropertyBundle('EnvironmentVariable', **properties(kwargs, name=name,
+                                            value=value))
+
+
+_propbundle_Event = Checks('propbundle_Event', (
+    ('application_ref', True,  False, 'core:Trace'),
+    ('categories',      False, True,  'String'),
+    ('computer_name',   False, False, 'String'),
+    ('created_time',    False, False, 'Datetime'),
+    ('event_id',        False, False, 'String'),
+    ('event_text',      False, False, 'String'),
+    ('event_type',      False, False, 'String'),
+))
+
+def propbundle_Event(uco_object, application_ref=MISSING, cyber_action_ref=MISSING, categories=MISSING,
+                     computer_name=MISSING, created_time=MISSING, event_id=MISSING, event_text=MISSING,
+                     event_type=MISSING, **kwargs):
+    '''
+    :param ApplicationRef: Exactly one occurrence of type Trace.
+    :param CyberActionRef: At most one occurrence of type CyberAction.
+    :param Categories: Any number of values of type String.
+    :param ComputerName: At most one value of type String.
+    :param CreatedTime: At most one value type Datetime.
+    :param EventID: At most one value of type String.
+    :param EventText: At most one value of type String.
+    :param EventType: At most one value of type String.
+    :return: A PropertyBundle object.
+    '''
+
+    #TODO:CyberAction
+    _propbundle_Event.check(uco_object.document, application_ref, categories, computer_name, created_time,
+                            event_id, event_text, event_type)
+
+    return uco_object.create_PropertyBundle('Event', **properties(kwargs, application_ref=application_ref,
+                                            cyber_action_ref=cyber_action_ref, categories=categories,
+                                            computer_name=computer_name, created_time=created_time,
+                                            event_id=event_id, event_text=event_text, event_type=event_type))
+
+
+_propbundle_EXIF = Checks('propbundle_EXIF', (
+    ('exif_data', True,  True,  'duck:ControlledDictionary'),
+))
+
+def propbundle_EXIF(uco_object, exif_data=MISSING, **kwargs):
+    '''
+    :param EXIFData: At least one occurrence of type ControlledDictionary.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_EXIF.check(uco_object.document, exif_data)
+
+    return uco_object.create_PropertyBundle('EXIF', **properties(kwargs, exif_data=exif_data))
+
+
+_propbundle_ExtInode = Checks('propbundle_ExtInode', (
+    ('inode_id',          False, False, 'Integer'),
+    ('file_type',         False, False, 'Integer'),
+    ('deletion_time',     False, False, 'Datetime'),
+    ('inode_change_time', False, False, 'Datetime'),
+    ('permissions',       False, False, 'Integer'),
+    ('sgid',              False, False, 'Integer'),
+    ('suid',              False, False, 'Integer'),
+    ('flags',             False, False, 'Integer'),
+    ('hard_link_count',   False, False, 'Integer'),
+))
+
+def propbundle_ExtInode(uco_object, inode_id=MISSING, file_type=MISSING, deletion_time=MISSING,
+                        inode_change_time=MISSING, permissions=MISSING, sgid=MISSING, suid=MISSING,
+                        flags=MISSING, hard_link_count=MISSING, **kwargs):
+    '''
+    :param InodeID: At most one value of type Integer.
+    :param FileType: At most one value of type Integer.
+    :param DeletionTime: At most one value of type Datetime.
+    :param InodeChangeTime: At most one value of type Datetime.
+    :param Permissions: At most one value of type Integer.
+    :param SGID: At most one value of type Integer.
+    :param SUID: At most one value of type Integer.
+    :param Flags: At most one value of type Integer.
+    :param HardLinkCount: At most one value of type Integer.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_ExtInode.check(uco_object.document, inode_id, file_type, deletion_time, inode_change_time,
+                               permissions, sgid, suid, flags, hard_link_count)
+
+    return uco_object.create_PropertyBundle('ExtInode', **properties(kwargs, inode_id=inode_id,
+                                            file_type=file_type, deletion_time=deletion_time,
+                                            inode_change_time=inode_change_time, permissions=permissions,
+                                            sgid=sgid, suid=suid, flags=flags,
+                                            hard_link_count=hard_link_count))
+
+
+_propbundle_ExtractedStrings = Checks('propbundle_ExtractedStrings', (
+    ('strings', True,  True,  'String'),
+))
+
+def propbundle_ExtractedStrings(uco_object, strings=MISSING, **kwargs):
+    '''
+    :param Strings: At least one occurrence of type String.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_ExtractedStrings.check(uco_object.document, strings)
+
+    return uco_object.create_PropertyBundle('ExtInode', **properties(kwargs, strings=strings))
+
+
+_propbundle_File = Checks('propbundle_File', (
+    ('is_directory',         False, True,  'Bool'),
+    ('filename',             False, True,  'String'),
+    ('filesystem_type',      False, False, 'core:ControlledVocabulary'),
+    ('created_time',         False, False, 'Datetime'),
+    ('modified_time',        False, False, 'Datetime'),
+    ('accessed_time',        False, False, 'Datetime'),
+    ('metadata_change_time', False, False, 'Datetime'),
+    ('extension',            False, False, 'String'),
+    ('size_in_bytes',        False, False, 'Integer'),
+))
+
+def propbundle_File(uco_object, is_directory=MISSING, filename=MISSING, filepath=MISSING,
+                    filesystem_type=MISSING, created_time=MISSING, modified_time=MISSING,
+                    accessed_time=MISSING, metadata_change_time=MISSING, extension=MISSING,
+                    size_in_bytes=MISSING, **kwargs):
+    '''
+    :param IsDirectory: Any number of values of type Bool.
+    :param Filename: Any number of values of type String.
+    :param Filepath: Any number of values of type String.
+    :param FilesystemType: At most one occurrence of type ControlledVocabulary.
+    :param CreatedTime: At most one value of type Datetime.
+    :param ModifiedTime: At most one value of type Datetime.
+    :param AccessedTime: At most one value of type Datetime.
+    :param MetadataChangeTime: At most one value of type Datetime.
+    :param Extension: At most one value of type String.
+    :param SizeInBytes: At most one value of type Integer.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_File.check(uco_object.document, is_directory, filename, filesystem_type, created_time,
+                           modified_time, accessed_time, metadata_change_time, extension, size_in_bytes)
+
+    return uco_object.create_PropertyBundle('File', **properties(kwargs, is_directory=is_directory,
+                                            filename=filename, filepath=filepath,
+                                            filesystem_type=filesystem_type, created_time=created_time,
+                                            modified_time=modified_time, accessed_time=accessed_time,
+                                            metadata_change_time=metadata_change_time, extension=extension,
+                                            size_in_bytes=size_in_bytes))
+
+
+_propbundle_FilePermissions = Checks('propbundle_FilePermissions', (
+    ('owner_ref', True,  False, 'core:Trace'),
+))
+
+def propbundle_FilePermissions(uco_object, owner_ref=MISSING, **kwargs):
+    '''
+    :param OwnerRef: Exactly one occurrence of type Trace.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_FilePermissions.check(uco_object.document, owner_ref)
+
+    return uco_object.create_PropertyBundle('FilePermissions', **properties(kwargs, owner_ref=owner_ref))
+
+
+_propbundle_Filesystem = Checks('propbundle_Filesystem', (
+    ('filesystem_type', False, False, 'core:ControlledVocabulary'),
+    ('cluster_size',    False, False, 'Integer'),
+))
+
+def propbundle_Filesystem(uco_object, filesystem_type=MISSING, cluster_size=MISSING, **kwargs):
+    '''
+    :param FilesystemType: At most one occurrence of type ControlledVocabulary.
+    :param ClusterSize: At most one value of type Integer.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_Filesystem.check(uco_object.document, filesystem_type, cluster_size)
+
+    return uco_object.create_PropertyBundle('Filesystem', **properties(kwargs, filesystem_type=filesystem_type,
+                                            cluster_size=cluster_size))
+
+
+_propbundle_Fragment = Checks('propbundle_Fragment', (
+    ('fragment_index',  False, True,  'Integer'),
+    ('total_fragments', False, True,  'Integer'),
+))
+
+def propbundle_Fragment(uco_object, fragment_index=MISSING, total_fragments=MISSING, **kwargs):
+    '''
+    :param FragmentIndex: Any number of values of type Integer.
+    :param TotalFragments: Any number of values of type Integer.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_Fragment.check(uco_object.document, fragment_index, total_fragments)
+
+    return uco_object.create_PropertyBundle('Fragment', **properties(kwargs, fragment_index=fragment_index,
+                                            total_fragments=total_fragments))
+
+
+_propbundle_GeolocationEntry = Checks('propbundle_GeolocationEntry', (
+    ('application_ref', True,  False, 'core:Trace'),
+    ('created_time',    False, False, 'Datetime'),
+    ('location_ref',    False, False, 'core:Location'),
+))
+
+def propbundle_GeolocationEntry(uco_object, application_ref=MISSING, created_time=MISSING, location_ref=MISSING, **kwargs):
+    '''
+    :param ApplicationRef: Exactly one occurrence of type Trace.
+    :param CreatedTime: At most one value of type Datetime.
+    :param LocationRef: At most one occurrence of type Location.
+    '''
+
+    _propbundle_GeolocationEntry.check(uco_object.document, application_ref, created_time, location_ref)
+
+    return uco_object.create_PropertyBundle('GeolocationEntry', **properties(kwargs,
+                                            application_ref=application_ref, created_time=created_time,
+                                            location_ref=location_ref))
+
+
+_propbundle_GeolocationLog = Checks('propbundle_GeolocationLog', (
+    ('application_ref', True,  False, 'core:Trace'),
+    ('created_time',    False, False, 'Datetime'),
+))
+
+def propbundle_GeolocationLog(uco_object, application_ref=MISSING, created_time=MISSING, **kwargs):
+    '''
+    :param ApplicationRef: Exactly one occurrence of type Trace.
+    :param CreatedTime: At most one value of type Datetime.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_GeolocationLog.check(uco_object.document, application_ref, created_time)
+
+    return uco_object.create_PropertyBundle('GeolocationLog', **properties(kwargs,
+                                            application_ref=application_ref, created_time=created_time))
+
+
+_propbundle_GeolocationTrack = Checks('propbundle_GeolocationTrack', (
+    ('application_ref',        True,  False, 'core:Trace'),
+    ('start_time',             False, False, 'Datetime'),
+    ('end_time',               False, False, 'Datetime'),
+    ('geolocation_entry_refs', False, True,  'core:Trace'),
+))
+
+def propbundle_GeolocationTrack(uco_object, application_ref=MISSING, start_time=MISSING,
+                                end_time=MISSING, geolocation_entry_refs=MISSING, **kwargs):
+    '''
+    :param ApplicationRef: Exactly one occurrence of type Trace.
+    :param StartTime: At most one value of type Datetime.
+    :param EndTime: At most one value of type Datetime.
+    :param GeolocationEntryRefs: Any number of occurrences of type Trace.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_GeolocationTrack.check(uco_object.document, application_ref, start_time, end_time,
+                                       geolocation_entry_refs)
+
+    return uco_object.create_PropertyBundle('Geolocation', **properties(kwargs,
+                                            application_ref=application_ref, end_time=end_time,
+                                            geolocation_entry_refs=geolocation_entry_refs,
+                                            start_time=start_time))
+
+
+_propbundle_GPSCoordinates = Checks('propbundle_GPSCoordinates', (
+    ('hdop', False, False, 'Float'),
+    ('pdop', False, False, 'Float'),
+    ('tdop', False, False, 'Float'),
+    ('vdop', False, False, 'Float'),
+))
+
+def propbundle_GPSCoordinates(uco_object, hdop=MISSING, pdop=MISSING, tdop=MISSING, vdop=MISSING, **kwargs):
+    '''
+    :param HDOP: At most one value of type Float.
+    :param PDOP: At most one value of type Float.
+    :param TDOP: At most one value of type Float.
+    :param VDOP: At most one value of type Float.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_GPSCoordinates.check(uco_object.document, hdop, pdop, tdop, vdop)
+
+    return uco_object.create_PropertyBundle('GPSCoordinates', **properties(kwargs, hdop=hdop, pdop=pdop,
+                                            tdop=tdop, vdop=vdop))
+
+
+_propbundle_HTTPConnection = Checks('propbundle_HTTPConnection', (
+    ('request_method',             True,  False, 'String'),
+    ('request_value',              True,  False, 'String'),
+    ('http_request_header',        False, False, 'String'),
+    ('http_request_version',       False, False, 'String'),
+    ('http_message_body_length',   False, False, 'Integer'),
+    ('http_message_body_data_ref', False, False, 'core:Trace'),
+))
+
+def propbundle_HTTPConnection(uco_object, request_method=MISSING, request_value=MISSING,
+                              http_request_version=MISSING, http_request_header=MISSING
+                              , http_message_body_length=MISSING, http_message_body_data_ref=MISSING, **kwargs):
+    '''
+    :param RequestMethod: Exactly one value of type String.
+    :param RequestValue: Exactly one value of type String.
+    :param RequestVersion: At most one value of type String.
+    :param HTTPRequestVersion: At most one value of type String.
+    :param HTTPMessageBodyLength: At most one value of type Integer.
+    :param HTTPMessageBodyDataRef: At most one occurrence of type Trace.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_HTTPConnection.check(uco_object.document, request_method, request_value, http_request_header,
+                                     http_request_version, http_message_body_length,
+                                     http_message_body_data_ref)
+
+    return uco_object.create_PropertyBundle('HTTPConnection', **properties(kwargs,
+                                            request_method=request_method, request_value=request_value,
+                                            http_request_header=http_request_header,
+                                            http_request_version=http_request_version,
+                                            http_message_body_length=http_message_body_length,
+                                            http_message_body_data_ref=http_message_body_data_ref))
+
+
+def propbundle_ICMPConnection(uco_object, icmp_type=MISSING, icmp_code=MISSING, **kwargs):
+    '''
+    :param ICMPType: Exactly one value of type HexBinary.
+    :param ICMPCode: Exactly one value of tpye HexBinary.
+    :return: A PropertyBundle object.
+    '''
+
+    #TODO:HexBinary
+    #TODO:HexBinary
+
+    return uco_object.create_PropertyBundle('ICMPConnection', **properties(kwargs, icmp_type=icmp_type,
+                                            icmp_code=icmp_code))
+
+
+def propbundle_Identity(uco_object, **kwargs):
+    '''
+    :return: A PropertyBundle object.
+    '''
+
+    #TODO:NothingElseToCheck
+
+    return uco_object.create_PropertyBundle('Identity', **kwargs)
+
+
+_propbundle_Image = Checks('propbundle_Image', (
+    ('image_type', True,  False, 'String'),
+))
+
+def propbundle_Image(uco_object, image_type=MISSING, **kwargs):
+    '''
+    :param ImageType: Exactly one value of type String.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_Image.check(uco_object.document, image_type)
+
+    return uco_object.create_PropertyBundle('Image', **properties(kwargs, image_type=image_type))
+
+
+_propbundle_IPV4Address = Checks('propbundle_IPV4Address', (
+    ('value', True,  False, 'String'),
+))
+
+def propbundle_IPV4Address(uco_object, value=MISSING, **kwargs):
+    '''
+    :param Value: Exactly one value of type String.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_IPV4Address.check(uco_object.document, value)
+
+    return uco_object.create_PropertyBundle('IPV4Address', **properties(kwargs, value=value))
+
+
+_propbundle_IPV6Address = Checks('propbundle_IPV6Address', (
+    ('value', True,  False, 'String'),
+))
+
+def propbundle_IPV6Address(uco_object, value=MISSING, **kwargs):
+    '''
+    :param Value: Exactly one value of type String.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_IPV6Address.check(uco_object.document, value)
+
+    return uco_object.create_PropertyBundle('IPV6Address', **properties(kwargs, value=value))
+
+
+_propbundle_LatLongCoordinates = Checks('propbundle_LatLongCoordinates', (
+    ('latitude',  False, False, 'Float'),
+    ('longitude', False, False, 'Float'),
+    ('altitude',  False, False, 'Float'),
+))
+
+def propbundle_LatLongCoordinates(uco_object, latitude=MISSING, longitude=MISSING, altitude=MISSING, **kwargs):
+    '''
+    :param Latitude: At most one value of type Float.
+    :param Longitude: At most one value of type Float.
+    :param Altitude: At most one value of type Float.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_LatLongCoordinates.check(uco_object.document, latitude, longitude, altitude)
+
+    return uco_object.create_PropertyBundle('LatLongCoordinates', **properties(kwargs, latitude=latitude,
+                                            longitude=longitude, altitude=altitude))
+
+
+_propbundle_Library = Checks('propbundle_Library', (
+    ('library_type', True,  False, 'core:ControlledVocabulary'),
+))
+
+def propbundle_Library(uco_object, library_type=MISSING, **kwargs):
+    '''
+    :param LibraryType: Exactly one occurrence of type ControlledVocabulary.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_Library.check(uco_object.document, library_type)
+
+    return uco_object.create_PropertyBundle('Library', **properties(kwargs, library_type=library_type))
+
+
+_propbundle_MACAddress = Checks('propbundle_MACAddress', (
+    ('value', True,  False, 'Bool'),
+))
+
+def propbundle_MACAddress(uco_object, value=MISSING, **kwargs):
+    '''
+    :param Value: Exactly one value of type String.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_MACAddress.check(uco_object.document, value)
+
+    return uco_object.create_PropertyBundle('MACAddress', **properties(kwargs, value=value))
+
+
+_propbundle_Memory = Checks('propbundle_Memory', (
+    ('is_injected',  True,  False, 'Bool'),
+    ('is_mapped',    True,  False, 'Bool'),
+    ('is_protected', True,  False, 'Bool'),
+    ('is_volatile',  True,  False, 'Bool'),
+))
+
+def propbundle_Memory(uco_object, is_injected=MISSING, is_mapped=MISSING, is_protected=MISSING,
+                      is_volatile=MISSING, region_size=MISSING, region_start_address=MISSING,
+                      region_end_address=MISSING, **kwargs):
+    '''
+    :param IsInjected: Exactly one value of type Bool.
+    :param IsMapped: Exactly one value of type Bool.
+    :param IsProtected: Exactly one value of type Bool.
+    :param IsVolatile: Exactly one value of type Bool.
+    :param RegionSize: At most one value of any type.
+    :param RegionStartAddress: At most one value of type HexBinary.
+    :param RegionEndAddress: At most one value of type Hexbinary.
+    :return: A PropertyBundle object.
+    '''
+
+    #NOCHECK:region_size
+    #TODO:HexBinary
+    #TODO:HexBinary
+    _propbundle_Memory.check(uco_object.document, is_injected, is_mapped, is_protected, is_volatile)
+
+    return uco_object.create_PropertyBundle('Memory', **properties(kwargs, is_injected=is_injected,
+                                            is_mapped=is_mapped, is_protected=is_protected,
+                                            is_volatile=is_volatile, region_size=region_size,
+                                            region_start_address=region_start_address,
+                                            region_end_address=region_end_address))
+
+
+_propbundle_Message = Checks('propbundle_Message', (
+    ('application_ref',  False, False, 'core:Trace'),
+    ('from_ref',         False, False, 'core:Trace'),
+    ('to_refs',          False, True,  'core:Trace'),
+    ('message_text',     False, False, 'String'),
+    ('message_id',       False, False, 'String'),
+    ('message_type',     False, False, 'String'),
+    ('session_id',       False, False, 'String'),
+    ('sent_time',        False, False, 'Datetime'),
+    ('participant_refs', False, True,  'core:Trace'),
+))
+
+def propbundle_Message(uco_object, application_ref=MISSING, from_ref=MISSING,
+                       to_refs=MISSING, message_text=MISSING, message_id=MISSING,
+                       message_type=MISSING, session_id=MISSING, sent_time=MISSING,
+                       participant_refs=MISSING, **kwargs):
+    '''
+    :param ApplicationRef: At most one occurrence of type Trace.
+    :param FromRef: At most one occurrence of type Trace.
+    :param ToRefs: Any number of occurrences of type Trace.
+    :param MessageText: At most one value of type String.
+    :param MessageID: At most one value of type String.
+    :param MessageType: At most one value of type String.
+    :param SessionID: At most one value of type String.
+    :param SentTime: At most one value of type Datetime.
+    :param ParticipantRefs: Any number of occurrences of type Trace.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_Message.check(uco_object.document, application_ref, from_ref, to_refs, message_text,
+                              message_id, message_type, session_id, sent_time, participant_refs)
+
+    return uco_object.create_PropertyBundle('Message', **properties(kwargs, application_ref=application_ref,
+                                            from_ref=from_ref, to_refs=to_refs, message_text=message_text,
+                                            message_id=message_id, message_type=message_type,
+                                            session_id=session_id, sent_time=sent_time,
+                                            participant_refs=participant_refs))
+
+
+_propbundle_MessageThread = Checks('propbundle_MessageThread', (
+    ('message_refs',     False, True,  'duck:ArrayOfObject'),
+    ('visibility',       False, False, 'Bool'),
+    ('participant_refs', False, True,  'core:Trace'),
+))
+
+def propbundle_MessageThread(uco_object, message_refs=MISSING, visibility=MISSING, participant_refs=MISSING, **kwargs):
+    '''
+    :param MessageRefs: Any number of occurrences of type ArrayOfObject.
+    :param Visibility: At most one value of type Bool.
+    :param ParticipantRefs: Any number of occurrences of type Trace.
+    '''
+
+    _propbundle_MessageThread.check(uco_object.document, message_refs, visibility, participant_refs)
+
+    return uco_object.create_PropertyBundle('MessageThread', **properties(kwargs, message_refs=message_refs,
+                                            visibility=visibility, participant_refs=participant_refs))
+
+
+_propbundle_MFTRecord = Checks('propbundle_MFTRecord', (
+    ('mft_file_id',                     False, False, 'Integer'),
+    ('mft_parent_id',                   False, False, 'Integer'),
+    ('ntfs_hard_link_count',            False, False, 'Integer'),
+    ('mft_record_change_time',          False, False, 'Datetime'),
+    ('ntfs_owner_sid',                  False, False, 'String'),
+    ('ntfs_owner_id',                   False, False, 'String'),
+    ('mft_flags',                       False, False, 'Integer'),
+    ('mft_filename_created_time',       False, False, 'Datetime'),
+    ('mft_filename_modified_time',      False, False, 'Datetime'),
+    ('mft_filename_accessed_time',      False, False, 'Datetime'),
+    ('mft_filename_record_change_time', False, False, 'Datetime'),
+    ('mft_filename_length',             False, False, 'Integer'),
+))
+
+def propbundle_MFTRecord(uco_object, mft_file_id=MISSING, mft_parent_id=MISSING, ntfs_hard_link_count=MISSING,
+                         mft_record_change_time=MISSING, ntfs_owner_sid=MISSING, ntfs_owner_id=MISSING,
+                         mft_flags=MISSING, mft_filename_created_time=MISSING, mft_filename_modified_time=MISSING,
+                         mft_filename_accessed_time=MISSING, mft_filename_record_change_time=MISSING,
+                         mft_filename_length=MISSING, **kwargs):
+    '''
+    :param MFTFileID: At most one value of type Integer.
+    :param MFTParentID: At most one value of type Integer.
+    :param NTFSHardLinkCount: At most one value of type Integer.
+    :param MFTRecordChangeTime: At most one value of type Datetime.
+    :param NTFSOwnerSID: At most one value of type String.
+    :param NTFSOwnerID: At most one value of type String.
+    :param MFTFlags: At most one value of type Integer.
+    :param MFTFilenameCreatedTime: At most one value of type Datetime.
+    :param MFTFilenameModifiedTime: At most one value of type Datetime.
+    :param MFTFilenameAccessedTime: At most one value of type Datetime.
+    :param MFTFilenameRecordChangeTime: At most one value of type Datetime.
+    :param MFTFilenameLength: At most one value of type Integer.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_MFTRecord.check(uco_object.document, mft_file_id, mft_parent_id, ntfs_hard_link_count,
+                                mft_record_change_time, ntfs_owner_sid, ntfs_owner_id, mft_flags,
+                                mft_filename_created_time, mft_filename_modified_time,
+                                mft_filename_accessed_time, mft_filename_record_change_time,
+                                mft_filename_length)
+
+    return uco_object.create_PropertyBundle('MFTRecord', **properties(kwargs, mft_file_id=mft_file_id,
+                                            mft_parent_id=mft_parent_id,
+                                            ntfs_hard_link_count=ntfs_hard_link_count,
+                                            mft_record_change_time=mft_record_change_time,
+                                            ntfs_owner_sid=ntfs_owner_sid, ntfs_owner_id=ntfs_owner_id,
+                                            mft_flags=mft_flags,
+                                            mft_filename_created_time=mft_filename_created_time,
+                                            mft_filename_modified_time=mft_filename_modified_time,
+                                            mft_filename_accessed_time=mft_filename_accessed_time,
+                                            mft_filename_record_change_time=mft_filename_record_change_time,
+                                            mft_filename_length=mft_filename_length))
+
+
+_propbundle_Mutex = Checks('propbundle_Mutex', (
+    ('is_named', True,  False, 'Bool'),
+))
+
+def propbundle_Mutex(uco_object, is_named=MISSING, **kwargs):
+    '''
+    :param IsNamed: Exactly one value of type Bool.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_Mutex.check(uco_object.document, is_named)
+
+    return uco_object.create_PropertyBundle('Mutex', **properties(kwargs, is_named=is_named))
+
+
+_propbundle_NetworkConnection = Checks('propbundle_NetworkConnection', (
+    ('is_active',        False, False, 'Bool'),
+    ('start_time',       False, False, 'Datetime'),
+    ('end_time',         False, False, 'Datetime'),
+    ('source_refs',      False, True,  'core'),
+    ('destination_refs', False, True,  'core'),
+    ('source_port',      False, False, 'Integer'),
+    ('destination_port', False, False, 'Integer'),
+    ('protocols',        False, False, 'duck:ControlledDictionary'),
+))
+
+def propbundle_NetworkConnection(uco_object, is_active=MISSING, start_time=MISSING, end_time=MISSING,
+                                 source_refs=MISSING, destination_refs=MISSING, source_port=MISSING,
+                                 destination_port=MISSING, protocols=MISSING, **kwargs):
+    '''
+    :param IsActive: At most one value of type Bool.
+    :param StartTime: At most one value of type Datetime.
+    :param EndTime: At most one value of type Datetime.
+    :param SourceRefs: Any number of occurrences of type CoreObject.
+    :param DestinationRefs: Any number of occurrences of type CoreObject.
+    :param SourcePort: At most one value of type Integer.
+    :param DestinationPort: At most one value of type Integer.
+    :param Protocols: At most one occurrence of type ControlledDictionary.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_NetworkConnection.check(uco_object.document, is_active, start_time, end_time, source_refs,
+                                        destination_refs, source_port, destination_port, protocols)
+
+    return uco_object.create_PropertyBundle('NetworkConnection', **properties(kwargs, is_active=is_active,
+                                            start_time=start_time, end_time=end_time, source_refs=source_refs,
+                                            destination_refs=destination_refs, source_port=source_port,
+                                            destination_port=destination_port, protocols=protocols))
+
+    
+_propbundle_NetworkFlow = Checks('propbundle_NetworkFlow', (
+    ('source_bytes',             False, False, 'Integer'),
+    ('destination_bytes',        False, False, 'Integer'),
+    ('source_packets',           False, False, 'Integer'),
+    ('destination_packets',      False, False, 'Integer'),
+    ('source_payload_refs',      False, False, 'core:Trace'),
+    ('destination_payload_refs', False, False, 'core:Trace'),
+    ('ipfix',                    False, False, 'duck:Dictionary'),
+))
+
+def propbundle_NetworkFlow(uco_object, source_bytes=MISSING, destination_bytes=MISSING,
+                           source_packets=MISSING, destination_packets=MISSING,
+                           source_payload_refs=MISSING, destination_payload_refs=MISSING,
+                           ipfix=MISSING, **kwargs):
+    '''
+    :param SourceBytes: At most one value of type Integer.
+    :param DestinationBytes: At most one value of type Integer.
+    :param SourcePackets: At most one value of type Integer.
+    :param DestinationPackets: At most one value of type Integer.
+    :param SourcePayloadRefs: At most one occurrence of type Trace.
+    :param DestinationPayloadRefs: At most one occurrence of type Trace.
+    :param IPFIX: At most one occurrence of type Dictionary.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_NetworkFlow.check(uco_object.document, source_bytes, destination_bytes, source_packets,
+                                  destination_packets, source_payload_refs, destination_payload_refs, ipfix)
+
+    return uco_object.create_PropertyBundle('NetworkFlow', **properties(kwargs, source_bytes=source_bytes,
+                                            destination_bytes=destination_bytes, source_packets=source_packets,
+                                            destination_packets=destination_packets,
+                                            source_payload_refs=source_payload_refs,
+                                            destination_payload_refs=destination_payload_refs, ipfix=ipfix))
+
+
+_propbundle_NetworkInterface = Checks('propbundle_NetworkInterface', (
+    ('adapter_name',        False, False, 'String'),
+    ('dhcp_lease_expires',  False, False, 'Datetime'),
+    ('dhcp_lease_obtained', False, False, 'Datetime'),
+    ('dhcp_server_refs',    False, True,  'core:Trace'),
+    ('ip_gateway_refs',     False, True,  'core:Trace'),
+    ('ip_refs',             False, True,  'core:Trace'),
+    ('mac_address_ref',     False, False, 'core:Trace'),
+))
+
+def propbundle_NetworkInterface(uco_object, adapter_name=MISSING, dhcp_lease_expires=MISSING,
+                                dhcp_lease_obtained=MISSING, dhcp_server_refs=MISSING,
+                                ip_gateway_refs=MISSING, ip_refs=MISSING, mac_address_ref=MISSING, **kwargs):
+    '''
+    :param AdapterName: At most one value of type String.
+    :param DHCPLeaseExpires: At most one value of type Datetime.
+    :param DHCPLeaseObtained: At most one value of type Datetime.
+    :param DHCPServerRefs: Any number of occurrences of type Trace.
+    :param IPGatewayRefs: Any number of occurrences of type Trace.
+    :param IPRefs: Any number of occurrences of type Trace.
+    :param MACAddressRef: At most one occurrence of type Trace.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_NetworkInterface.check(uco_object.document, adapter_name, dhcp_lease_expires,
+                                       dhcp_lease_obtained, dhcp_server_refs, ip_gateway_refs, ip_refs,
+                                       mac_address_ref)
+
+    return uco_object.create_PropertyBundle('NetworkInterface', **properties(kwargs, adapter_name=adapter_name,
+                                            dhcp_lease_expires=dhcp_lease_expires,
+                                            dhcp_lease_obtained=dhcp_lease_obtained,
+                                            dhcp_server_refs=dhcp_server_refs, ip_gateway_refs=ip_gateway_refs,
+                                            ip_refs=ip_refs, mac_address_ref=mac_address_ref))
+
+
+_propbundle_Note = Checks('propbundle_Note', (
+    ('application_ref', True,  False, 'core:Trace'),
+    ('categories',      False, True,  'String'),
+    ('created_time',    False, False, 'Datetime'),
+    ('modified_time',   False, False, 'Datetime'),
+    ('labels',          False, True,  'String'),
+    ('text',            False, False, 'String'),
+))
+
+def propbundle_Note(uco_object, application_ref=MISSING, categories=MISSING, created_time=MISSING,
+                    modified_time=MISSING, labels=MISSING, text=MISSING, **kwargs):
+    '''
+    :param ApplicationRef: Exactly one occurrence of type Trace.
+    :param Categories: Any number of values of type String.
+    :param CreatedTime: At most one value of type Datetime.
+    :param ModifiedTime: At most one value of type Datetime.
+    :param Labels: Any number of values of type String.
+    :param Text: At most one value of type String.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_Note.check(uco_object.document, application_ref, categories, created_time, modified_time,
+                           labels, text)
+
+    return uco_object.create_PropertyBundle('Note', **properties(kwargs, application_ref=application_ref,
+                                            categories=categories, created_time=created_time,
+                                            modified_time=modified_time, labels=labels, text=text))
+
+
+def propbundle_NTFSFilePermissions(uco_object, **kwargs):
+    '''
+    :return: A PropertyBundle object.
+    '''
+
+    #TODO:NothingElseToCheck
+
+    return uco_object.create_PropertyBundle('NTFSFilePermission', **kwargs)
+
+
+_propbundle_NTFSFileSystem = Checks('propbundle_NTFSFileSystem', (
+    ('sid',                    False, False, 'String'),
+    ('alternate_data_streams', False, True,  'duck:AlternateDataStream'),
+    ('entry_id',               False, False, 'Long'),
+))
+
+def propbundle_NTFSFileSystem(uco_object, sid=MISSING, alternate_data_streams=MISSING, entry_id=MISSING, **kwargs):
+    '''
+    :param SID: At most one value of type String.
+    :param AlternateDataStreams: Any number of occurrences of type AlternateDataStream.
+    :param EntryID: At most one value of type Long.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_NTFSFileSystem.check(uco_object.document, sid, alternate_data_streams, entry_id)
+
+    return uco_object.create_PropertyBundle('NTFSFileSystem', **properties(kwargs, sid=sid,
+                                            alternate_data_streams=alternate_data_streams, entry_id=entry_id))
+
+
+_propbundle_OperatingSystem = Checks('propbundle_OperatingSystem', (
+    ('manufacturer',          False, False, 'String'),
+    ('version',               False, False, 'String'),
+    ('bitness',               False, False, 'duck:ControlledDictionary'),
+    ('environment_variables', False, False, 'duck:Dictionary'),
+    ('install_date',          False, False, 'Datetime'),
+))
+
+def propbundle_OperatingSystem(uco_object, manufacturer=MISSING, version=MISSING, bitness=MISSING,
+                               environment_variables=MISSING, install_date=MISSING, **kwargs):
+    '''
+    :param Manufacturer: At most one value of type String.
+    :param Version: At most one value of type String.
+    :param Bitness: At most one occurrence of type ControlledVocabulary.
+    :param EnvironmentVariables: At most one occurrence of type Dictionary.
+    :param InstallDate: At most one value of type Datetime.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_OperatingSystem.check(uco_object.document, manufacturer, version, bitness,
+                                      environment_variables, install_date)
+
+    return uco_object.create_PropertyBundle('OperatingSystem', **properties(kwargs, manufacturer=manufacturer,
+                                            version=version, bitness=bitness,
+                                            environment_variables=environment_variables,
+                                            install_date=install_date))
+
+
+_propbundle_PathRelation = Checks('propbundle_PathRelation', (
+    ('path', True,  True,  'String'),
+))
+
+def propbundle_PathRelation(uco_object, path=MISSING, **kwargs):
+    '''
+    :param Path: At least one value of type String.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_PathRelation.check(uco_object.document, path)
+
+    return uco_object.create_PropertyBundle('PathRelationship', **properties(kwargs, path=path))
+
+
+_propbundle_PDFFile = Checks('propbundle_PDFFile', (
+    ('version',                         False, False, 'String'),
+    ('is_optimized',                    False, False, 'Bool'),
+    ('document_information_dictionary', False, False, 'duck:ControlledDictionary'),
+    ('pdf_id_zero',                     False, True,  'String'),
+    ('pdf_id_one',                      False, False, 'String'),
+))
+
+def propbundle_PDFFile(uco_object, version=MISSING, is_optimized=MISSING, document_information_dictionary=MISSING,
+                       pdf_id_zero=MISSING, pdf_id_one=MISSING, **kwargs):
+    '''
+    :param Version: At most one value of type String.
+    :param IsOptimized: At most one value of type Bool.
+    :param DocumentInformationDictionary: At most one occurrence of type ControlledDictionary.
+    :param PDFIDZero: Any number of values of type String.
+    :param PDFIDOne: At most one value of type String.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_PDFFile.check(uco_object.document, version, is_optimized, document_information_dictionary,
+                              pdf_id_zero, pdf_id_one)
+
+    return uco_object.create_PropertyBundle('PDFFile', **properties(kwargs, version=version,
+                                            is_optimized=is_optimized,
+                                            document_information_dictionary=document_information_dictionary,
+                                            pdf_id_zero=pdf_id_zero, pdf_id_one=pdf_id_one))
+
+
+_propbundle_PhoneAccount = Checks('propbundle_PhoneAccount', (
+    ('phone_number', True,  False, 'String'),
+))
+
+def propbundle_PhoneAccount(uco_object, phone_number=MISSING, **kwargs):
+    '''
+    :param PhoneNumber: Exactly one value of type String.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_PhoneAccount.check(uco_object.document, phone_number)
+
+    return uco_object.create_PropertyBundle('PhoneAccount', **properties(kwargs, phone_number=phone_number))
+
+
+_propbundle_PhoneCall = Checks('propbundle_PhoneCall', (
+    ('application_ref',  True,  False, 'core:Trace'),
+    ('call_type',        False, False, 'String'),
+    ('duration',         False, False, 'Long'),
+    ('start_time',       False, False, 'Datetime'),
+    ('end_time',         False, False, 'Datetime'),
+    ('from_ref',         False, False, 'core:Trace'),
+    ('to_ref',           False, False, 'core:Trace'),
+    ('participant_refs', False, True,  'core:Trace'),
+))
+
+def propbundle_PhoneCall(uco_object, application_ref=MISSING, call_type=MISSING, duration=MISSING,
+                         start_time=MISSING, end_time=MISSING, from_ref=MISSING, to_ref=MISSING,
+                         participant_refs=MISSING, **kwargs):
+    '''
+    :param ApplicationRef: Exactly one occurrence of type Trace.
+    :param CallType: At most one value of type String.
+    :param Duration: At most one value of type Long.
+    :param StartTime: At most one value of type Datetime.
+    :param EndTime: At most one value of type Datetime.
+    :param FromRef: At most one occurrence of type Trace.
+    :param ToRef: At most one occurrence of type Trace.
+    :param ParticipantRefs: Any number of occurrences of type Trace.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_PhoneCall.check(uco_object.document, application_ref, call_type, duration, start_time,
+                                end_time, from_ref, to_ref, participant_refs)
+
+    return uco_object.create_PropertyBundle('PhoneCall', **properties(kwargs, application_ref=application_ref,
+                                            call_type=call_type, duration=duration, start_time=start_time,
+                                            end_time=end_time, from_ref=from_ref, to_ref=to_ref,
+                                            participant_refs=participant_refs))
+
+
+_propbundle_Process = Checks('propbundle_Process', (
+    ('arguments',                 False, True,  'String'),
+    ('binary_ref',                False, False, 'core:Trace'),
+    ('created_time',              False, False, 'Datetime'),
+    ('creator_user_ref',          False, False, 'core:Trace'),
+    ('current_working_directory', False, False, 'String'),
+    ('environment_variables',     False, False, 'duck:Dictionary'),
+    ('exit_status',               False, False, 'Long'),
+    ('exit_time',                 False, False, 'Datetime'),
+    ('is_hidden',                 False, False, 'Bool'),
+    ('parent_ref',                False, False, 'core:Trace'),
+    ('pid',                       False, False, 'Integer'),
+    ('status',                    False, False, 'String'),
+))
+
+def propbundle_Process(uco_object, arguments=MISSING, binary_ref=MISSING, created_time=MISSING,
+                       creator_user_ref=MISSING, current_working_directory=MISSING,
+                       environment_variables=MISSING, exit_status=MISSING, exit_time=MISSING,
+                       is_hidden=MISSING, parent_ref=MISSING, pid=MISSING, status=MISSING, **kwargs):
+    '''
+    :param Arguments: Any number of values of type String.
+    :param BinaryRef: At most one occurrence of type Trace.
+    :param CreatedTime: At most one value of type Datetime.
+    :param CreatorUserRef: At most one occurrence of type Trace.
+    :param CurrentWorkingDirectory: At most one value of type String.
+    :param EnvironmentVariables: At most one occurrence of type Dictionary.
+    :param ExitStatus: At most one value of type Long.
+    :param ExitTime: At most one value of type Datetime.
+    :param IsHidden: At most one value of type Bool.
+    :param ParentRef: At most one occurrence of type Trace.
+    :param PID: At most one value of type Integer.
+    :param Status: At most one value of type String.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_Process.check(uco_object.document, arguments, binary_ref, created_time, creator_user_ref,
+                              current_working_directory, environment_variables, exit_status, exit_time,
+                              is_hidden, parent_ref, pid, status)
+
+    return uco_object.create_PropertyBundle('Process', **properties(kwargs, arguments=arguments,
+                                            binary_ref=binary_ref, created_time=created_time,
+                                            creator_user_ref=creator_user_ref,
+                                            current_working_directory=current_working_directory,
+                                            environment_variables=environment_variables,
+                                            exit_status=exit_status, exit_time=exit_time, is_hidden=is_hidden,
+                                            parent_ref=parent_ref, pid=pid, status=status))
+
+
+_propbundle_RasterPicture = Checks('propbundle_RasterPicture', (
+    ('picture_height',           False, False, 'Integer'),
+    ('picture_width',            False, False, 'Integer'),
+    ('bits_per_pixel',           False, False, 'Integer'),
+    ('image_compression_method', False, False, 'String'),
+    ('camera_ref',               False, False, 'core:Trace'),
+    ('picture_type',             False, False, 'String'),
+))
+
+def propbundle_RasterPicture(uco_object, picture_height=MISSING, picture_width=MISSING, bits_per_pixel=MISSING,
+                             image_compression_method=MISSING, camera_ref=MISSING, picture_type=MISSING, **kwargs):
+    '''
+    :param PictureHeight: At most one value of type Integer.
+    :param PictureWidth: At most one value of type Integer.
+    :param BitsPerPixel: At most one value of type Integer.
+    :param ImageCompressionMethod: At most one value of type String.
+    :param CameraRef: At most one occurrence of type Trace.
+    :param PictureType: At most one value of type String.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_RasterPicture.check(uco_object.document, picture_height, picture_width, bits_per_pixel,
+                                    image_compression_method, camera_ref, picture_type)
+
+    return uco_object.create_PropertyBundle('RasterPicture', **properties(kwargs,
+                                            picture_height=picture_height, picture_width=picture_width,
+                                            bits_per_pixel=bits_per_pixel,
+                                            image_compression_method=image_compression_method,
+                                            camera_ref=camera_ref, picture_type=picture_type))
+
+
+_propbundle_SimpleAddress = Checks('propbundle_SimpleAddress', (
+    ('street',       False, False, 'String'),
+    ('locality',     False, False, 'String'),
+    ('region',       False, False, 'String'),
+    ('postal_code',  False, False, 'String'),
+    ('country',      False, False, 'String'),
+    ('address_type', False, False, 'String'),
+))
+
+def propbundle_SimpleAddress(uco_object, street=MISSING, locality=MISSING, region=MISSING,
+                             postal_code=MISSING, country=MISSING, address_type=MISSING, **kwargs):
+    '''
+    :param Street: At most one value of type String.
+    :param Locality: At most one value of type String.
+    :param Region: At most one value of type String.
+    :param PostalCode: At most one value of type String.
+    :param Country: At most one value of type String.
+    :param AddressType: At most one value of type String.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_SimpleAddress.check(uco_object.document, street, locality, region, postal_code, country,
+                                    address_type)
+
+    return uco_object.create_PropertyBundle('SimpleAddress', **properties(kwargs, street=street,
+                                            locality=locality, region=region, postal_code=postal_code,
+                                            country=country, address_type=address_type))
+
+
+_propbundle_SMSMessage = Checks('propbundle_SMSMessage', (
+    ('is_read', True,  False, 'Bool'),
+))
+
+def propbundle_SMSMessage(uco_object, is_read=MISSING, **kwargs):
+    '''
+    :param IsRead: Exactly one value of type Bool.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_SMSMessage.check(uco_object.document, is_read)
+
+    return uco_object.create_PropertyBundle('SMSMessage', **properties(kwargs, is_read=is_read))
+
+
+_propbundle_Software = Checks('propbundle_Software', (
+    ('version',      False, False, 'String'),
+    ('language',     False, False, 'String'),
+    ('manufacturer', False, False, 'String'),
+    ('swid',         False, False, 'String'),
+    ('cpeid',        False, False, 'String'),
+))
+
+def propbundle_Software(uco_object, version=MISSING, language=MISSING, manufacturer=MISSING, swid=MISSING,
+                        cpeid=MISSING, **kwargs):
+    '''
+    :param Version: At most one value of type String.
+    :param Language: At most one value of type String.
+    :param Manufacturer: At most one value of type String.
+    :param SWID: At most one value of type String.
+    :param CPEID: At most one value of type String.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_Software.check(uco_object.document, version, language, manufacturer, swid, cpeid)
+
+    return uco_object.create_PropertyBundle('Software', **properties(kwargs, version=version,
+                                            language=language, manufacturer=manufacturer, swid=swid,
+                                            cpeid=cpeid))
+
+
+_propbundle_SQLiteBlob = Checks('propbundle_SQLiteBlob', (
+    ('column_name',   False, False, 'String'),
+    ('row_condition', False, False, 'String'),
+    ('row_index',     False, False, 'PositiveInteger'),
+    ('table_name',    False, False, 'String'),
+))
+
+def propbundle_SQLiteBlob(uco_object, column_name=MISSING, row_condition=MISSING, row_index=MISSING,
+                          table_name=MISSING, **kwargs):
+    '''
+    :param ColumnName: At most one value of type String.
+    :param RowCondition: At most one value of type String.
+    :param RowIndex: At most one value of type PositiveInteger.
+    :param TableName: At most one value of type String.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_SQLiteBlob.check(uco_object.document, column_name, row_condition, row_index, table_name)
+
+    return uco_object.create_PropertyBundle('SQLiteBlob', **properties(kwargs, column_name=column_name,
+                                            row_condition=row_condition, row_index=row_index,
+                                            table_name=table_name))
+
+
+_propbundle_SymbolicLink = Checks('propbundle_SymbolicLink', (
+    ('target_file_ref', True,  False, 'core:Trace'),
+))
+
+def propbundle_SymbolicLink(uco_object, target_file_ref=MISSING, **kwargs):
+    '''
+    :param TargetFileRef: Exactly one occurrence of type Trace.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_SymbolicLink.check(uco_object.document, target_file_ref)
+
+    return uco_object.create_PropertyBundle('SymbolicLink', **properties(kwargs,
+                                            target_file_ref=target_file_ref))
+
+
+def propbundle_TCPConnection(uco_object, source_flags=MISSING, destination_flags=MISSING, **kwargs):
+    '''
+    :param SourceFlags: At most one value of type HexBinary.
+    :param DestinationFlags: At most one value of type HexBinary.
+    :return: A PropertyBundle object.
+    '''
+
+    #TODO:HexBinary
+    #TODO:HexBinary
+
+    return uco_object.create_PropertyBundle('TCPConnection', **properties(kwargs, source_flags=source_flags,
+                                            destination_flags=destination_flags))
+
+
+_propbundle_ToolConfigurationType = Checks('propbundle_ToolConfigurationType', (
+    ('configuration_settings', False, True,  'duck:ConfigurationSettingType'),
+    ('dependencies',           False, True,  'duck:DependencyType'),
+))
+
+def propbundle_ToolConfigurationType(uco_object, configuration_settings=MISSING, dependencies=MISSING,
+                                     usage_context_assumptions=MISSING, **kwargs):
+    '''
+    :param ConfigurationSettings: Any number of occurrences of type ConfigurationSettingType.
+    :param Dependencies: Any number of occurrences of type DependencyType.
+    :param UsageContextAssumptions: Any number of values of type StructuredText.
+    :return: A PropertyBundle object.
+    '''
+
+    #TODO:StructuredType
+    _propbundle_ToolConfigurationType.check(uco_object.document, configuration_settings, dependencies)
+
+    return uco_object.create_PropertyBundle('ToolConfigurationType', **properties(kwargs,
+                                            configuration_settings=configuration_settings,
+                                            dependencies=dependencies,
+                                            usage_context_assumptions=usage_context_assumptions))
+
+
+_propbundle_UNIXAccount = Checks('propbundle_UNIXAccount', (
+    ('gid',    False, False, 'Integer'),
+    ('groups', False, True,  'String'),
+    ('shell',  False, False, 'String'),
+))
+
+def propbundle_UNIXAccount(uco_object, gid=MISSING, groups=MISSING, shell=MISSING, **kwargs):
+    '''
+    :param GID: At most one value of type Integer.
+    :param Groups: Any number of values of type String.
+    :param Shell: At most one value of type String.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_UNIXAccount.check(uco_object.document, gid, groups, shell)
+
+    return uco_object.create_PropertyBundle('UNIXAccount', **properties(kwargs, gid=gid, groups=groups,
+                                            shell=shell))
+
+
+def propbundle_UNIXFilePermissions(uco_object, **kwargs):
+    '''
+    :return: A PropertyBundle object.
+    '''
+
+    #TODO:NothingElseToCheck
+
+    return uco_object.create_PropertyBundle('UNIXFilePermissions', **kwargs)
+
+
+_propbundle_UNIXProcess = Checks('propbundle_UNIXProcess', (
+    ('open_file_descriptor_refs', False, True,  'Integer'),
+    ('priority',                  False, False, 'PositiveInteger'),
+    ('ruid',                      False, False, 'PositiveInteger'),
+    ('session_id',                False, False, 'PositiveInteger'),
+))
+
+def propbundle_UNIXProcess(uco_object, open_file_descriptor_refs=MISSING, priority=MISSING, ruid=MISSING,
+                           session_id=MISSING, **kwargs):
+    '''
+    :param OpenFileDescriptorRefs: Any number of value of type Integer.
+    :param Priority: At most one value of type PositiveInteger.
+    :param RUID: At most one value of type PositiveInteger.
+    :param SessionID: At most one value of type PositiveInteger.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_UNIXProcess.check(uco_object.document, open_file_descriptor_refs, priority, ruid, session_id)
+
+    return uco_object.create_PropertyBundle('UNIXProcess', **properties(kwargs,
+                                            open_file_descriptor_refs=open_file_descriptor_refs,
+                                            priority=priority, ruid=ruid, session_id=session_id))
+
+
+_propbundle_UNIXVolume = Checks('propbundle_UNIXVolume', (
+    ('mount_point', False, False, 'String'),
+    ('options',     False, False, 'String'),
+))
+
+def propbundle_UNIXVolume(uco_object, mount_point=MISSING, options=MISSING, **kwargs):
+    '''
+    :param MountPoint: At most one value of type String.
+    :param Options: At most one value of type String.
+    :return: A PropertyBundle objects.
+    '''
+
+    _propbundle_UNIXVolume.check(uco_object.document, mount_point, options)
+
+    return uco_object.create_PropertyBundle('UNIXVolume', **properties(kwargs, mount_point=mount_point,
+                                            options=options))
+
+
+_propbundle_URL = Checks('propbundle_URL', (
+    ('full_value',    True,  False, 'String'),
+    ('scheme',        False, False, 'String'),
+    ('user_name_ref', False, False, 'core:Trace'),
+    ('password_ref',  False, False, 'core:Trace'),
+    ('host_ref',      False, False, 'core:Trace'),
+    ('port',          False, False, 'Long'),
+    ('path',          False, False, 'String'),
+    ('query',         False, False, 'String'),
+    ('fragment',      False, False, 'String'),
+))
+
+def propbundle_URL(uco_object, full_value=MISSING, scheme=MISSING, user_name_ref=MISSING, password_ref=MISSING,
+                   host_ref=MISSING, port=MISSING, path=MISSING, query=MISSING, fragment=MISSING, **kwargs):
+    '''
+    :param FullValue: Exactly one value of type String.
+    :param Scheme: At most one value of type String.
+    :param UserNameRef: At most one occurrence of type Trace.
+    :param PasswordRef: At most one occurrence of type Trace.
+    :param HostRef: At most one occurrence of type Trace.
+    :param Port: At most one value of type Long.
+    :param Path: At most one value of type String.
+    :param Query: At most one value of type String.
+    :param Fragment: At most one value of type String.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_URL.check(uco_object.document, full_value, scheme, user_name_ref, password_ref, host_ref,
+                          port, path, query, fragment)
+
+    return uco_object.create_PropertyBundle('URL', **properties(kwargs, full_value=full_value, scheme=scheme,
+                                            user_name_ref=user_name_ref, password_ref=password_ref,
+                                            host_ref=host_ref, port=port, path=path, query=query,
+                                            fragment=fragment))
+
+
+_propbundle_UserAccount = Checks('propbundle_UserAccount', (
+    ('home_directory',          False, False, 'String'),
+    ('is_service_account',      False, False, 'Bool'),
+    ('is_privileged',           False, False, 'Bool'),
+    ('can_escalate_privileges', False, False, 'Bool'),
+))
+
+def propbundle_UserAccount(uco_object, home_directory=MISSING, is_service_account=MISSING, is_privileged=MISSING,
+                           can_escalate_privileges=MISSING, **kwargs):
+    '''
+    :param HomeDirectory: At most one value of type String.
+    :param IsServiceAccount: At most one value of type Bool.
+    :param IsPrivileged: At most one value of type Bool.
+    :param CanEscalatePrivileges: At most one value of type Bool.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_UserAccount.check(uco_object.document, home_directory, is_service_account, is_privileged,
+                                  can_escalate_privileges)
+
+    return uco_object.create_PropertyBundle('UserAccount', **properties(kwargs, home_directory=home_directory,
+                                            is_service_account=is_service_account, is_privileged=is_privileged,
+                                            can_escalate_privileges=can_escalate_privileges))
+
+
+_propbundle_UserSession = Checks('propbundle_UserSession', (
+    ('effective_group',    False, False, 'String'),
+    ('effective_group_id', False, False, 'String'),
+    ('effective_user_ref', False, False, 'core:Trace'),
+    ('login_time',         False, False, 'Datetime'),
+    ('logout_time',        False, False, 'Datetime'),
+))
+
+def propbundle_UserSession(uco_object, effective_group=MISSING, effective_group_id=MISSING,
+                           effective_user_ref=MISSING, login_time=MISSING, logout_time=MISSING, **kwargs):
+    '''
+    :param EffectiveGroup: At most one value of type String.
+    :param EffectiveGroupID: At most one value of type String.
+    :param EffectiveUserRef: At most one occurrence of type Trace.
+    :param LoginTime: At most one value of type Datetime.
+    :param LogoutTime: At most one value of type Datetime.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_UserSession.check(uco_object.document, effective_group, effective_group_id,
+                                  effective_user_ref, login_time, logout_time)
+
+    return uco_object.create_PropertyBundle('UserSession', **properties(kwargs,
+                                            effective_group=effective_group,
+                                            effective_group_id=effective_group_id,
+                                            effective_user_ref=effective_user_ref, login_time=login_time,
+                                            logout_time=logout_time))
+
+
+_propbundle_Volume = Checks('propbundle_Volume', (
+    ('volume_id',   False, False, 'String'),
+    ('sector_size', False, False, 'String'),
+))
+
+def propbundle_Volume(uco_object, volume_id=MISSING, sector_size=MISSING, **kwargs):
+    '''
+    :param VolumeID: At most one value of type String.
+    :param SectorSize: At most one value of type Long.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_Volume.check(uco_object.document, volume_id, sector_size)
+
+    return uco_object.create_PropertyBundle('Volume', **properties(kwargs, volume_id=volume_id,
+                                            sector_size=sector_size))
+
+
+_propbundle_WhoIs = Checks('propbundle_WhoIs', (
+    ('lookup_date',          False, False, 'Datetime'),
+    ('domain_name_ref',      False, False, 'core:Trace'),
+    ('domain_id',            False, False, 'String'),
+    ('server_name_ref',      False, False, 'core:Trace'),
+    ('ip_address_ref',       False, False, 'core:Trace'),
+    ('name_server_refs',     False, True,  'core:Trace'),
+    ('updated_date',         False, False, 'Datetime'),
+    ('creation_date',        False, False, 'Datetime'),
+    ('expiration_date',      False, False, 'Datetime'),
+    ('sponsoring_registrar', False, False, 'String'),
+    ('registrar_info',       False, False, 'duck:WhoIsRegistrarInfoType'),
+    ('registrant_ids',       False, True,  'String'),
+    ('contact_info',         False, True,  'duck:WhoIsContactType'),
+    ('remarks',              False, False, 'String'),
+))
+
+def propbundle_WhoIs(uco_object, lookup_date=MISSING, domain_name_ref=MISSING, domain_id=MISSING,
+                     server_name_ref=MISSING, ip_address_ref=MISSING, name_server_refs=MISSING,
+                     updated_date=MISSING, creation_date=MISSING, expiration_date=MISSING,
+                     sponsoring_registrar=MISSING, registrar_info=MISSING, registrant_ids=MISSING,
+                     contact_info=MISSING, remarks=MISSING, **kwargs):
+    '''
+    :param LookupDate: At most one value of type Datetime.
+    :param DomainNameRef: At most one occurrence of type Trace.
+    :param DomainID: At most one value of type String.
+    :param ServerNameRef: At most one occurrence of type Trace.
+    :param IPAddressRef: At most one occurrence of type Trace.
+    :param NameServerRefs: Any number of occurrences of type Trace.
+    :param UpdatedDate: At most one value of type Datetime.
+    :param CreationDate: At most one value of type Datetime.
+    :param ExpirationDate: At most one value of type Datetime.
+    :param SponsoringRegistrar: At most one value of type String.
+    :param RegistrarInfo: At most one occurrence of type WhoIsRegistrarInfoType.
+    :param RegistrantIDs: Any number of values of type String.
+    :param ContactInfo: Any number of occurrences of type WhoIsContactType.
+    :param Remarks: At most one value of type String.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_WhoIs.check(uco_object.document, lookup_date, domain_name_ref, domain_id, server_name_ref,
+                            ip_address_ref, name_server_refs, updated_date, creation_date, expiration_date,
+                            sponsoring_registrar, registrar_info, registrant_ids, contact_info, remarks)
+
+    return uco_object.create_PropertyBundle('WhoIs', **properties(kwargs, lookup_date=lookup_date,
+                                            domain_name_ref=domain_name_ref, domain_id=domain_id,
+                                            server_name_ref=server_name_ref, ip_address_ref=ip_address_ref,
+                                            name_server_refs=name_server_refs, updated_date=updated_date,
+                                            creation_date=creation_date, expiration_date=expiration_date,
+                                            sponsoring_registrar=sponsoring_registrar,
+                                            registrar_info=registrar_info, registrant_ids=registrant_ids,
+                                            contact_info=contact_info, remarks=remarks))
+
+
+_propbundle_WindowsAccount = Checks('propbundle_WindowsAccount', (
+    ('groups', True,  True,  'String'),
+))
+
+def propbundle_WindowsAccount(uco_object, groups=MISSING, **kwargs):
+    '''
+    :param Groups: At least one value of type String.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_WindowsAccount.check(uco_object.document, groups)
+
+    return uco_object.create_PropertyBundle('WindowsAccount', **properties(kwargs, groups=groups))
+
+
+_propbundle_WindowsActiveDirectoryAccount = Checks('propbundle_WindowsActiveDirectoryAccount', (
+    ('object_guid',             True,  False, 'String'),
+    ('active_directory_groups', False, True,  'String'),
+))
+
+def propbundle_WindowsActiveDirectoryAccount(uco_object, object_guid=MISSING, active_directory_groups=MISSING, **kwargs):
+    '''
+    :param ObjectGUID: Exactly one value of type String.
+    :param ActiveDirectoryGroups: Any number of values of type String.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_WindowsActiveDirectoryAccount.check(uco_object.document, object_guid,
+                                                    active_directory_groups)
+
+    return uco_object.create_PropertyBundle('WindowsActiveDirectoryAccount', **properties(kwargs,
+                                            object_guid=object_guid,
+                                            active_directory_groups=active_directory_groups))
+
+
+_propbundle_WindowsComputerSpecification = Checks('propbundle_WindowsComputerSpecification', (
+    ('domain',                       False, True,  'String'),
+    ('global_flag_list',             False, True,  'duck:GlobalFlagType'),
+    ('net_bios_name',                False, False, 'String'),
+    ('ms_product_id',                False, False, 'String'),
+    ('ms_product_name',              False, False, 'String'),
+    ('registered_organization_ref',  False, False, 'core:Identity'),
+    ('windows_directory_ref',        False, False, 'core:Trace'),
+    ('windows_system_directory_ref', False, False, 'core:Trace'),
+    ('windows_temp_directory_ref',   False, False, 'core:Trace'),
+))
+
+def propbundle_WindowsComputerSpecification(uco_object, domain=MISSING, global_flag_list=MISSING,
+                                            net_bios_name=MISSING, ms_product_id=MISSING,
+                                            ms_product_name=MISSING, registered_organization_ref=MISSING,
+                                            registered_owner_ref=MISSING, windows_directory_ref=MISSING,
+                                            windows_system_directory_ref=MISSING,
+                                            windows_temp_directory_ref=MISSING, **kwargs):
+    '''
+    :param Domain: Any number of values of type String.
+    :param GlobalFlagList: Any number of occurrences of type GlobalFlagType.
+    :param NetBIOSName: At most one value of type String.
+    :param MsProductID: At most one value of type String.
+    :param MsProductName: At most one value of type String.
+    :param RegisteredOrganizationRef: At most one occurrence of type Identity (core).
+    :param RegisteredOwnerRef: At most one occurrence of type Identity (core).
+    :param WindowsDirectoryRef: Ata most one occurrence of type Trace.
+    :param WindowsSystemDirectoryRef: At most one occurrence of type Trace.
+    :param WindowsTempDirectoryRef: At most one occurrence of type Trace.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_WindowsComputerSpecification.check(uco_object.document, domain, global_flag_list,
+                                                   net_bios_name, ms_product_id, ms_product_name,
+                                                   registered_organization_ref, windows_directory_ref,
+                                                   windows_system_directory_ref, windows_temp_directory_ref)
+
+    return uco_object.create_PropertyBundle('WindowsComputerSpecification', **properties(kwargs, domain=domain,
+                                            global_flag_list=global_flag_list, net_bios_name=net_bios_name,
+                                            ms_product_id=ms_product_id, ms_product_name=ms_product_name,
+                                            registered_organization_ref=registered_organization_ref,
+                                            registered_owner_ref=registered_owner_ref,
+                                            windows_directory_ref=windows_directory_ref,
+                                            windows_system_directory_ref=windows_system_directory_ref,
+                                            windows_temp_directory_ref=windows_temp_directory_ref))
+
+
+_propbundle_WindowsPEBinaryFile = Checks('propbundle_WindowsPEBinaryFile', (
+    ('machine',                 True,  False, None),
+    ('pe_type',                 False, False, 'core:ControlledVocabulary'),
+    ('imp_hash',                False, False, 'String'),
+    ('number_of_sections',      False, False, 'Integer'),
+    ('datetime_stamp',          False, False, 'Datetime'),
+    ('pointer_to_symbol_table', False, False, 'Integer'),
+    ('size_of_optional_header', False, False, 'Integer'),
+    ('file_header_hashes',      False, True,  'duck:Hash'),
+    ('optional_header',         False, False, 'duck:WindowsPEOptionalHeader'),
+    ('sections',                False, True,  'duck:WindowsPESection'),
+))
+
+def propbundle_WindowsPEBinaryFile(uco_object, machine=MISSING, pe_type=MISSING, imp_hash=MISSING,
+                                   number_of_sections=MISSING, datetime_stamp=MISSING,
+                                   pointer_to_symbol_table=MISSING, size_of_optional_header=MISSING,
+                                   characteristics=MISSING, file_header_hashes=MISSING,
+                                   optional_header=MISSING, sections=MISSING, **kwargs):
+    '''
+    :param Machine: Exactly one value of type HexBinary.
+    :param PEType: At most one occurrence of type Controlled Vocabulary.
+    :param ImpHash: At most one value of type String.
+    :param NumberOfSections: At most one value of type Integer.
+    :param DatetimeStamp: At most one value of type Datetime.
+    :param PointerToSymbolTable: At most one value of type HexBinary.
+    :param NumberOfSymbols: At most one value of type Integer.
+    :param SizeOfOptionalHeader: At most one value of type Integer.
+    :param Characteristics: At most one value of type HexBinary.
+    :param FileHeaderHashes: Any number of occurrences of type Hash.
+    :param OptionalHeader: At most once occurrence of type WindowsPEOptionalHeader.
+    :param Sections: Any number of occurrences of type WindowsPESection.
+    :return: A PropertyBundle object.
+    '''
+
+    #TODO:HexBinary
+    #TODO:HexBinary
+    #TODO:HexBinary
+    _propbundle_WindowsPEBinaryFile.check(uco_object.document, machine, pe_type, imp_hash,
+                                          number_of_sections, datetime_stamp, pointer_to_symbol_table,
+                                          size_of_optional_header, file_header_hashes, optional_header,
+                                          sections)
+
+    return uco_object.create_PropertyBundle('WindowsPEBinaryFile', **properties(kwargs, machine=machine,
+                                            pe_type=pe_type, imp_hash=imp_hash,
+                                            number_of_sections=number_of_sections,
+                                            datetime_stamp=datetime_stamp,
+                                            pointer_to_symbol_table=pointer_to_symbol_table,
+                                            size_of_optional_header=size_of_optional_header,
+                                            characteristics=characteristics,
+                                            file_header_hashes=file_header_hashes,
+                                            optional_header=optional_header, sections=sections))
+
+
+_propbundle_WindowsPrefetch = Checks('propbundle_WindowsPrefetch', (
+    ('application_file_name',   False, False, 'String'),
+    ('prefetch_hash',           False, False, 'String'),
+    ('times_executed',          False, False, 'Long'),
+    ('first_run',               False, False, 'Long'),
+    ('last_run',                False, False, 'Datetime'),
+    ('volume_ref',              False, False, 'core:Trace'),
+    ('accessed_file_refs',      False, True,  'core:Trace'),
+    ('accessed_directory_refs', False, True,  'core:Trace'),
+))
+
+def propbundle_WindowsPrefetch(uco_object, application_file_name=MISSING, prefetch_hash=MISSING,
+                               times_executed=MISSING, first_run=MISSING, last_run=MISSING,
+                               volume_ref=MISSING, accessed_file_refs=MISSING,
+                               accessed_directory_refs=MISSING, **kwargs):
+    '''
+    :param ApplicationFileName: At most one value of type String.
+    :param PrefetchHash: At most one value of type String.
+    :param TimesExecuted: At most one value of type Long.
+    :param FirstRun: At most one value of type Datetime.
+    :param LastRun: At most one value of type Datetime.
+    :param VolumeRef: At most one occurrence of type Trace.
+    :param AccessedFileRefs: Any number of occurrences of type Trace.
+    :param AccessedDirectoryRefs: Any number of occurrences of type Trace.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_WindowsPrefetch.check(uco_object.document, application_file_name, prefetch_hash,
+                                      times_executed, first_run, last_run, volume_ref, accessed_file_refs,
+                                      accessed_directory_refs)
+
+    return uco_object.create_PropertyBundle('WindowsPrefetch', **properties(kwargs,
+                                            application_file_name=application_file_name,
+                                            prefetch_hash=prefetch_hash, times_executed=times_executed,
+                                            first_run=first_run, last_run=last_run, volume_ref=volume_ref,
+                                            accessed_file_refs=accessed_file_refs,
+                                            accessed_directory_refs=accessed_directory_refs))
+
+
+_propbundle_WindowsProcess = Checks('propbundle_WindowsProcess', (
+    ('aslr_enabled', False, False, 'Bool'),
+    ('dep_enabled',  False, False, 'Bool'),
+    ('priority',     False, False, 'String'),
+    ('owner_sid',    False, False, 'String'),
+    ('window_title', False, False, 'String'),
+    ('startup_info', False, False, 'duck:Dictionary'),
+))
+
+def propbundle_WindowsProcess(uco_object, aslr_enabled=MISSING, dep_enabled=MISSING, priority=MISSING,
+                              owner_sid=MISSING, window_title=MISSING, startup_info=MISSING, **kwargs):
+    '''
+    :param ASLREnabled: At most one value of type Bool.
+    :param DEPEnabled: At most one value of type Bool.
+    :param Priority: At most one value of type String.
+    :param OwnerSID: At most one value of type String.
+    :param WindowTitle: At most one value of type String.
+    :param StartupInfo: At most one occurrence of type Dictionary.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_WindowsProcess.check(uco_object.document, aslr_enabled, dep_enabled, priority, owner_sid,
+                                     window_title, startup_info)
+
+    return uco_object.create_PropertyBundle('WindowsProcess', **properties(kwargs, aslr_enabled=aslr_enabled,
+                                            dep_enabled=dep_enabled, priority=priority, owner_sid=owner_sid,
+                                            window_title=window_title, startup_info=startup_info))
+
+
+_propbundle_WindowsRegistryHive = Checks('propbundle_WindowsRegistryHive', (
+    ('hive_type', True,  False, 'String'),
+))
+
+def propbundle_WindowsRegistryHive(uco_object, hive_type=MISSING, **kwargs):
+    '''
+    :param HiveType: Exactly one value of type String.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_WindowsRegistryHive.check(uco_object.document, hive_type)
+
+    return uco_object.create_PropertyBundle('WindowsRegistryHive', **properties(kwargs, hive_type=hive_type))
+
+
+_propbundle_WindowsRegistryKey = Checks('propbundle_WindowsRegistryKey', (
+    ('key',               True,  False, 'String'),
+    ('values',            False, True,  'propbundle:WindowsRegistryHive'),
+    ('modified_time',     False, False, 'Datetime'),
+    ('creator_ref',       False, False, 'core:Trace'),
+    ('number_of_subkeys', False, False, 'Integer'),
+))
+
+def propbundle_WindowsRegistryKey(uco_object, key=MISSING, values=MISSING, modified_time=MISSING,
+                                  creator_ref=MISSING, number_of_subkeys=MISSING, **kwargs):
+    '''
+    :param Key: Exactly one value of type String.
+    :param Values: Any number of occurrences of type WindowsRegistryHive.
+    :param ModifiedTime: At most one value of type Datetime.
+    :param CreatorRef: At most one occurrence of type Trace.
+    :param NumberOfSubkeys: At most one value of type Integer.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_WindowsRegistryKey.check(uco_object.document, key, values, modified_time, creator_ref,
+                                         number_of_subkeys)
+
+    return uco_object.create_PropertyBundle('WindowsRegistryKey', **properties(kwargs, key=key, values=values,
+                                            modified_time=modified_time, creator_ref=creator_ref,
+                                            number_of_subkeys=number_of_subkeys))
+
+
+_propbundle_WindowsService = Checks('propbundle_WindowsService', (
+    ('service_name',       True,  False, 'String'),
+    ('descriptions',       False, True,  'String'),
+    ('display_name',       False, False, 'String'),
+    ('group_name',         False, False, 'String'),
+    ('start_command_line', False, False, 'String'),
+    ('start_type',         False, False, 'core:ControlledVocabulary'),
+    ('service_type',       False, False, 'core:ControlledVocabulary'),
+    ('service_status',     False, False, 'core:ControlledVocabulary'),
+))
+
+def propbundle_WindowsService(uco_object, service_name=MISSING, descriptions=MISSING, display_name=MISSING,
+                              group_name=MISSING, start_command_line=MISSING, start_type=MISSING,
+                              service_type=MISSING, service_status=MISSING, **kwargs):
+    '''
+    :param ServiceName: Exactly one value of type String.
+    :param Descriptions: Any number of values of type String.
+    :param DisplayName: At most one value of type String.
+    :param GroupName: At most one value of type String.
+    :param StartCommandLine: At most one value of type String.
+    :param StartType: At most one occurrence of type ControlledVocabulary.
+    :param ServiceType: At most one occurrence of type ControlledVocabulary.
+    :param ServiceStatus: At most one occurrence of type ControlledVocabulary.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_WindowsService.check(uco_object.document, service_name, descriptions, display_name,
+                                     group_name, start_command_line, start_type, service_type,
+                                     service_status)
+
+    return uco_object.create_PropertyBundle('WindowsService', **properties(kwargs, service_name=service_name,
+                                            descriptions=descriptions, display_name=display_name,
+                                            group_name=group_name, start_command_line=start_command_line,
+                                            start_type=start_type, service_type=service_type,
+                                            service_status=service_status))
+
+
+_propbundle_WindowsTask = Checks('propbundle_WindowsTask', (
+    ('image_name',           False, False, 'String'),
+    ('application_ref',      False, False, 'core:Trace'),
+    ('parameters',           False, False, 'String'),
+    ('account_ref',          False, False, 'core:Trace'),
+    ('account_run_level',    False, False, 'String'),
+    ('account_logon_type',   False, False, 'String'),
+    ('creator',              False, False, 'String'),
+    ('created_time',         False, False, 'Datetime'),
+    ('most_recent_run_time', False, False, 'Datetime'),
+    ('exit_code',            False, False, 'Long'),
+    ('max_run_time',         False, False, 'Long'),
+    ('next_run_time',        False, False, 'Datetime'),
+    ('action_list',          False, True,  'duck:TaskActionType'),
+    ('trigger_list',         False, True,  'duck:TriggerType'),
+    ('comment',              False, False, 'String'),
+    ('working_directory',    False, False, 'core:Trace'),
+    ('work_item_data_ref',   False, False, 'core:Trace'),
+))
+
+def propbundle_WindowsTask(uco_object, image_name=MISSING, application_ref=MISSING, parameters=MISSING,
+                           account_ref=MISSING, account_run_level=MISSING, account_logon_type=MISSING,
+                           creator=MISSING, created_time=MISSING, most_recent_run_time=MISSING,
+                           exit_code=MISSING, max_run_time=MISSING, next_run_time=MISSING,
+                           action_list=MISSING, trigger_list=MISSING, comment=MISSING,
+                           working_directory=MISSING, work_item_data_ref=MISSING, **kwargs):
+    '''
+    :param ImageName: At most one value of type String.
+    :param ApplicationRef: At most one occurrence of type Trace.
+    :param Parameters: At most one value of type String.
+    :param AccountRef: At most one occurrence of type Trace.
+    :param AccountRunLevel: At most one value of type String.
+    :param AccountLogonType: At most one value of type String.
+    :param Creator: At most one value of type String.
+    :param CreatedTime: At most one value of type Datetime.
+    :param MostRecentRunTime: At most one value of type Datetime.
+    :param ExitCode: At most one value of type Long.
+    :param MaxRunTime: At most one value of type Long.
+    :param NextRunTime: At most one value of type Datetime.
+    :param ActionList: Any number of occurrences of type TaskActionType.
+    :param TriggerList: Any number of occurrences of type TriggerType.
+    :param Comment: At most one value of type String.
+    :param WorkingDirectory: At most one occurrence of type Trace.
+    :param WorkItemDataRef: At most one occurrence of type Trace.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_WindowsTask.check(uco_object.document, image_name, application_ref, parameters, account_ref,
+                                  account_run_level, account_logon_type, creator, created_time,
+                                  most_recent_run_time, exit_code, max_run_time, next_run_time, action_list,
+                                  trigger_list, comment, working_directory, work_item_data_ref)
+
+    return uco_object.create_PropertyBundle('WindowsTask', **properties(kwargs, image_name=image_name,
+                                            application_ref=application_ref, parameters=parameters,
+                                            account_ref=account_ref, account_run_level=account_run_level,
+                                            account_logon_type=account_logon_type, creator=creator,
+                                            created_time=created_time,
+                                            most_recent_run_time=most_recent_run_time, exit_code=exit_code,
+                                            max_run_time=max_run_time, next_run_time=next_run_time,
+                                            action_list=action_list, trigger_list=trigger_list,
+                                            comment=comment, working_directory=working_directory,
+                                            work_item_data_ref=work_item_data_ref))
+
+
+_propbundle_WindowsThread = Checks('propbundle_WindowsThread', (
+    ('thread_id',           False, False, 'PositiveInteger'),
+    ('running_status',      False, False, 'core:ControlledVocabulary'),
+    ('context',             False, False, 'String'),
+    ('priority',            False, False, 'Integer'),
+    ('creation_time',       False, False, 'Datetime'),
+    ('security_attributes', False, False, 'String'),
+    ('stack_size',          False, False, 'PositiveInteger'),
+))
+
+def propbundle_WindowsThread(uco_object, thread_id=MISSING, running_status=MISSING, context=MISSING,
+                             priority=MISSING, creation_flags=MISSING, creation_time=MISSING,
+                             start_address=MISSING, parameter_address=MISSING, security_attributes=MISSING,
+                             stack_size=MISSING, **kwargs):
+    '''
+    :param ThreadID: At most one value of type PositiveInteger.
+    :param RunningStatus: At most one occurence of type ControlledVocabulary.
+    :param Context: At most one value of type String.
+    :param Priority: At most one value of type Integer.
+    :param CreationFlags: At most one value of type HexBinary.
+    :param CreationTime: At most one value of type Datetime.
+    :param StartAddress: At most one value of type HexBinary.
+    :param ParameterAddress: At most one value of type HexBinary.
+    :param SecurityAttributes: At most one value of type String.
+    :param StackSize: At most one value of type PositiveInteger.
+    :return: A PropertyBundle object.
+    '''
+
+    #TODO:HexBinary
+    #TODO:HexBinary
+    #TODO:HexBinary
+    _propbundle_WindowsThread.check(uco_object.document, thread_id, running_status, context, priority,
+                                    creation_time, security_attributes, stack_size)
+
+    return uco_object.create_PropertyBundle('WindowsThread', **properties(kwargs, thread_id=thread_id,
+                                            running_status=running_status, context=context, priority=priority,
+                                            creation_flags=creation_flags, creation_time=creation_time,
+                                            start_address=start_address, parameter_address=parameter_address,
+                                            security_attributes=security_attributes, stack_size=stack_size))
+
+
+_propbundle_WindowsVolume = Checks('propbundle_WindowsVolume', (
+    ('drive_letter', True,  False, 'String'),
+))
+
+def propbundle_WindowsVolume(uco_object, drive_letter=MISSING, **kwargs):
+    '''
+    :param DriveLetter: Exactly one value of type String.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_WindowsVolume.check(uco_object.document, drive_letter)
+
+    return uco_object.create_PropertyBundle('WindowsVolume', **properties(kwargs, drive_letter=drive_letter))
+
+
+_propbundle_WirelessNetworkConnection = Checks('propbundle_WirelessNetworkConnection', (
+    ('base_station', False, False, 'String'),
+    ('ssid',         False, False, 'String'),
+))
+
+def propbundle_WirelessNetworkConnection(uco_object, base_station=MISSING, ssid=MISSING, **kwargs):
+    '''
+    :param BaseStation: At most one value of type String.
+    :param SSID: At most one value of type String.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_WirelessNetworkConnection.check(uco_object.document, base_station, ssid)
+
+    return uco_object.create_PropertyBundle('WirelessNetworkConnection', **properties(kwargs,
+                                            base_station=base_station, ssid=ssid))
+
+
+_propbundle_X509Certificate = Checks('propbundle_X509Certificate', (
+    ('is_self_signed',               False, False, 'Bool'),
+    ('version',                      False, False, 'String'),
+    ('serial_number',                False, False, 'String'),
+    ('signature_algorithm',          False, False, 'String'),
+    ('signature',                    False, False, 'String'),
+    ('issuer',                       False, False, 'String'),
+    ('issuer_hash',                  False, False, 'duck:Hash'),
+    ('validity_not_before',          False, False, 'Datetime'),
+    ('validity_not_after',           False, False, 'Datetime'),
+    ('subject',                      False, False, 'String'),
+    ('subject_hash',                 False, False, 'duck:Hash'),
+    ('subject_public_key_algorithm', False, False, 'String'),
+    ('subject_public_key_modulus',   False, False, 'String'),
+    ('subject_public_key_exponent',  False, False, 'Integer'),
+    ('x509V3Extensions',             False, False, 'duck:X509V3Extensions'),
+    ('thumbprint_hash',              False, False, 'duck:Hash'),
+))
+
+def propbundle_X509Certificate(uco_object, is_self_signed=MISSING, version=MISSING, serial_number=MISSING,
+                               signature_algorithm=MISSING, signature=MISSING, issuer=MISSING,
+                               issuer_hash=MISSING, validity_not_before=MISSING, validity_not_after=MISSING,
+                               subject=MISSING, subject_hash=MISSING, subject_public_key_algorithm=MISSING,
+                               subject_public_key_modulus=MISSING, subject_public_key_exponent=MISSING,
+                               x509V3Extensions=MISSING, thumbprint_hash=MISSING, **kwargs):
+    '''
+    :param IsSelfSigned: At most one value of type Bool.
+    :param Version: At most one value of type String.
+    :param SerialNumber: At most one value of type String.
+    :param SignatureAlgorithm: At most one value of type String.
+    :param Signature: At most one value of type String.
+    :param Issuer: At most one value of type String.
+    :param IssuerHash: At most one occurrence of type Hash.
+    :param ValidityNotBefore: At most one value of type Datetime.
+    :param ValidityNotAfter: At most one value of type Datetime.
+    :param Subject: At most one value of type String.
+    :param SubjectHash: At most one occurrence of type Hash.
+    :param SubjectPublicKeyAlgorithm: At most one value of type String.
+    :param SubjectPublicKeyModulus: At most one value of type String.
+    :param SubjectPublicKeyExponent: At most one value of type Integer.
+    :param Extensions: At most one occurrence of type X509V3Extensions.
+    :param ThumbprintHash: At most one occurrence of type Hash.
+    :return: A PropertyBundle object.
+    '''
+
+    _propbundle_X509Certificate.check(uco_object.document, is_self_signed, version, serial_number,
+                                      signature_algorithm, signature, issuer, issuer_hash,
+                                      validity_not_before, validity_not_after, subject, subject_hash,
+                                      subject_public_key_algorithm, subject_public_key_modulus,
+                                      subject_public_key_exponent, x509V3Extensions, thumbprint_hash)
+
+    return uco_object.create_PropertyBundle('X509Certificate', **properties(kwargs,
+                                            is_self_signed=is_self_signed, version=version,
+                                            serial_number=serial_number,
+                                            signature_algorithm=signature_algorithm, signature=signature,
+                                            issuer=issuer, issuer_hash=issuer_hash,
+                                            validity_not_before=validity_not_before,
+                                            validity_not_after=validity_not_after, subject=subject,
+                                            subject_hash=subject_hash,
+                                            subject_public_key_algorithm=subject_public_key_algorithm,
+                                            subject_public_key_modulus=subject_public_key_modulus,
+                                            subject_public_key_exponent=subject_public_key_exponent,
+                                            x509V3Extensions=x509V3Extensions,
+                                            thumbprint_hash=thumbprint_hash))
+
+
+predicates.register(globals())
@@ -0,0 +1,320 @@
+# NOTICE
+# 
+# This software was produced for the U.S. Government under
+# contract SB-1341-14-CQ-0010, and is subject to the Rights
+# in Data-General Clause 52.227-14, Alt. IV (DEC 2007)
+#
+# (c) 2018 The MITRE Corporation. All Rights Reserved.
+
+#====================================================
+# CASE NLG VERIFIER v0.1.0 - CHILDREN
+
+"""NLG functions creating the children of CASE objects as SubObjects (<kind>_sub_<Type>)."""
+
+from NLG import predicates
+from NLG.checks import Checks, MISSING
+from NLG.predicates import properties
+
+
+#====================================================
+#-- CORE CHILDREN IN ALPHABETICAL ORDER
+
+_core_sub_ActionLifecycle = Checks('core_sub_ActionLifecycle', (
+    ('uco_object', True,  False, 'core:Action'),
+))
+
+def core_sub_ActionLifecycle(uco_document, uco_object, **kwargs):
+    '''
+    :param PhraseRefs: Exactly one occurrence of type ArrayOfAction.
+    :param ActionStatus: Exactly zero occurrences of type ControlledVocabulary.
+    :param StartTime: Exactly zero values of type Datetime.
+    :param EndTime: Exactly zero values of type Datetime.
+    :param (Unnamed Class): Exactly zero values of any type.
+    :param ActionCount: Exactly zero values of type PositiveInteger.
+    :return: A SubObject object.
+    '''
+
+    # TODO:This class checks if the fields for core_Action are not present.
+    # If they are this object cannot be used and an error should be thrown. Is this a correct interpretation?
+    _core_sub_ActionLifecycle.check(uco_document, uco_object)
+
+    return uco_document.create_SubObject('ActionLifecycle', **kwargs)
+
+
+_core_sub_ForensicAction = Checks('core_sub_ForensicAction', (
+    ('uco_object', True,  False, 'core:Action'),
+))
+
+def core_sub_ForensicAction(uco_document, uco_object, **kwargs):
+    '''
+    :return: A SubObject object.
+    '''
+
+    #TODO:NothingElseToCheck
+    _core_sub_ForensicAction.check(uco_document, uco_object)
+
+    return uco_document.create_SubObject('ForensicAction', **kwargs)
+
+
+#====================================================
+#-- CONTEXT CHILDREN IN ALPHABETICAL ORDER
+
+    # NO CHILDREN OF CONTEXT YET
+
+
+#====================================================
+#-- PROPERTYBUNDLE CHILDREN IN ALPHABETICAL ORDER
+
+_propbundle_sub_Address = Checks('propbundle_sub_Address', (
+    ('uco_object_propbundle', True,  False, 'propbundle:Identity'),
+    ('address_ref',           True,  False, 'core:Location'),
+))
+
+def propbundle_sub_Address(uco_document, uco_object_propbundle, address_ref=MISSING, **kwargs):
+    '''
+    :param AddressRef: Exactly one occurrence of type Location.
+    :return: A SubObject object.
+    '''
+
+    _propbundle_sub_Address.check(uco_document, uco_object_propbundle, address_ref)
+
+    return uco_document.create_SubObject('Address', **kwargs)
+
+
+_propbundle_sub_Affiliation = Checks('propbundle_sub_Affiliation', (
+    ('uco_object_propbundle', True,  False, 'propbundle:Identity'),
+))
+
+def propbundle_sub_Affiliation(uco_document, uco_object_propbundle, **kwargs):
+    '''
+    :return: A SubObject object.
+    '''
+
+    #TODO:NothingElseToCheck
+    _propbundle_sub_Affiliation.check(uco_document, uco_object_propbundle)
+
+    return uco_document.create_SubObject('Affiliation', **kwargs)
+
+
+_propbundle_sub_BirthInformation = Checks('propbundle_sub_BirthInformation', (
+    ('uco_object_propbundle', True,  False, 'propbundle:Identity'),
+    ('birth_date',            True,  False, 'Datetime'),
+))
+
+def propbundle_sub_BirthInformation(uco_document, uco_object_propbundle, birth_date=MISSING, **kwargs):
+    '''
+    :param BirthDate: Exactly one value of type Datetime.
+    :return: A SubObject object.
+    '''
+
+    _propbundle_sub_BirthInformation.check(uco_document, uco_object_propbundle, birth_date)
+
+    return uco_document.create_SubObject('BirthInformation', **kwargs)
+
+
+_propbundle_sub_CountriesOfResidence = Checks('propbundle_sub_CountriesOfResidence', (
+    ('uco_object_propbundle', True,  False, 'propbundle:Identity'),
+))
+
+def propbundle_sub_CountriesOfResidence(uco_document, uco_object_propbundle, **kwargs):
+    '''
+    :return: A SubObject object.
+    '''
+
+    #TODO:NothingElseToCheck
+    _propbundle_sub_CountriesOfResidence.check(uco_document, uco_object_propbundle)
+
+    return uco_document.create_SubObject('CountriesOfResidence', **kwargs)
+
+
+_propbundle_sub_Events = Checks('propbundle_sub_Events', (
+    ('uco_object_propbundle', True,  False, 'propbundle:Identity'),
+))
+
+def propbundle_sub_Events(uco_document, uco_object_propbundle, **kwargs):
+    '''
+    :return: A SubObject object.
+    '''
+
+    #TODO:NothingElseToCheck
+    _propbundle_sub_Events.check(uco_document, uco_object_propbundle)
+
+    return uco_document.create_SubObject('Events', **kwargs)
+
+
+_propbundle_sub_Identifier = Checks('propbundle_sub_Identifier', (
+    ('uco_object_propbundle', True,  False, 'propbundle:Identity'),
+))
+
+def propbundle_sub_Identifier(uco_document, uco_object_propbundle, **kwargs):
+    '''
+    :return: A SubObject object.
+    '''
+
+    #TODO:NothingElseToCheck
+    _propbundle_sub_Identifier.check(uco_document, uco_object_propbundle)
+
+    return uco_document.create_SubObject('Identifier', **kwargs)
+
+
+_propbundle_sub_Languages = Checks('propbundle_sub_Languages', (
+    ('uco_object_propbundle', True,  False, 'propbundle:Identity'),
+))
+
+def propbundle_sub_Languages(uco_document, uco_object_propbundle, **kwargs):
+    '''
+    :return: A SubObject object.
+    '''
+
+    #TODO:NothingElseToCheck
+    _propbundle_sub_Languages.check(uco_document, uco_object_propbundle)
+
+    return uco_document.create_SubObject('Languages', **kwargs)
+
+
+_propbundle_sub_Nationality = Checks('propbundle_sub_Nationality', (
+    ('uco_object_propbundle', True,  False, 'propbundle:Identity'),
+))
+
+def propbundle_sub_Nationality(uco_document, uco_object_propbundle, **kwargs):
+    '''
+    :return: A SubObject object.
+    '''
+
+    #TODO:NothingElseToCheck
+    _propbundle_sub_Nationality.check(uco_document, uco_object_propbundle)
+
+    return uco_document.create_SubObject('Nationality', **kwargs)
+
+
+_propbundle_sub_Occupation = Checks('propbundle_sub_Occupation', (
+    ('uco_object_propbundle', True,  False, 'propbundle:Identity'),
+))
+
+def propbundle_sub_Occupation(uco_document, uco_object_propbundle, **kwargs):
+    '''
+    :return: A SubObject object.
+    '''
+
+    #TODO:NothingElseToCheck
+    _propbundle_sub_Occupation.check(uco_document, uco_object_propbundle)
+
+    return uco_document.create_SubObject('Occupation', **kwargs)
+
+
+_propbundle_sub_OrganizationDetails = Checks('propbundle_sub_OrganizationDetails', (
+    ('uco_object_propbundle', True,  False, 'propbundle:Identity'),
+))
+
+def propbundle_sub_OrganizationDetails(uco_document, uco_object_propbundle, **kwargs):
+    '''
+    :return: A SubObject object.
+    '''
+
+    #TODO:NothingElseToCheck
+    _propbundle_sub_OrganizationDetails.check(uco_document, uco_object_propbundle)
+
+    return uco_document.create_SubObject('OrganizationDetails', **kwargs)
+
+
+_propbundle_sub_PersonalDetails = Checks('propbundle_sub_PersonalDetails', (
+    ('uco_object_propbundle', True,  False, 'propbundle:Identity'),
+))
+
+def propbundle_sub_PersonalDetails(uco_document, uco_object_propbundle, **kwargs):
+    '''
+    :return: A SubObject object.
+    '''
+
+    #TODO:NothingElseToCheck
+    _propbundle_sub_PersonalDetails.check(uco_document, uco_object_propbundle)
+
+    return uco_document.create_SubObject('PhysicalInfo', **kwargs)
+
+
+_propbundle_sub_Qualification = Checks('propbundle_sub_Qualification', (
+    ('uco_object_propbundle', True,  False, 'propbundle:Identity'),
+))
+
+def propbundle_sub_Qualification(uco_document, uco_object_propbundle, **kwargs):
+    '''
+    :return: A SubObject object.
+    '''
+
+    #TODO:NothingElseToCheck
+    _propbundle_sub_Qualification.check(uco_document, uco_object_propbundle)
+
+    return uco_document.create_SubObject('Qualification', **kwargs)
+
+
+_propbundle_sub_Relationship = Checks('propbundle_sub_Relationship', (
+    ('uco_object_propbundle', True,  False, 'propbundle:Identity'),
+))
+
+def propbundle_sub_Relationship(uco_document, uco_object_propbundle, **kwargs):
+    '''
+    :return: A SubObject object.
+    '''
+
+    #TODO:NothingElseToCheck
+    _propbundle_sub_Relationship.check(uco_document, uco_object_propbundle)
+
+    return uco_document.create_SubObject('Relationship', **kwargs)
+
+
+_propbundle_sub_SimpleName = Checks('propbundle_sub_SimpleName', (
+    ('uco_object_propbundle', True,  False, 'propbundle:Identity'),
+))
+
+def propbundle_sub_SimpleName(uco_document, uco_object_propbundle, family_name=MISSING, given_name=MISSING,
+                              honorific_prefix=MISSING, honorific_suffix=MISSING, **kwargs):
+    '''
+    :param FamilyName: Any number of values of any type.
+    :param GivenName: Any number of values of any type.
+    :param HonorificPrefix: Any number of values of any type.
+    :param HonorificSuffix: Any number of values of any type.
+    :return: A SubObject object.
+    '''
+
+    #TODO:NothingElseToCheck
+    _propbundle_sub_SimpleName.check(uco_document, uco_object_propbundle)
+
+    return uco_document.create_SubObject('ForensicAction', **properties(kwargs, family_name=family_name,
+                                         given_name=given_name, honorific_prefix=honorific_prefix,
+                                         honorific_suffix=honorific_suffix))
+
+
+_propbundle_sub_Visa = Checks('propbundle_sub_Visa', (
+    ('uco_object_propbundle', True,  False, 'propbundle:Identity'),
+))
+
+def propbundle_sub_Visa(uco_document, uco_object_propbundle, **kwargs):
+    '''
+    :return: A SubObject object.
+    '''
+
+    #TODO:NothingElseToCheck
+    _propbundle_sub_Visa.check(uco_document, uco_object_propbundle)
+
+    return uco_document.create_SubObject('Visa', **kwargs)
+
+
+#====================================================
+#-- DUCK CHILDREN IN ALPHABETICAL ORDER
+
+_duck_sub_ArrayOfAction = Checks('duck_sub_ArrayOfAction', (
+    ('duck_object', True,  False, 'duck:ArrayOfObject'),
+))
+
+def duck_sub_ArrayOfAction(uco_document, duck_object, **kwargs):
+    '''
+    :return: A SubObject object.
+    '''
+
+    #TODO:NothingElseToCheck
+    _duck_sub_ArrayOfAction.check(uco_document, duck_object)
+
+    return uco_document.create_SubObject('ArrayOfAction', **kwargs)
+
+
+predicates.register(globals())
@@ -10,20 +10,19 @@
 #=====================================================
 # Autogeneration currently only supports v0.1.0 and v0.2.0 for CASE/UCO.
 
+from __future__ import print_function
 import argparse
 import sys
-from cStringIO import StringIO
 import pprint
-import rdflib
-from ontospy import *
-from inputs import parse_restrictions
+from rdflib import BNode
+from inputs.ontology import Ontology, local_name, index_classes, name_functions
 from inputs.xsd_validation import XSDValidator
 
 parser = argparse.ArgumentParser(description='Autogeneration of the python classes')
-parser.add_argument('ttl_file', help='turtle file that defines the case ontology (.ttl file)')
+parser.add_argument('ttl_file', nargs='+', help='turtle file(s) that define the case ontology (.ttl files), read as one ontology')
 args = parser.parse_args()
 
-input_file = args.ttl_file
+input_files = args.ttl_file
 
 
 #=====================================================
@@ -54,8 +53,8 @@ debug_txt.truncate()
 
 def debug_print(text):
     if debugging==True:
-        print text
-        print ""
+        print(text)
+        print("")
     if debug_out==True:
         debug_txt.write(text)
         debug_txt.write("\n\n")
@@ -72,10 +71,10 @@ def write_body_assert(prop, p_required, prop_dict, dict_dict, card_field, card_t
         prop_types = prop_dict[prop]
         if len(prop_types) > 1:
             debug_print("Property ({}) has multiple types specified:\n{}\n".format(prop, prop_types))
-            return ""
+            return body_assert_types
     else:
         debug_print("Property ({}) has no type specified:\n".format(prop))
-        return ""
+        return body_assert_types
 
     p_type = prop_types[0]
     p_type_found = False
@@ -152,259 +151,80 @@ def write_body_assert(prop, p_required, prop_dict, dict_dict, card_field, card_t
 
 
 #=====================================================
-print "~~~ START"
+print("~~~ START")
 
 #namespaces  = ['owl', 'core', 'olo']                        # Only these namespaces will be used.
-namespaces  = ['http://unifiedcyberontology.org','http://case.example.org']
 unknown_ns  = []
-classes     = None
-properties  = None
 onto_dict   = {}
 prop_dict   = {}
 dict_dict   = {}
 func_name   = None
 prop_list   = []
 card_dict   = None
-line_number = 1
 body_assert_types = ""
 miss_prop_list = []
 cust_prop_list = []
 improper_turtl = []
 
-# Load RDF via Ontospy.
-graph = Ontospy(uri_or_path=input_file, rdf_format='turtle', verbose=True)
-graph.load_rdf(input_file, verbose=True)
-graph.extract_entities()
+# Load the classes, properties, ranges and restrictions straight from the RDF triples.
+ontology = Ontology(input_files)
 
 
 #=====================================================
-# Copy stdout to a variable between (stdout -> copied_stdout -> stdout).
+# Determine class name, nesting level, and parent (index=row # of the class tree, starting at 1).
 
-#print "-------------------------"
-pointer_to_original_stdout = sys.stdout
-sys.stdout = copied_stdout = StringIO()
-graph.printClassTree()
-classes    = graph.ontologyClassTree()
-class_tree = copied_stdout.getvalue()
-sys.stdout = pointer_to_original_stdout
-
-
-#=====================================================
-# Determine class name, nesting level, and parent (index=line # of printClassTree output).
-
-c_tree_split = class_tree.split('\n')[:-1]
-for uri in c_tree_split:
-    if '----' in uri:
-        space = uri.split('----')
-        level = len(space) - 1
-        last_nlg_type = nlg_type
-    else:
-        level = 0
-    spltz = uri.split('----')[-1]
-    if '#' in uri:
-        namespace = spltz.split('#')[0]
-        nlg_type  = spltz.split('#')[-1]
-    elif ':' in uri:
-        namespace = spltz.split(':')[0]
-        nlg_type = spltz.split(':')[-1]
-    else:                                                   #Skip unknown namespaces and add to list when syntax differs.
-        namespace = spltz
-        if namespace not in unknown_ns:
-            unknown_ns.append(namespace)
-        continue
-
-    onto_dict[nlg_type] = {}
-    onto_dict[nlg_type]['index'] = line_number
-    onto_dict[nlg_type]['level'] = level
-    if level == 0:
-        onto_dict[nlg_type]['parent'] = 'root'
-    elif ('----' in uri) and (onto_dict[last_nlg_type]['level'] >= level):
-        count_down = line_number - 2
-        while count_down != 0:
-            for nlg_entry in onto_dict:
-                comp_index = onto_dict[nlg_entry]['index']
-                if comp_index == count_down:
-                    comp_level = onto_dict[nlg_entry]['level']
-                    if comp_level >= level:
-                        count_down -= 1
-                        break
-                    else:
-                        onto_dict[nlg_type]['parent'] = nlg_entry
-                        count_down = 0
-                        break
-    else:
-        onto_dict[nlg_type]['parent'] = last_nlg_type
-    line_number += 1
-
-#=====================================================
-# Also avoid standard output while still piping the PropertyTree into a variable.
-
-pointer_to_original_stdout = sys.stdout
-sys.stdout = copied_stdout = StringIO()
-graph.printPropertyTree()
-properties  = graph.ontologyPropTree()
-property_tree = copied_stdout.getvalue()
-sys.stdout = pointer_to_original_stdout
+class_types = index_classes(ontology.class_tree(), onto_dict)     #Index -> class name.
 
 
 #=====================================================
 # Get the properties for each class.
-# Also correct parent for level==0 classes that have subClassOf.
-
-for ontoclass_obj in classes:
-    class_list = classes[ontoclass_obj]
-    for c in class_list:
-        if '#' in str(c):
-            class_split = str(c).split('#')
-            nlg_type    = class_split[1].strip('*>')
-        elif ':' in str(c):
-            class_split = str(c).split(':')
-            nlg_type    = class_split[1].strip('*>')
-        else:                                               #Skip unknown namespaces and add to list when syntax differs.
-            spltz     = str(c).strip('<Class ').strip('>').strip('*')
-            namespace = spltz
-            if namespace not in unknown_ns:
-                unknown_ns.append(namespace)
-            continue
+# Also correct parent for level==0 classes that have subClassOf (a superclass outside the loaded ontology).
 
-#        print nlg_type                                      #TEST1
-#        print c.domain_of                                   #Use these to see inheritance details.
-#        print c.range_of
-#        print c.domain_of_inferred
-#        print c.range_of_inferred
-
-        prop_list = []
-        if c.domain_of == []:                               #Classes with no domain (properties) are included to allow for children with properties (these children need may need a parent to retain the correct nesting level and linkage back to their root parent).
-            debug_print("Gap or ambiguity/redundancy in ontology (no properties for class):\n{}".format(c))
-        for uri in c.domain_of:
-            if '#' in str(uri):
-                property_split = str(uri).split('#')
-                property_type  = property_split[1].strip('*>')
-            elif ':' in str(uri):
-                property_split = str(uri).split(':')
-                property_type  = property_split[1].strip('*>')
-            else:
-                spltz     = str(uri).strip('<Property ').strip('>').strip('*')
-                namespace = spltz
-                if namespace not in unknown_ns:
-                    unknown_ns.append(namespace)
-                continue
-            prop_list.append(property_type)
-        onto_dict[nlg_type]['properties'] = prop_list
-
-        if onto_dict[nlg_type]['level']==0:                 #This only handles single parents.
-            parent_list = graph.sparqlHelper.getClassDirectSupers(c.uri)
-            for embedded_tuple in parent_list:
-                for parent_uri in embedded_tuple:
-                    if '#' in str(parent_uri):
-                        parent_split   = str(parent_uri).split('#')
-                        parent_type    = parent_split[1].strip('*>')
-                        onto_dict[nlg_type]['parent'] = parent_type
-                    elif ':' in str(parent_uri):
-                        parent_split   = str(parent_uri).split(':')
-                        parent_type    = parent_split[1].strip('*>')
-                        onto_dict[nlg_type]['parent'] = parent_type
-                    else:
-                        spltz     = str(parent_uri).strip('<Class ').strip('>').strip('*')
-                        namespace = spltz
-                        if namespace not in unknown_ns:
-                            unknown_ns.append(namespace)
-                        continue
+for nlg_type in onto_dict:
+    class_uri = onto_dict[nlg_type]['uri']
+    if ontology.domain_of[class_uri] == []:             #Classes with no domain (properties) are included to allow for children with properties (these children need may need a parent to retain the correct nesting level and linkage back to their root parent).
+        debug_print("Gap or ambiguity/redundancy in ontology (no properties for class):\n{}".format(class_uri))
+    onto_dict[nlg_type]['properties'] = [local_name(uri) for uri in ontology.domain_of[class_uri]]
+
+    if onto_dict[nlg_type]['level']==0:                 #This only handles single parents.
+        for parent_uri in ontology.classes[class_uri]:
+            onto_dict[nlg_type]['parent'] = local_name(parent_uri)
 
 
 #=====================================================
 # Create properties dictionary to track their types.
 
-for ontoprop_obj in properties:
-    prop_list = properties[ontoprop_obj]
-    for p in prop_list:
-        if '#' in str(p):
-            prop_split = str(p).split('#')
-        elif ':' in str(p):
-            prop_split = str(p).split(':')
-        else:                                               #Skip unknown namespaces and add to list when syntax differs.
-            spltz     = str(p).strip('<Property ').strip('>').strip('*')
-            namespace = spltz
-            unknown_ns.append(namespace)
+for prop_uri in sorted(ontology.properties):
+    prop = local_name(prop_uri)
+    prop_types = []
+    for ppt in ontology.properties[prop_uri]:
+        if isinstance(ppt, BNode):                       #Skip anonymous ranges (unions etc.) and report them.
+            unknown_ns.append(str(ppt))
             continue
-        prop       = prop_split[1].strip('*>')
-        possible_prop_types = p.ranges
-
-        prop_types = []
-        for ppt in possible_prop_types:
-            if '#' in str(ppt):
-                ppt_split = str(ppt).split('#')
-                ppt_type  = ppt_split[1].strip('*>')
-            elif ':' in str(ppt):
-                ppt_split = str(ppt).split(':')
-                ppt_type  = ppt_split[1].strip('*>')
-            else:
-                spltz     = str(ppt).strip('<Property ').strip('>').strip('*')
-                namespace = spltz
-                unknown_ns.append(namespace)
-                continue
-            prop_types.append(ppt_type) 
-
-        if prop_types == []:                                #Remove properties with no possible types.
-            debug_print("Gap or ambiguity/redundancy in ontology (property has no possible types):\n{}".format(prop))
-            onto_prop_list = onto_dict[nlg_type]['properties']
-            for op in onto_prop_list:
-                if prop == op:
-                    prop_index = onto_prop_list.index(op)
-                    del onto_dict[nlg_type]['properties'][prop_index]
-                    break
-            continue
-        prop_dict[prop] = prop_types
+        prop_types.append(local_name(ppt))
+
+    if prop_types == []:                                #Remove properties with no possible types.
+        debug_print("Gap or ambiguity/redundancy in ontology (property has no possible types):\n{}".format(prop))
+        for class_uri in ontology.domain_of:
+            if prop_uri in ontology.domain_of[class_uri]:
+                onto_prop_list = onto_dict[local_name(class_uri)]['properties']
+                if prop in onto_prop_list:
+                    onto_prop_list.remove(prop)
+        continue
+    prop_dict[prop] = prop_types
 
 xsd_output_file = 'outputs/xsd-prop-types.xsd'
 validator = XSDValidator(xsd_output_file, prop_dict=prop_dict)
-validator.generate_xsd_file()
-validator.remove_non_xsd_types()
+validator.generate_xsd_file()                               #Only properties with XSD built-in ranges are written.
 
 
 #=====================================================
 # Determine function name based on nesting level and parent's function name.
 # First level zero must be determined first so that sub names can be based on their parent's name.
-# If parent was not parsed in the class tree, skip it (reported because this means top-level item
-# does not have parent specified in Turtle) and relabel parent to 'root' and rerun (so that children
-# can still be processed).
-
-#print "-------------------------"
-count = 1
-while count < (line_number + 1):
-    for current_entry in onto_dict:
-        index = onto_dict[current_entry]['index']
-        if index == count:
-            nlg_type = current_entry
-            break
-    level = onto_dict[nlg_type]['level']
-    parent = onto_dict[nlg_type]['parent']
-
-    if (parent == 'root'):              
-        func_name = 'duck_'
-        onto_dict[nlg_type]['func_name'] = func_name
-        count += 1
-    elif (parent == 'UcoObject'):
-        if not (level == 0 or level == 1):
-            print "Error in ontology! UcoObject can only be the parent of a class with nesting level of zero (top-level) or one (below top-level)."
-        func_name = 'core_'
-        onto_dict[nlg_type]['func_name'] = func_name
-        count += 1
-    elif (parent == 'PropertyBundle'):
-        if not (level == 0 or level == 1):
-            print "Error in ontology! PropertyBundle can only be the parent of a class with nesting level of zero (top-level) or one (below top-level)."
-        func_name = 'prop_'
-        onto_dict[nlg_type]['func_name'] = func_name
-        count += 1
-    elif (parent not in onto_dict.keys()):
-        debug_print("Gap or ambiguity/redundancy in ontology (parent class does not exist in the class tree):\n{}".format(parent))
-        onto_dict[nlg_type]['parent'] = 'root'
-        continue
-    else:
-        parent_func_name = onto_dict[parent]['func_name']
-        func_name = parent_func_name + 'sub_'
-        onto_dict[nlg_type]['func_name'] = func_name
-        count += 1
+# If parent was not parsed in the class tree, it is reported (because this means top-level item
+# does not have parent specified in Turtle) and relabeled 'root' (so that children can still be processed).
+
+name_functions(onto_dict, class_types, debug_print)
 
 
 #=====================================================
@@ -418,10 +238,9 @@ for k in onto_dict.keys():
 
 
 #=====================================================
-# Parse input_file
+# Cardinality restrictions of each class (from the owl:Restriction superclasses).
 
-restrx      = parse_restrictions.Restrictions(input_file, namespaces, onto_dict.keys(), prop_dict.keys())
-card_dict   = restrx.parse(cardinality=True)
+card_dict   = ontology.cardinalities()
 del onto_dict                                               #Free memory.
 
 
@@ -438,6 +257,18 @@ nlg_header = nlg_prefix.read()
 nlg.write(nlg_header)
 nlg_prefix.close()
 
+# Class tree, so that type checks accept subclasses (see register_types() in case.py).
+type_parents = []
+for func_category in dict_dict:
+    for nlg_type in dict_dict[func_category]:
+        parent = dict_dict[func_category][nlg_type]['parent']
+        if parent != 'root':
+            type_parents.append((nlg_type, parent))
+nlg.write("\n\nTYPE_PARENTS = {\n")
+for nlg_type, parent in sorted(type_parents):
+    nlg.write("    '{}': ('{}',),\n".format(nlg_type, parent))
+nlg.write("}\n\ncase.register_types(TYPE_PARENTS)\n")
+
 for func_category in sorted(dict_dict):
     category = func_category.upper().replace('_',' ')[:-1]
     nlg.write("\n\n#=====================================================\n")
@@ -460,7 +291,7 @@ for func_category in sorted(dict_dict):
         continue
 
     for nlg_type in sorted(dict_dict[func_category]):
-        print nlg_type
+        print(nlg_type)
         c_list     = dict_dict[func_category].keys()
         f_name     = dict_dict[func_category][nlg_type]['func_name'] + nlg_type
         parent     = dict_dict[func_category][nlg_type]['parent']
@@ -634,8 +465,7 @@ for func_category in sorted(dict_dict):
 #                print 'REQUIRED WRITE'
                 nlg.write(tab + 'assert not isinstance(' + prop + ', Missing),\\' + '\n')
                 nlg.write(tab + '"[' + f_name + '] ' + prop + ' is required."' + '\n')
-                bat = write_body_assert(prop, p_required, prop_dict, dict_dict, card_field, card_type, card_value, is_list_type, tab, f_name,  body_assert_types, xsd_output_file)
-                body_assert_types += bat
+                body_assert_types = write_body_assert(prop, p_required, prop_dict, dict_dict, card_field, card_type, card_value, is_list_type, tab, f_name,  body_assert_types, xsd_output_file)
             else:
                 # Skip optional parameters.
                 # These are written in the next block (copy of this block but with p_required == False.
@@ -689,8 +519,7 @@ for func_category in sorted(dict_dict):
 
             if p_required == False:
 #                print 'OPTIONAL WRITE'
-                bat = write_body_assert(prop, p_required, prop_dict, dict_dict, card_field, card_type, card_value, is_list_type, tab, f_name,  body_assert_types, xsd_output_file)
-                body_assert_types += bat
+                body_assert_types = write_body_assert(prop, p_required, prop_dict, dict_dict, card_field, card_type, card_value, is_list_type, tab, f_name,  body_assert_types, xsd_output_file)
             else:
                 # Skip required parameters.
                 # Already written.
@@ -722,8 +551,8 @@ nlg.close()
 
 #=====================================================
 # DEBUGGING (PYTHON-API AND CASE ONTOLOGY)
-print "-------------------------"
-print "TESTING PRINTS\n"
+print("-------------------------")
+print("TESTING PRINTS\n")
 
 #pp.pprint(onto_dict)
 #print ""
@@ -736,17 +565,16 @@ print "TESTING PRINTS\n"
 #print(body_assert_types)
 #print ""
 
-print "-------------------------"
-print "ONTOSPY  TREES\n"
+print("-------------------------")
+print("ONTOLOGY TREE\n")
 
-#print class_tree
-#print ""
-#print property_tree
-#print ""
+#for class_uri, level in ontology.class_tree():
+#    print('----' * level + local_name(class_uri))
+#print("")
 
-print "-------------------------"
-print "DEBUG WARNINGS\n"
+print("-------------------------")
+print("DEBUG WARNINGS\n")
 debug_print("Unknown namespaces:\n{}".format(unknown_ns))
 
 debug_txt.close()
-print "~~~ END"
+print("~~~ END")
@@ -8,4 +8,3 @@
 
 
 #====================================================
-import parse_restrictions
\ No newline at end of file
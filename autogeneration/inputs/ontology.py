@@ -0,0 +1,206 @@
+# NOTICE
+#
+# This software was produced for the U.S. Government under
+# contract SB-1341-14-CQ-0010, and is subject to the Rights
+# in Data-General Clause 52.227-14, Alt. IV (DEC 2007)
+#
+# (c) 2018 The MITRE Corporation. All Rights Reserved.
+
+
+#====================================================
+from __future__ import print_function
+import rdflib
+from rdflib import RDF, RDFS, OWL, BNode
+
+CLASS_TYPES = frozenset((OWL.Class, RDFS.Class))
+PROPERTY_TYPES = frozenset((RDF.Property, OWL.ObjectProperty, OWL.DatatypeProperty, OWL.AnnotationProperty))
+CARDINALITIES = frozenset((OWL.cardinality, OWL.minCardinality, OWL.maxCardinality, OWL.qualifiedCardinality,
+                           OWL.minQualifiedCardinality, OWL.maxQualifiedCardinality))
+
+
+#====================================================
+#-- ONTOLOGY MODEL
+
+def local_name(uri):
+    """The name of uri in its namespace (http://unifiedcyberontology.org/core#Facet -> Facet)."""
+    uri = str(uri)
+    if '#' in uri:
+        return uri.split('#')[-1]
+    return uri.rstrip('/').split('/')[-1]
+
+
+class Ontology(object):
+    """
+    The classes, properties, ranges and restrictions of one or more ontology files,
+    read from the rdflib triples in one pass. All dictionaries are keyed by URI:
+
+        classes:      Class URI -> list of its direct superclasses (named ones only).
+        properties:   Property URI -> list of its ranges (URIRefs, or BNodes for unions etc.).
+        domain_of:    Class URI -> list of the properties with that class as rdfs:domain.
+        restrictions: Class URI -> {property URI: (cardinality field, rdflib.Literal)}, from the
+                      owl:Restriction superclasses of the class (field and literal are None if
+                      the restriction has no cardinality).
+    """
+
+    def __init__(self, paths, rdf_format='turtle'):
+        self.graph = rdflib.Graph()
+        for path in paths:
+            self.graph.parse(path, format=rdf_format)
+
+        self.classes = {}
+        self.properties = {}
+        self.domain_of = {}
+        self.restrictions = {}
+
+        supers = {}
+        domains = {}
+        ranges = {}
+        on_property = {}
+        cardinality = {}
+        for s, p, o in self.graph:
+            if p == RDF.type:
+                if o in CLASS_TYPES and not isinstance(s, BNode):
+                    self.classes.setdefault(s, [])
+                elif o in PROPERTY_TYPES:
+                    self.properties.setdefault(s, [])
+            elif p == RDFS.subClassOf:
+                supers.setdefault(s, []).append(o)
+            elif p == RDFS.domain:
+                domains.setdefault(s, []).append(o)
+            elif p == RDFS.range:
+                ranges.setdefault(s, []).append(o)
+            elif p == OWL.onProperty:
+                on_property[s] = o
+            elif p in CARDINALITIES:
+                cardinality[s] = (local_name(p), o)
+
+        for uri in self.classes:
+            parents = self.classes[uri]
+            restrictions = self.restrictions[uri] = {}
+            for parent in sorted(supers.get(uri, ())):
+                if not isinstance(parent, BNode):
+                    parents.append(parent)
+                elif parent in on_property:
+                    restrictions[on_property[parent]] = cardinality.get(parent, (None, None))
+            self.domain_of[uri] = []
+        for uri in self.properties:
+            self.properties[uri] = sorted(ranges.get(uri, ()))
+            for domain in domains.get(uri, ()):
+                if domain in self.domain_of:
+                    self.domain_of[domain].append(uri)
+        for properties in self.domain_of.values():
+            properties.sort()
+
+
+    def class_tree(self):
+        """
+        Returns the class hierarchy as a list of (class URI, nesting level), depth first, each
+        class followed by its subclasses. Classes without a superclass in the ontology are at
+        level 0; a class with several superclasses is listed under each of them.
+        """
+        children = dict((uri, []) for uri in self.classes)
+        top = []
+        for uri in sorted(self.classes):
+            parents = [parent for parent in self.classes[uri] if parent in children]
+            for parent in parents:
+                children[parent].append(uri)
+            if not parents:
+                top.append(uri)
+
+        tree = []
+        stack = [(uri, 0, ()) for uri in reversed(top)]
+        while stack:
+            uri, level, path = stack.pop()
+            tree.append((uri, level))
+            path += (uri,)
+            stack.extend((child, level + 1, path) for child in reversed(children[uri]) if child not in path)
+        return tree
+
+
+    def cardinalities(self):
+        """
+        Returns {class name: {property name: {'card-field', 'card-value', 'card-type'}}} for
+        every class, as written into the NLG docstrings and checks. Restrictions without a
+        cardinality are 'noCardinality' (any number, as are properties without restrictions).
+        """
+        card_dict = {}
+        for uri, restrictions in self.restrictions.items():
+            class_cards = card_dict.setdefault(local_name(uri), {})
+            for prop, (card_field, card_value) in restrictions.items():
+                if card_field is None:
+                    card = {'card-field': 'noCardinality', 'card-value': 'any', 'card-type': 'string'}
+                else:
+                    card = {'card-field': card_field, 'card-value': str(card_value),
+                            'card-type': local_name(card_value.datatype) if card_value.datatype else 'string'}
+                class_cards[local_name(prop)] = card
+        return card_dict
+
+
+#====================================================
+#-- CLASS TREE
+#
+# Both passes are linear in the number of tree rows: parents come from a stack of the
+# rows above that can still be parents, and rows are visited through an index -> class array.
+
+def index_classes(class_tree, onto_dict):
+    """
+    Adds an entry per class of class_tree to onto_dict: its 'uri', 'index' (row number,
+    from 1), 'level' and 'parent' (name of the nearest row above with a lower level, or
+    'root'). A class listed under several superclasses keeps its last row.
+
+    Args:
+        class_tree: List of (class URI, level), as returned by Ontology.class_tree().
+        onto_dict: Dictionary of class name -> entry, filled in place.
+
+    Returns:
+        The class names by index; rows replaced by a later row of the same class are None.
+    """
+    types = [None]
+    stack = []
+    for index, (uri, level) in enumerate(class_tree, 1):
+        nlg_type = local_name(uri)
+        while stack and stack[-1][0] >= level:
+            stack.pop()
+        if nlg_type in onto_dict:
+            types[onto_dict[nlg_type]['index']] = None
+        onto_dict[nlg_type] = {'uri': uri, 'index': index, 'level': level,
+                               'parent': stack[-1][1] if level > 0 and stack else 'root'}
+        types.append(nlg_type)
+        stack.append((level, nlg_type))
+    return types
+
+
+def name_functions(onto_dict, types, report=print):
+    """
+    Sets the 'func_name' prefix of every class, in index order so that parents come first:
+    'core_' below UcoObject, 'prop_' below PropertyBundle, 'duck_' at the root and the
+    parent's prefix plus 'sub_' below any other class. A parent that is not in the class
+    tree is reported and replaced by 'root'.
+
+    Args:
+        onto_dict: Dictionary filled by index_classes().
+        types: The class names by index, as returned by index_classes().
+        report: Function printing the gaps found in the ontology.
+    """
+    for nlg_type in types:
+        if nlg_type is None:
+            continue
+        entry = onto_dict[nlg_type]
+        level = entry['level']
+        parent = entry['parent']
+        if parent not in ('root', 'UcoObject', 'PropertyBundle') and parent not in onto_dict:
+            report("Gap or ambiguity/redundancy in ontology (parent class does not exist in the class tree):\n{}".format(parent))
+            parent = entry['parent'] = 'root'
+
+        if parent == 'root':
+            entry['func_name'] = 'duck_'
+        elif parent == 'UcoObject':
+            if not (level == 0 or level == 1):
+                print("Error in ontology! UcoObject can only be the parent of a class with nesting level of zero (top-level) or one (below top-level).")
+            entry['func_name'] = 'core_'
+        elif parent == 'PropertyBundle':
+            if not (level == 0 or level == 1):
+                print("Error in ontology! PropertyBundle can only be the parent of a class with nesting level of zero (top-level) or one (below top-level).")
+            entry['func_name'] = 'prop_'
+        else:
+            entry['func_name'] = onto_dict[parent]['func_name'] + 'sub_'
@@ -0,0 +1,209 @@
+# NOTICE
+#
+# This software was produced for the U.S. Government under
+# contract SB-1341-14-CQ-0010, and is subject to the Rights
+# in Data-General Clause 52.227-14, Alt. IV (DEC 2007)
+#
+# (c) 2018 The MITRE Corporation. All Rights Reserved.
+
+
+#====================================================
+"""
+In-process validators for the XSD 1.1 built-in datatypes.
+
+    from xsd_types import VALIDATORS
+    VALIDATORS['dateTimeStamp']('2018-01-01T00:00:00Z')    # True
+    VALIDATORS['unsignedShort'](70000)                      # False
+
+A validator accepts the lexical form of a value (a string, checked against the
+datatype's lexical space after its whiteSpace facet) or a Python value of a matching
+type (bool for boolean, int for the integer types, datetime for dateTime, ...).
+The validators are compiled once, when this module is imported.
+"""
+
+import datetime
+import decimal
+import re
+
+try:
+    _TEXT = (str, unicode)
+    _BINARY = (bytearray,)
+    _INTEGER = (int, long)
+except NameError:
+    _TEXT = (str,)
+    _BINARY = (bytes, bytearray)
+    _INTEGER = (int,)
+
+
+#====================================================
+#-- LEXICAL SPACES
+
+_NAME_START = u'[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD]'
+_NAME_CHAR = _NAME_START[:-1] + u'\\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]'
+_NAME = _NAME_START + _NAME_CHAR + u'*'
+_NCNAME = _NAME.replace(u':', u'')
+_NMTOKEN = _NAME_CHAR + u'+'
+_TIMEZONE = u'(Z|[+-](?P<tz_hour>\\d\\d):(?P<tz_minute>\\d\\d))'
+_YEAR = u'(?P<year>-?\\d{4,})'
+_MONTH = u'(?P<month>\\d\\d)'
+_DAY = u'(?P<day>\\d\\d)'
+_TIME = u'(?P<hour>\\d\\d):(?P<minute>\\d\\d):(?P<second>\\d\\d)(?P<fraction>\\.\\d+)?'
+_B64 = u'[A-Za-z0-9+/]'
+_DECIMAL = u'[+-]?(\\d+(\\.\\d*)?|\\.\\d+)'
+
+# Name -> (pattern of the lexical space, Python types of the value space, (minimum, maximum)).
+# Patterns are matched against the whole (whitespace processed) lexical form. A None pattern
+# accepts any text; integer bounds of None are open.
+XSD_TYPES = {
+    'anySimpleType':      (None, (object,), None),
+    'anyAtomicType':      (None, (object,), None),
+    'string':             (None, _TEXT, None),
+    'normalizedString':   (u'[^\r\n\t]*', _TEXT, None),
+    'token':              (u'([^\\s]+( [^\\s]+)*)?', _TEXT, None),
+    'language':           (u'[a-zA-Z]{1,8}(-[a-zA-Z0-9]{1,8})*', _TEXT, None),
+    'Name':               (_NAME, _TEXT, None),
+    'NCName':             (_NCNAME, _TEXT, None),
+    'ID':                 (_NCNAME, _TEXT, None),
+    'IDREF':              (_NCNAME, _TEXT, None),
+    'IDREFS':             (_NCNAME + u'( ' + _NCNAME + u')*', _TEXT, None),
+    'ENTITY':             (_NCNAME, _TEXT, None),
+    'ENTITIES':           (_NCNAME + u'( ' + _NCNAME + u')*', _TEXT, None),
+    'NMTOKEN':            (_NMTOKEN, _TEXT, None),
+    'NMTOKENS':           (_NMTOKEN + u'( ' + _NMTOKEN + u')*', _TEXT, None),
+    'QName':              (u'(' + _NCNAME + u':)?' + _NCNAME, _TEXT, None),
+    'NOTATION':           (u'(' + _NCNAME + u':)?' + _NCNAME, _TEXT, None),
+    'anyURI':             (None, _TEXT, None),
+    'boolean':            (u'true|false|1|0', (bool,), None),
+    'decimal':            (_DECIMAL, _INTEGER + (decimal.Decimal, float), None),
+    'float':              (_DECIMAL + u'([Ee][+-]?\\d+)?|[+-]?INF|NaN', _INTEGER + (float,), None),
+    'double':             (_DECIMAL + u'([Ee][+-]?\\d+)?|[+-]?INF|NaN', _INTEGER + (float,), None),
+    'integer':            (u'[+-]?\\d+', _INTEGER, (None, None)),
+    'nonPositiveInteger': (u'[+-]?\\d+', _INTEGER, (None, 0)),
+    'negativeInteger':    (u'[+-]?\\d+', _INTEGER, (None, -1)),
+    'nonNegativeInteger': (u'[+-]?\\d+', _INTEGER, (0, None)),
+    'positiveInteger':    (u'[+-]?\\d+', _INTEGER, (1, None)),
+    'long':               (u'[+-]?\\d+', _INTEGER, (-2 ** 63, 2 ** 63 - 1)),
+    'int':                (u'[+-]?\\d+', _INTEGER, (-2 ** 31, 2 ** 31 - 1)),
+    'short':              (u'[+-]?\\d+', _INTEGER, (-2 ** 15, 2 ** 15 - 1)),
+    'byte':               (u'[+-]?\\d+', _INTEGER, (-2 ** 7, 2 ** 7 - 1)),
+    'unsignedLong':       (u'[+-]?\\d+', _INTEGER, (0, 2 ** 64 - 1)),
+    'unsignedInt':        (u'[+-]?\\d+', _INTEGER, (0, 2 ** 32 - 1)),
+    'unsignedShort':      (u'[+-]?\\d+', _INTEGER, (0, 2 ** 16 - 1)),
+    'unsignedByte':       (u'[+-]?\\d+', _INTEGER, (0, 2 ** 8 - 1)),
+    'duration':           (u'-?P(?=\\d|T\\d)(\\d+Y)?(\\d+M)?(\\d+D)?(T(?=\\d)(\\d+H)?(\\d+M)?(\\d+(\\.\\d+)?S)?)?',
+                           (datetime.timedelta,), None),
+    'yearMonthDuration':  (u'-?P(?=\\d)(\\d+Y)?(\\d+M)?', None, None),
+    'dayTimeDuration':    (u'-?P(?=\\d|T\\d)(\\d+D)?(T(?=\\d)(\\d+H)?(\\d+M)?(\\d+(\\.\\d+)?S)?)?',
+                           (datetime.timedelta,), None),
+    'dateTime':           (_YEAR + u'-' + _MONTH + u'-' + _DAY + u'T' + _TIME + _TIMEZONE + u'?', (datetime.datetime,), None),
+    'dateTimeStamp':      (_YEAR + u'-' + _MONTH + u'-' + _DAY + u'T' + _TIME + _TIMEZONE, (datetime.datetime,), None),
+    'date':               (_YEAR + u'-' + _MONTH + u'-' + _DAY + _TIMEZONE + u'?', (datetime.date,), None),
+    'time':               (_TIME + _TIMEZONE + u'?', (datetime.time,), None),
+    'gYearMonth':         (_YEAR + u'-' + _MONTH + _TIMEZONE + u'?', None, None),
+    'gYear':              (_YEAR + _TIMEZONE + u'?', None, None),
+    'gMonthDay':          (u'--' + _MONTH + u'-' + _DAY + _TIMEZONE + u'?', None, None),
+    'gDay':               (u'---' + _DAY + _TIMEZONE + u'?', None, None),
+    'gMonth':             (u'--' + _MONTH + _TIMEZONE + u'?', None, None),
+    'hexBinary':          (u'([0-9a-fA-F]{2})*', _BINARY, None),
+    'base64Binary':       (u'((' + _B64 + u' ?){4})*((' + _B64 + u' ?){3}' + _B64 + u'|(' + _B64 + u' ?){2}'
+                           u'[AEIMQUYcgkosw048] ?=|' + _B64 + u' ?[AQgw] ?= ?=)?', _BINARY, None),
+}
+
+# Types whose lexical forms keep their whitespace (whiteSpace="preserve" or "replace");
+# all other types collapse it, so leading and trailing whitespace is ignored.
+_PRESERVED = frozenset(('anySimpleType', 'anyAtomicType', 'string', 'normalizedString'))
+
+_DAYS = (31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _calendar(fields):
+    """True if the date, time and timezone fields matched in a lexical form are in range."""
+    month, day, hour = fields.get('month'), fields.get('day'), fields.get('hour')
+    if month is not None and not 1 <= int(month) <= 12:
+        return False
+    if day is not None:
+        if not 1 <= int(day) <= (_DAYS[int(month) - 1] if month is not None else 31):
+            return False
+        year = fields.get('year')
+        if year is not None and int(month) == 2 and int(day) == 29:
+            year = int(year)
+            if year % 4 or (year % 100 == 0 and year % 400):
+                return False
+    if hour is not None:
+        if int(hour) == 24:
+            fraction = fields['fraction']
+            if int(fields['minute']) or int(fields['second']) or (fraction and int(fraction[1:])):
+                return False
+        elif int(hour) > 23 or int(fields['minute']) > 59 or int(fields['second']) > 59:
+            return False
+    if fields.get('tz_hour') is not None:
+        tz_hour, tz_minute = int(fields['tz_hour']), int(fields['tz_minute'])
+        if tz_minute > 59 or tz_hour * 60 + tz_minute > 14 * 60:
+            return False
+    return True
+
+
+#====================================================
+#-- VALIDATORS
+
+def _compile(type_name):
+    """Returns a function testing a value against the XSD built-in type_name."""
+    pattern, value_types, bounds = XSD_TYPES[type_name]
+    lexical = re.compile(u'(' + pattern + u')$', re.UNICODE).match if pattern is not None else None
+    collapse = type_name not in _PRESERVED
+    dated = pattern is not None and '(?P<' in pattern
+    stamp = type_name == 'dateTimeStamp'
+    minimum, maximum = bounds or (None, None)
+
+    def in_bounds(number):
+        return (minimum is None or number >= minimum) and (maximum is None or number <= maximum)
+
+    def validate(value):
+        if isinstance(value, _TEXT):
+            text = value.strip() if collapse else value
+            if lexical is None:
+                return True
+            match = lexical(text)
+            if match is None:
+                return False
+            if bounds is not None:
+                return in_bounds(int(text))
+            return not dated or _calendar(match.groupdict())
+        if value_types is None or not isinstance(value, value_types):
+            return False
+        if isinstance(value, bool) and type_name != 'boolean':
+            return False
+        if bounds is not None:
+            return in_bounds(value)
+        if stamp:
+            return value.utcoffset() is not None
+        if type_name == 'date' and isinstance(value, datetime.datetime):
+            return False
+        if type_name == 'decimal' and isinstance(value, float):
+            return value == value and value not in (float('inf'), float('-inf'))
+        return True
+
+    validate.__name__ = 'validate_' + type_name
+    return validate
+
+
+# Name -> validator, e.g. VALIDATORS['positiveInteger'](7) is True.
+VALIDATORS = dict((type_name, _compile(type_name)) for type_name in XSD_TYPES)
+
+
+def validate(value, type_name):
+    """
+    Args:
+        value: A lexical form or a Python value; a list or tuple is checked item by item.
+        type_name: Name of an XSD built-in datatype, with or without an 'xsd:' prefix.
+
+    Returns:
+        True if value is valid for the datatype.
+
+    Raises:
+        KeyError: type_name is not an XSD built-in datatype.
+    """
+    validator = VALIDATORS[type_name[4:] if type_name.startswith('xsd:') else type_name]
+    if isinstance(value, (list, tuple)):
+        return all(validator(item) for item in value)
+    return validator(value)
@@ -1,94 +1,115 @@
-import subprocess
-import os
-from lxml import etree
-from StringIO import StringIO
+import re
+from xml.etree import ElementTree
+try:
+    from .xsd_types import VALIDATORS
+except (ImportError, ValueError):   # Imported as a top-level module (see header.txt).
+    from xsd_types import VALIDATORS
+
+XSD_NAMESPACE = '{http://www.w3.org/2001/XMLSchema}'
+XSD_ELEMENT = re.compile(r'<xsd:element\s+name="([^"]*)"\s+type="(?:xsd:)?([^"]*)"')
 
 class XSDValidator():
 
+    # xsd_file -> {element name: validator}, read once per schema by element_validators().
+    _schemas = {}
+
     def __init__(self, xsd_file, prop_dict=None):
         self.xsd_file = xsd_file
         self.prop_dict = prop_dict
 
 
+    def built_in_types(self):
+        """
+        Classifies the range of each property of prop_dict against the XSD 1.1 built-in
+        datatypes (xsd_types.py), reporting the others (CASE types, misspelled types, ...).
+
+        Returns:
+            List of (property, datatype) for the properties with a built-in range.
+        """
+        types = []
+        for key in self.prop_dict.keys():
+            type_name = self.prop_dict[key][0]
+            if type_name in VALIDATORS:
+                types.append((key, type_name))
+            else:
+                print('removing {0} (type {1}) from {2}'.format(key, type_name, self.xsd_file))
+        return types
+
+
     def generate_xsd_file(self):
+        """Writes the schema of the properties with built-in ranges, already pruned, in one write."""
+        print('REMOVE NON-XSD (v1.1) TYPES')
         xsd_restrictions = []
 
-        for key in self.prop_dict.keys():  # the way i am appending to from prop_dict to get xsd keys
-            data = '<xsd:element name=\"{0}\" type="xsd:{1}"/>'.format(key, self.prop_dict.get(key, None)[0])
+        for key, type_name in self.built_in_types():
+            data = '<xsd:element name=\"{0}\" type="xsd:{1}"/>'.format(key, type_name)
             xsd_restrictions.append(data)
 
-        string = StringIO('''<?xml version="1.0" encoding="UTF-8" ?>\n<xsd:schema xmlns:xsd="http://www.w3.org/2001/XMLSchema">\n\t'''
-                          + '\n\t'.join(xsd_restrictions) + '\n</xsd:schema>')
-
         with open(self.xsd_file, 'w') as f:
-            f.write(string.getvalue())
+            f.write('<?xml version="1.0" encoding="UTF-8" ?>\n<xsd:schema xmlns:xsd="http://www.w3.org/2001/XMLSchema">\n\t'
+                    + '\n\t'.join(xsd_restrictions) + '\n</xsd:schema>')
 
 
     def remove_non_xsd_types(self):
         """
-        Uses XSD 1.1 compliant types and removes all other types (xsd11-validator.jar).
-        Removes CASE types.
+        Removes the elements of an existing xsd_file whose type is not an XSD 1.1 built-in
+        datatype (CASE types, etc.), and repeated element names, in one pass.
+        generate_xsd_file() already writes a pruned schema.
         """
-        is_valid = False
         print('REMOVE NON-XSD (v1.1) TYPES')
-        while not is_valid:
-            err_line = self.find_xsd_errs()
-            if err_line == -1:
-                break
-            with open(self.xsd_file, 'r+') as xs:
-                data = xs.readlines()
-                # print(data)
-                del data[err_line - 1]  # delete invalid line
-                xs.seek(0)
-                for i in data:
-                    xs.write(i)
-                xs.truncate()
-
-
-    def find_xsd_errs(self):
-        # print(os.getcwd())
-        args = ['java', '-jar', os.getcwd() + '/inputs/xsd11-validator.jar',
-                '-sf', self.xsd_file, '-if', 'n']
-        data, _ = get_proc(args)
-
-        data = data.decode('utf-8')
-        # print(data)
-        if '[Error]' in data:
-            line_num = data.split(':')[2]
-            # See which types are not supported by XSD v1.1 (CASE, etc.).
-            print('removing line {0} from {1}'.format(    
-                line_num, self.xsd_file))
-            return int(line_num)
-        else:
-            print('VALID XSD FORMAT\n')
-        return -1
-
-
-    def validateXSD(cls, element_value, element_name, xsd_file):
-        element = etree.Element(element_name)
-
-        element.text = str(element_value)
-        temp_xml = 'temp.xml'
-        with open(temp_xml, 'wb') as f:
-            f.write(etree.tostring(element))
-
-        args = ['java', '-jar', 'xsd11-validator.jar',
-                '-sf', xsd_file, '-if', temp_xml]
-
-        stderr, stdout = get_proc(args)
-
-        stderr, stdout = stderr.decode('utf-8'), stdout.decode('utf-8')
-        if '[Error]' in stderr:
-            print(stderr)
-            return False
-        return True
-
-
-#---------------------------------------------------------------
+        with open(self.xsd_file, 'r') as xs:
+            data = xs.readlines()
+        kept = []
+        names = set()
+        for line_num, line in enumerate(data, 1):
+            element = XSD_ELEMENT.search(line)
+            if element is not None:
+                name, type_name = element.groups()
+                if type_name not in VALIDATORS or name in names:
+                    print('removing line {0} from {1}'.format(line_num, self.xsd_file))
+                    continue
+                names.add(name)
+            kept.append(line)
+        if len(kept) < len(data):
+            with open(self.xsd_file, 'w') as xs:
+                xs.writelines(kept)
+        print('VALID XSD FORMAT\n')
+
+
+    @classmethod
+    def validateXSD(cls, element_value, element_name, xsd_file=None):
+        """
+        Checks a value in-process against an XSD 1.1 built-in datatype (see xsd_types.py).
 
+        Args:
+            element_value: The value, or a list of values for 'Any number of' properties.
+            element_name: Name of the datatype (e.g. "dateTimeStamp"), or of an element
+                          declared in xsd_file.
+            xsd_file: Schema declaring element_name; only read if element_name is not a
+                      built-in datatype.
 
-def get_proc(args):
-    proc = subprocess.Popen(
-        args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    stdout, stderr = proc.communicate()
-    return stderr, stdout
+        Returns:
+            True if every value is valid.
+        """
+        validator = VALIDATORS.get(element_name)
+        if validator is None and xsd_file is not None:
+            validator = cls.element_validators(xsd_file).get(element_name)
+        if validator is None:
+            print('No XSD built-in datatype or element named {0}'.format(element_name))
+            return False
+        if isinstance(element_value, (list, tuple)):
+            return all(validator(value) for value in element_value)
+        return validator(element_value)
+
+
+    @classmethod
+    def element_validators(cls, xsd_file):
+        """Returns {element name: validator} for the elements of xsd_file with built-in types."""
+        validators = cls._schemas.get(xsd_file)
+        if validators is None:
+            validators = cls._schemas[xsd_file] = {}
+            for element in ElementTree.parse(xsd_file).getroot().iter(XSD_NAMESPACE + 'element'):
+                prefix, _, type_name = element.get('type', '').rpartition(':')
+                if type_name in VALIDATORS:
+                    validators[element.get('name')] = VALIDATORS[type_name]
+        return validators
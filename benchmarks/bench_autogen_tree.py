@@ -0,0 +1,127 @@
+# NOTICE
+#
+# This software was produced for the U.S. Government under
+# contract SB-1341-14-CQ-0010, and is subject to the Rights
+# in Data-General Clause 52.227-14, Alt. IV (DEC 2007)
+#
+# (c) 2018 The MITRE Corporation. All Rights Reserved.
+
+
+#====================================================
+# Class tree parents and function names of the NLG autogenerator: the index/stack passes
+# (index_classes(), name_functions()) versus the scans autogen-api.py used before.
+#
+#   python benchmarks/bench_autogen_tree.py [--copies 1 4 8] [--ttl FILE ...]
+#
+# The tree is read from the bundled copy-observable.ttl and copy-case.ttl; --copies
+# repeats it under new class names to show how both approaches grow with its size.
+# Both must give the same parents and names.
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'autogeneration')
+sys.path.insert(0, ROOT)
+
+from inputs.ontology import Ontology, local_name, index_classes, name_functions
+
+
+def legacy_index_classes(class_tree, onto_dict):
+    """The parent lookup as it was: for each step back, scan onto_dict for that index."""
+    line_number = 1
+    for class_uri, level in class_tree:
+        nlg_type = local_name(class_uri)
+        if level > 0:
+            last_nlg_type = previous_nlg_type
+        previous_nlg_type = nlg_type
+
+        onto_dict[nlg_type] = {'index': line_number, 'level': level}
+        if level == 0:
+            onto_dict[nlg_type]['parent'] = 'root'
+        elif onto_dict[last_nlg_type]['level'] >= level:
+            count_down = line_number - 2
+            while count_down != 0:
+                for nlg_entry in onto_dict:
+                    if onto_dict[nlg_entry]['index'] == count_down:
+                        if onto_dict[nlg_entry]['level'] >= level:
+                            count_down -= 1
+                            break
+                        else:
+                            onto_dict[nlg_type]['parent'] = nlg_entry
+                            count_down = 0
+                            break
+        else:
+            onto_dict[nlg_type]['parent'] = last_nlg_type
+        line_number += 1
+    return line_number
+
+
+def legacy_name_functions(onto_dict, line_number):
+    """The naming pass as it was: for each index, scan onto_dict for the class."""
+    count = 1
+    while count < line_number:
+        for current_entry in onto_dict:
+            if onto_dict[current_entry]['index'] == count:
+                nlg_type = current_entry
+                break
+        parent = onto_dict[nlg_type]['parent']
+        if parent == 'root':
+            onto_dict[nlg_type]['func_name'] = 'duck_'
+        elif parent == 'UcoObject':
+            onto_dict[nlg_type]['func_name'] = 'core_'
+        elif parent == 'PropertyBundle':
+            onto_dict[nlg_type]['func_name'] = 'prop_'
+        elif parent not in onto_dict:
+            onto_dict[nlg_type]['parent'] = 'root'
+            continue
+        else:
+            onto_dict[nlg_type]['func_name'] = onto_dict[parent]['func_name'] + 'sub_'
+        count += 1
+
+
+def copies(class_tree, count):
+    """class_tree repeated count times, each copy with its own class names."""
+    tree = []
+    for copy in range(count):
+        suffix = str(copy) if copy else ''
+        tree.extend((uri + suffix, level) for uri, level in class_tree)
+    return tree
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time the class tree passes of the autogenerator.')
+    parser.add_argument('--copies', type=int, nargs='+', default=[1, 4, 8], help='sizes, in copies of the tree')
+    parser.add_argument('--ttl', nargs='+', help='ontology files (default: copy-observable.ttl and copy-case.ttl)',
+                        default=[os.path.join(ROOT, 'inputs', name) for name in ('copy-observable.ttl', 'copy-case.ttl')])
+    args = parser.parse_args()
+
+    start = time.time()
+    ontology = Ontology(args.ttl)
+    class_tree = ontology.class_tree()
+    print('{0} triples, {1} classes, {2} tree rows: loaded in {3:.2f} s'.format(
+        len(ontology.graph), len(ontology.classes), len(class_tree), time.time() - start))
+    print('{0:>8} {1:>12} {2:>12} {3:>9}'.format('rows', 'scans ms', 'index ms', 'speedup'))
+
+    for count in args.copies:
+        tree = copies(class_tree, count)
+
+        start = time.time()
+        legacy = {}
+        legacy_name_functions(legacy, legacy_index_classes(tree, legacy))
+        scans = time.time() - start
+
+        start = time.time()
+        onto_dict = {}
+        name_functions(onto_dict, index_classes(tree, onto_dict), report=lambda text: None)
+        index = time.time() - start
+
+        for nlg_type, entry in legacy.items():
+            assert (entry['parent'], entry['func_name']) == \
+                (onto_dict[nlg_type]['parent'], onto_dict[nlg_type]['func_name']), nlg_type
+        print('{0:>8} {1:>12.1f} {2:>12.2f} {3:>8.0f}x'.format(len(tree), scans * 1e3, index * 1e3, scans / index))
+
+
+if __name__ == '__main__':
+    main()
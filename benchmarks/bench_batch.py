@@ -0,0 +1,73 @@
+# NOTICE
+#
+# This software was produced for the U.S. Government under
+# contract SB-1341-14-CQ-0010, and is subject to the Rights
+# in Data-General Clause 52.227-14, Alt. IV (DEC 2007)
+#
+# (c) 2018 The MITRE Corporation. All Rights Reserved.
+
+
+#====================================================
+# Per-triple Graph.add() versus Document.batch() (Graph.addN() in chunks).
+#
+#   python benchmarks/bench_batch.py [--files 50000] [--chunk-size 10000] [--sqlite DIR]
+#
+# Each file is a Trace with a File and a ContentData PropertyBundle and one Hash.
+# With --sqlite the graphs are stored in SQLite databases created in DIR.
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import case
+import case_sqlite
+import NLG
+
+
+def populate(doc, files):
+    sha256 = NLG.core_ControlledVocabulary(doc, value='SHA256')
+    for i in range(files):
+        trace = NLG.core_Trace(doc, has_changed=False)
+        NLG.propbundle_File(trace, filename=['file%d.bin' % i], extension='bin', size_in_bytes=i)
+        NLG.propbundle_ContentData(trace, mime_type='application/octet-stream',
+                                   hashes=[NLG.duck_Hash(doc, hash_method=sha256, hash_value='%064x' % i)])
+
+
+def run(files, chunk_size=None, sqlite=None):
+    graph = None
+    if sqlite:
+        path = os.path.join(sqlite, 'bench_batch_{0}.db'.format(chunk_size or 'add'))
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+        graph = case_sqlite.open_graph(path)
+    doc = case.Document(graph=graph)
+    start = time.time()
+    if chunk_size:
+        with doc.batch(chunk_size):
+            populate(doc, files)
+    else:
+        populate(doc, files)
+    return time.time() - start, len(doc.graph)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare per-triple and batched ingestion.')
+    parser.add_argument('--files', type=int, default=50000, help='number of file observables to create')
+    parser.add_argument('--chunk-size', type=int, default=10000, help='triples per Graph.addN() call')
+    parser.add_argument('--sqlite', metavar='DIR', help='store the graphs in SQLite databases in DIR')
+    args = parser.parse_args()
+
+    single, triples = run(args.files, sqlite=args.sqlite)
+    batched, batched_triples = run(args.files, args.chunk_size, args.sqlite)
+    assert triples == batched_triples
+    print('{0} triples'.format(triples))
+    print('Graph.add  {0:8.2f} s  {1:10.0f} triples/s'.format(single, triples / single))
+    print('batch()    {0:8.2f} s  {1:10.0f} triples/s'.format(batched, triples / batched))
+
+
+if __name__ == '__main__':
+    main()
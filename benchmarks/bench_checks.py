@@ -0,0 +1,130 @@
+# NOTICE
+#
+# This software was produced for the U.S. Government under
+# contract SB-1341-14-CQ-0010, and is subject to the Rights
+# in Data-General Clause 52.227-14, Alt. IV (DEC 2007)
+#
+# (c) 2018 The MITRE Corporation. All Rights Reserved.
+
+
+#====================================================
+# Parameter checks of every NLG function: compiled Checks tables, at each validation
+# level, versus assert chains.
+#
+#   python benchmarks/bench_checks.py [--calls 2000] [--missing 0.5] [--list-length 3]
+#
+# The assert chains are generated from the same tables in the style the NLG used before
+# (if not isinstance(x, Missing): assert ...), so both sides check exactly the same rows.
+# Run without -O; under -O the assert chains do nothing.
+
+import argparse
+import datetime
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import case
+import NLG
+
+
+def legacy_check(checks):
+    """Returns a function checking the rows of checks with assert statements."""
+    namespace = {'Missing': NLG.Missing, 'case': case, 'datetime': datetime}
+    namespace.update(('_' + k, v) for k, v in NLG.VALUE_TYPES.items())
+    names = [row[0] for row in checks.rows]
+    lines = ['def check({0}):'.format(', '.join(names))]
+    for index, (name, required, many, value_type) in enumerate(checks.rows):
+        message = repr(checks.message(index, False))
+        if required:
+            lines.append('    assert not isinstance({0}, Missing), {1!r}'.format(name, checks.message(index, True)))
+        lines.append('    if not isinstance({0}, Missing):'.format(name))
+        if value_type is None:
+            lines.append('        pass')
+            continue
+        kind, _, type_name = value_type.partition(':')
+        if kind in NLG.OBJECT_KINDS:
+            cls = 'case.' + NLG.OBJECT_KINDS[kind].__name__
+            test = '(isinstance({{0}}, {0}) and ({{0}}.type=={1!r}))'.format(cls, type_name) if type_name \
+                   else 'isinstance({{0}}, {0})'.format(cls)
+        elif value_type == 'PositiveInteger':
+            test = '(isinstance({0}, _PositiveInteger) and ({0} > 0))'
+        else:
+            test = 'isinstance({{0}}, _{0})'.format(value_type)
+        if many:
+            lines.append('        assert isinstance({0}, list), {1}'.format(name, message))
+            lines.append('        assert all({0} for i in {1}), {2}'.format(test.format('i'), name, message))
+        else:
+            lines.append('        assert {0}, {1}'.format(test.format(name), message))
+    exec(compile('\n'.join(lines), '<legacy checks for {0}>'.format(checks.function), 'exec'), namespace)
+    return namespace['check']
+
+
+def sample(doc, value_type):
+    """A valid value of value_type."""
+    if value_type is None:
+        return 'value'
+    kind, _, type_name = value_type.partition(':')
+    if kind in NLG.OBJECT_KINDS:
+        return getattr(doc, 'create_' + NLG.OBJECT_KINDS[kind].__name__)(type_name or 'Object')
+    return {'String': 'value', 'Integer': 7, 'PositiveInteger': 7, 'Long': 7, 'Bool': True,
+            'Float': 0.5, 'Datetime': datetime.datetime(2018, 1, 1)}[value_type]
+
+
+def arguments(doc, checks, missing, list_length, rng):
+    """Valid arguments for checks; optional parameters are left out with probability missing."""
+    args = []
+    for name, required, many, value_type in checks.rows:
+        if not required and rng.random() < missing:
+            args.append(NLG.MISSING)
+        elif many:
+            args.append([sample(doc, value_type)] * list_length)
+        else:
+            args.append(sample(doc, value_type))
+    return args
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare compiled Checks tables with assert chains.')
+    parser.add_argument('--calls', type=int, default=2000, help='calls per NLG function')
+    parser.add_argument('--missing', type=float, default=0.5, help='share of optional parameters left unset')
+    parser.add_argument('--list-length', type=int, default=3, help='items in each list parameter')
+    args = parser.parse_args()
+
+    doc = case.Document()
+    rng = random.Random(0)
+    NLG.load()
+    tables = [v for v in vars(NLG).values() if isinstance(v, NLG.Checks)]
+    calls = [(checks, legacy_check(checks), arguments(doc, checks, args.missing, args.list_length, rng))
+             for checks in tables]
+    for checks, legacy, values in calls:
+        # Compiles the table, as the first call of the NLG function would.
+        checks.check(doc, *values)
+
+    timings = {}
+    for level in ('asserts',) + tuple(reversed(case.VALIDATION_LEVELS)):
+        start = time.time()
+        if level == 'asserts':
+            for checks, legacy, values in calls:
+                for _ in range(args.calls):
+                    legacy(*values)
+        else:
+            doc.validation = level
+            for checks, legacy, values in calls:
+                check = checks.check
+                values = [doc] + values
+                for _ in range(args.calls):
+                    check(*values)
+        timings[level] = time.time() - start
+
+    total = len(calls) * args.calls
+    print('{0} functions, {1} calls each'.format(len(calls), args.calls))
+    for level, seconds in timings.items():
+        print('{0:<8} {1:8.2f} s  {2:10.0f} calls/s  {3:5.2f}x asserts'.format(
+            level, seconds, total / seconds, timings['asserts'] / seconds))
+
+
+if __name__ == '__main__':
+    main()
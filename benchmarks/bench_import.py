@@ -0,0 +1,109 @@
+# NOTICE
+#
+# This software was produced for the U.S. Government under
+# contract SB-1341-14-CQ-0010, and is subject to the Rights
+# in Data-General Clause 52.227-14, Alt. IV (DEC 2007)
+#
+# (c) 2018 The MITRE Corporation. All Rights Reserved.
+
+
+#====================================================
+# Import time of the NLG package, in a fresh interpreter per measurement.
+#
+#   python benchmarks/bench_import.py [--repeat 10] [--baseline REV]
+#
+# Each statement is timed after 'import case' (rdflib), which is the same for every row
+# and printed first. 'cached' runs read the bytecode written by a warm-up run, as an
+# installed package does; 'compiled' runs compile every module from source.
+# --baseline REV also times NLG.py as it was at git revision REV (e.g. the last commit
+# before the package split) as a single module.
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+STATEMENTS = (
+    ('import case', None),
+    ('import NLG', 'import NLG'),
+    ('NLG.core_Tool, NLG.duck_Hash', 'import NLG; NLG.core_Tool; NLG.duck_Hash'),
+    ('from NLG import *', 'from NLG import *'),
+)
+
+_CHILD = '''
+import sys, timeit
+sys.path.insert(0, {path!r})
+sys.path.insert(1, {root!r})
+start = timeit.default_timer()
+import case
+middle = timeit.default_timer()
+{statement}
+end = timeit.default_timer()
+print('%r %r' % (middle - start, end - middle))
+'''
+
+
+def measure(path, statement, cache, repeat):
+    """Best (case, statement) seconds of repeat fresh interpreters; cache is a bytecode
+    directory to reuse, or None to compile from source."""
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    code = _CHILD.format(path=path, root=ROOT, statement=statement or 'pass')
+    best = None
+    for _ in range(repeat):
+        prefix = cache or tempfile.mkdtemp()
+        env['PYTHONPYCACHEPREFIX'] = prefix
+        command = [sys.executable, '-c', code] if cache else [sys.executable, '-B', '-c', code]
+        try:
+            times = tuple(float(t) for t in subprocess.check_output(command, env=env).split())
+        finally:
+            if not cache:
+                shutil.rmtree(prefix)
+        best = times if best is None else tuple(min(a, b) for a, b in zip(best, times))
+    return best
+
+
+def baseline(revision):
+    """A directory holding NLG.py as it was at git revision."""
+    source = subprocess.check_output(['git', 'show', revision + ':NLG.py'], cwd=ROOT)
+    directory = tempfile.mkdtemp()
+    with open(os.path.join(directory, 'NLG.py'), 'wb') as module:
+        module.write(source)
+    return directory
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time importing the NLG package.')
+    parser.add_argument('--repeat', type=int, default=10, help='interpreters per measurement (best is kept)')
+    parser.add_argument('--baseline', metavar='REV', help='also time NLG.py at this git revision')
+    args = parser.parse_args()
+
+    trees = [('package', ROOT)]
+    if args.baseline:
+        trees.append((args.baseline, baseline(args.baseline)))
+
+    print('{0:<12} {1:<32} {2:>12} {3:>12}'.format('tree', 'statement', 'cached ms', 'compiled ms'))
+    try:
+        for tree, path in trees:
+            cache = tempfile.mkdtemp()
+            try:
+                for label, statement in STATEMENTS:
+                    measure(path, statement, cache, 1)  # Writes the bytecode.
+                    cached = measure(path, statement, cache, args.repeat)
+                    compiled = measure(path, statement, None, args.repeat)
+                    column = 0 if statement is None else 1
+                    print('{0:<12} {1:<32} {2:>12.1f} {3:>12.1f}'.format(
+                        tree, label, cached[column] * 1e3, compiled[column] * 1e3))
+            finally:
+                shutil.rmtree(cache)
+    finally:
+        for tree, path in trees[1:]:
+            shutil.rmtree(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+# NOTICE
+#
+# This software was produced for the U.S. Government under
+# contract SB-1341-14-CQ-0010, and is subject to the Rights
+# in Data-General Clause 52.227-14, Alt. IV (DEC 2007)
+#
+# (c) 2018 The MITRE Corporation. All Rights Reserved.
+
+
+#====================================================
+# Document.write_json_ld() versus rdflib-jsonld (auto_compact=True).
+#
+#   python benchmarks/bench_jsonld.py [--nodes 100000 1000000] [--rdflib-limit 100000]
+#
+# rdflib-jsonld is skipped above --rdflib-limit nodes because it takes too long.
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import case
+import NLG
+
+
+def build(nodes):
+    """Creates a document with about `nodes` nodes (a Trace and its File bundle per pair)."""
+    doc = case.Document(creation_time='document')
+    with doc.batch():
+        for i in range(nodes // 2):
+            trace = NLG.core_Trace(doc, has_changed=False)
+            NLG.propbundle_File(trace, filename=['file%d.bin' % i], extension='bin', size_in_bytes=i)
+    return doc
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare the JSON-LD emitter with rdflib-jsonld.')
+    parser.add_argument('--nodes', type=int, nargs='+', default=[100000, 1000000], help='document sizes (nodes)')
+    parser.add_argument('--rdflib-limit', type=int, default=100000, help='largest document to give to rdflib-jsonld')
+    args = parser.parse_args()
+
+    print('{0:>9} {1:>10} {2:>12} {3:>12} {4:>8}'.format('nodes', 'triples', 'emitter (s)', 'rdflib (s)', 'speedup'))
+    for nodes in args.nodes:
+        doc = build(nodes)
+        start = time.time()
+        doc.write_json_ld()
+        emitter = time.time() - start
+
+        rdflib_time = speedup = '-'
+        if nodes <= args.rdflib_limit:
+            start = time.time()
+            doc.graph.serialize(format='json-ld', context=doc._json_ld_context(), auto_compact=True)
+            elapsed = time.time() - start
+            rdflib_time = '{0:.2f}'.format(elapsed)
+            speedup = '{0:.1f}x'.format(elapsed / emitter)
+        print('{0:>9} {1:>10} {2:>12.2f} {3:>12} {4:>8}'.format(nodes, len(doc.graph), emitter, rdflib_time, speedup))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+# NOTICE
+#
+# This software was produced for the U.S. Government under
+# contract SB-1341-14-CQ-0010, and is subject to the Rights
+# in Data-General Clause 52.227-14, Alt. IV (DEC 2007)
+#
+# (c) 2018 The MITRE Corporation. All Rights Reserved.
+
+
+#====================================================
+# Strict checks of list parameters with 10 to 10^6 items.
+#
+#   python benchmarks/bench_list_checks.py [--max-size 1000000] [--items 2000000]
+#
+# nodes:    core_Action(subaction_refs=[...]) with a list of Actions, checked with an
+#           all() generator as the assert chains did, item by item with isinstance() as
+#           the compiled checks did before node type tags, and with the type tags.
+# integers: propbundle_Fragment(fragment_index=...) with a list checked by all(), the
+#           same list checked by the compiled checks, an array.array('q') and (if NumPy
+#           is installed) a NumPy int64 array, the last two checked by type code / dtype.
+#
+# Times are microseconds per call; every call is repeated until about --items items were checked.
+
+import argparse
+import array
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import case
+import NLG
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def untagged(checks):
+    """A copy of checks compiled without node type tags, as the checks were before them."""
+    copy = NLG.Checks(checks.function, checks.rows)
+    type_tag = NLG.checks._type_tag
+    NLG.checks._type_tag = lambda value_type: None
+    try:
+        copy.check(None, *[NLG.MISSING] * len(checks.rows))
+    finally:
+        NLG.checks._type_tag = type_tag
+    return copy
+
+
+def caller(doc, checks, name, value):
+    """Returns a function calling checks with value for parameter name and nothing else."""
+    values = [doc] + [value if row[0] == name else NLG.MISSING for row in checks.rows]
+    check = checks.check
+    return lambda: check(*values)
+
+
+def per_call(function, size, items):
+    number = max(1, items // size)
+    return min(timeit.repeat(function, number=number, repeat=3)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time the strict checks of list parameters.')
+    parser.add_argument('--max-size', type=int, default=1000000, help='largest list length')
+    parser.add_argument('--items', type=int, default=2000000, help='items checked per measurement')
+    args = parser.parse_args()
+
+    doc = case.Document(validation='strict')
+    actions = [NLG.core_Action(doc) for _ in range(1000)]
+    CoreObject = case.CoreObject
+    action_checks = NLG._core_Action
+    action_untagged = untagged(action_checks)
+    fragment_checks = NLG._propbundle_Fragment
+
+    columns = ['nodes all()', 'nodes isinstance', 'nodes tags',
+               'ints all()', 'ints list', 'ints array']
+    if numpy is not None:
+        columns.append('ints numpy')
+    print('{0:>8} '.format('items') + ' '.join('{0:>16}'.format(c) for c in columns))
+
+    size = 10
+    while size <= args.max_size:
+        nodes = (actions * (size // len(actions) + 1))[:size]
+        ints = list(range(1, size + 1))
+        timings = [
+            per_call(lambda: all(isinstance(i, CoreObject) and i.type == 'Action' for i in nodes), size, args.items),
+            per_call(caller(doc, action_untagged, 'subaction_refs', nodes), size, args.items),
+            per_call(caller(doc, action_checks, 'subaction_refs', nodes), size, args.items),
+            per_call(lambda: all(isinstance(i, int) for i in ints), size, args.items),
+            per_call(caller(doc, fragment_checks, 'fragment_index', ints), size, args.items),
+            per_call(caller(doc, fragment_checks, 'fragment_index', array.array('q', ints)), size, args.items),
+        ]
+        if numpy is not None:
+            timings.append(per_call(caller(doc, fragment_checks, 'fragment_index', numpy.array(ints, dtype=numpy.int64)),
+                                    size, args.items))
+        print('{0:>8} '.format(size) + ' '.join('{0:>16.2f}'.format(t) for t in timings))
+        size *= 10
+
+
+if __name__ == '__main__':
+    main()
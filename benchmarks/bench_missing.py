@@ -0,0 +1,85 @@
+# NOTICE
+#
+# This software was produced for the U.S. Government under
+# contract SB-1341-14-CQ-0010, and is subject to the Rights
+# in Data-General Clause 52.227-14, Alt. IV (DEC 2007)
+#
+# (c) 2018 The MITRE Corporation. All Rights Reserved.
+
+
+#====================================================
+# Triple count and output size with and without dropping unset NLG parameters.
+#
+#   python benchmarks/bench_missing.py [--objects 100000]
+#
+# The legacy document reproduces the old behaviour, where every unset parameter
+# was forwarded as a Missing object and serialized as its repr() string.
+
+import argparse
+import datetime
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import case
+import NLG
+
+
+class LegacyDocument(case.Document):
+    """Document that turns unset parameters back into string literals."""
+
+    @staticmethod
+    def _legacy(kwargs):
+        return dict((k, repr(v) if isinstance(v, case.Missing) else v) for k, v in kwargs.items())
+
+    def create_CoreObject(self, _type=None, **kwargs):
+        return super(LegacyDocument, self).create_CoreObject(_type, **self._legacy(kwargs))
+
+    def create_ContextObject(self, _type=None, **kwargs):
+        return super(LegacyDocument, self).create_ContextObject(_type, **self._legacy(kwargs))
+
+    def create_DuckObject(self, _type=None, **kwargs):
+        return super(LegacyDocument, self).create_DuckObject(_type, **self._legacy(kwargs))
+
+
+def populate(doc, objects):
+    """Creates a mix of core, context and duck objects (five per round)."""
+    now = datetime.datetime.utcnow()
+    for i in range(objects // 5):
+        tool = NLG.core_Tool(doc, name='tool-%d' % i, version='1.0')
+        vocab = NLG.core_ControlledVocabulary(doc, value='SHA256')
+        NLG.duck_Hash(doc, hash_method=vocab, hash_value='%064x' % i)
+        NLG.core_Action(doc, start_time=now)
+        NLG.context_ProvenanceRecord(doc, exhibit_number=str(i), object_refs=[tool])
+
+
+def measure(label, doc, objects):
+    start = time.time()
+    populate(doc, objects)
+    build = time.time() - start
+    start = time.time()
+    data = doc.serialize(format='nt')
+    write = time.time() - start
+    if not isinstance(data, bytes):
+        data = data.encode('utf-8')
+    print('{0:<8} {1:>10} {2:>14} {3:>9.2f} {4:>9.2f}'.format(
+        label, len(doc.graph), len(data), build, write))
+    return len(doc.graph), len(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare triple count and output size with the legacy Missing handling.')
+    parser.add_argument('--objects', type=int, default=100000, help='number of CASE objects to create')
+    args = parser.parse_args()
+
+    print('{0:<8} {1:>10} {2:>14} {3:>9} {4:>9}'.format('mode', 'triples', 'n-triples (B)', 'build (s)', 'write (s)'))
+    legacy = measure('legacy', LegacyDocument(), args.objects)
+    current = measure('current', case.Document(), args.objects)
+    print('triples: {0:.1%} of legacy, bytes: {1:.1%} of legacy'.format(
+        float(current[0]) / legacy[0], float(current[1]) / legacy[1]))
+
+
+if __name__ == '__main__':
+    main()
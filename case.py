@@ -11,32 +11,211 @@
 # CASE API
 #!/usr/bin/env python
 
+import collections
+import contextlib
 import datetime
+import hashlib
+import io
+import itertools
+import json
+import os
 import uuid
 
 import rdflib
-from rdflib import RDF
+from rdflib import RDF, XSD
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 CASE = rdflib.Namespace('http://case.example.org/core#')
 
+# serialize() options handled by Document.write_json_ld().
+_JSON_LD_OPTIONS = frozenset(('destination', 'context', 'encoding', 'indent', 'auto_compact'))
+
+# Accepted values of Document(creation_time=...).
+CREATION_TIME_POLICIES = ('node', 'batch', 'document', None)
+
+# Accepted values of Document(validation=...), from cheapest to most thorough.
+VALIDATION_LEVELS = ('off', 'fast', 'strict')
+
+
+class Missing(object):
+    """Marks a parameter that was not supplied.
+
+    NLG functions default every ontology parameter to MISSING and pass all of them
+    through to the create functions below. Node.add() drops Missing values the same
+    way it drops None, so unset parameters never become triples.
+    """
+    def __init__(self):
+        self.is_missing = True
+
+MISSING = Missing()
+
 
 #====================================================
 #-- CREATE A CASE DOCUMENT FOR A SINGLE REPORT
 
 class Document(object):
 
-    def __init__(self, graph=None):
+    def __init__(self, graph=None, id_factory=None, intern_cache=None, creation_time='node', stream=None,
+                 index=False, validation='strict', defer_validation=False):
         """
         Initializes the CASE document.
         Args:
             graph: The graph to populate (instance of rdflib.Graph)
                    If not provided, a graph in memory will be used.
+            id_factory: Callable (rdf_type, properties) -> id string used for every
+                        node created through this document (see NODE IDENTIFIERS).
+                        If not provided, random UUIDs (UUID4Ids) are used.
+            intern_cache: Optional InternCache. When given, creating a node with the
+                          same type and properties as a recently created one returns
+                          that node instead of emitting a new one.
+            creation_time: How the *CreationTime property of CASE objects is set:
+                           'node'     - the time each node is created (default).
+                           'batch'    - one timestamp per batch() block (nodes created
+                                        outside of a batch share the document's).
+                           'document' - one timestamp for the whole document.
+                           None       - no creation time triples.
+            stream: Optional NTriplesWriter or JSONLinesWriter. When given, triples are
+                    written to it as nodes are created instead of being kept in the
+                    graph (which stays empty), so memory use does not grow with the
+                    document. Call close() when done.
+            index: If True, keeps the type index behind objects_of_type(). The index
+                   holds every node created until serialize_append() evicts it, so
+                   memory use grows with the document even when the graph is on disk
+                   (case_sqlite) or streamed. Off by default.
+            validation: How much of the ontology the NLG functions check (see validation_level()):
+                        'strict' - everything: required parameters, the type of each
+                                   parameter and each item of list parameters (default).
+                        'fast'   - only that the required parameters are supplied.
+                        'off'    - nothing.
+            defer_validation: If True, NLG functions do not check their parameters when
+                              called but keep them until validate(), which records every
+                              violation in validation_errors instead of raising.
         """
 
-        if not graph:
+        if creation_time not in CREATION_TIME_POLICIES:
+            raise ValueError('creation_time must be one of {0}, not {1!r}'.format(
+                CREATION_TIME_POLICIES, creation_time))
+        _check_validation_level(validation)
+
+        if graph is None:
             graph = rdflib.Graph()
         graph.namespace_manager.bind('case', CASE)
         self.graph = graph
+        self.id_factory = id_factory or UUID4Ids()
+        self.intern_cache = intern_cache
+        self.creation_time = creation_time
+        self.validation = validation
+        # Checks -> [values, uri] entries waiting for validate() (None unless deferring).
+        self.deferred = collections.OrderedDict() if defer_validation else None
+        # Entry of the NLG call whose node is being created.
+        self._awaiting_node = None
+        self.validation_errors = []
+        # Shared creation time literal for the 'batch' and 'document' policies.
+        self._timestamp = None
+        if creation_time in ('batch', 'document'):
+            self._timestamp = rdflib.Literal(datetime.datetime.utcnow())
+        self.stream = stream
+        self._context = None
+        # RollingFile used by serialize_append().
+        self._append_file = None
+        # Where triples end up (the graph, or the stream when streaming).
+        self._target = graph if stream is None else stream
+        # Where new nodes write their triples (the target, or a TripleBatch inside batch()).
+        self._sink = self._target
+        # rdf:type -> nodes of that type.
+        self._type_index = collections.defaultdict(list) if index else None
+
+
+    @contextlib.contextmanager
+    def batch(self, chunk_size=10000):
+        """Buffers the triples of all nodes created inside the block and adds them
+        to the graph in chunks through Graph.addN().
+
+        Usage:
+            with document.batch():
+                for ... :
+                    NLG.propbundle_File(trace, ...)
+
+        Nested calls reuse the outer batch. Reading from the document inside the
+        block (iteration, triples(), serialize()) flushes the buffer first.
+        """
+        if self._sink is not self._target:
+            yield self._sink
+            return
+        triple_batch = TripleBatch(self._target, chunk_size)
+        self._sink = triple_batch
+        document_timestamp = self._timestamp
+        if self.creation_time == 'batch':
+            self._timestamp = rdflib.Literal(datetime.datetime.utcnow())
+        try:
+            yield triple_batch
+        finally:
+            self._sink = self._target
+            self._timestamp = document_timestamp
+            triple_batch.close()
+
+
+    @contextlib.contextmanager
+    def validation_level(self, level):
+        """Sets the validation level of the NLG functions inside the block.
+
+        Usage:
+            with document.validation_level('off'):
+                for record in already_validated:
+                    NLG.propbundle_File(trace, ...)
+        """
+        _check_validation_level(level)
+        previous = self.validation
+        self.validation = level
+        try:
+            yield self
+        finally:
+            self.validation = previous
+
+
+    def defer(self, checks, values):
+        """Keeps the parameter values of an NLG call for validate(). Called by the NLG
+        checks of a document created with defer_validation=True."""
+        entry = [values, None]
+        self.deferred.setdefault(checks, []).append(entry)
+        # The NLG function creates its node next; _create() fills in its uri.
+        self._awaiting_node = entry
+
+
+    def validate(self):
+        """
+        Checks the parameters of all NLG calls deferred since the last validate(), one
+        NLG function at a time, at the current validation level.
+
+        Returns:
+            validation_errors, the list of (function, parameter, uri) Violations found so far.
+        """
+        if self.deferred:
+            for checks, entries in self.deferred.items():
+                checks.collect(entries, self.validation_errors, self.validation)
+            self.deferred.clear()
+        return self.validation_errors
+
+
+    def _flush(self):
+        """Pushes buffered triples to the graph (or stream) so that reads see them."""
+        if self._sink is not self.graph:
+            self._sink.flush()
+
+
+    def close(self):
+        """Flushes any batched triples and closes the stream of a streaming document
+        (and the file used by serialize_append())."""
+        self._flush()
+        if self.stream is not None:
+            self.stream.close()
+        if self._append_file is not None:
+            self._append_file.close()
+            self._append_file = None
 
 
     def _sanitize_triple(self, triple):
@@ -57,26 +236,32 @@ class Document(object):
 
     def __iter__(self):
         """Wrapper for iterating over all triples in the graph"""
+        self._flush()
         return iter(self.graph)
 
 
     def __contains__(self, triple):
         """Wrapper for checking if triple is contained in the graph."""
+        self._flush()
         return self._sanitize_triple(triple) in self.graph
 
 
     def triples(self, triple):
         """Generator over the triple store in graph."""
+        self._flush()
         return self.graph.triples(self._sanitize_triple(triple))
 
 
     def _json_ld_context(self):
-        context = dict(
-            (pfx, str(ns))
-            for (pfx, ns) in self.graph.namespaces() if pfx and
-            str(ns) != u"http://www.w3.org/XML/1998/namespace")
-        context['@vocab'] = str(CASE)
-        return context
+        # Built once; pass context= to serialize() for prefixes bound afterwards.
+        if self._context is None:
+            context = dict(
+                (pfx, str(ns))
+                for (pfx, ns) in self.graph.namespaces() if pfx and
+                str(ns) != u"http://www.w3.org/XML/1998/namespace")
+            context['@vocab'] = str(CASE)
+            self._context = context
+        return self._context
 
 
     # Manually specify properties to help inforce both properties are supplied.
@@ -88,48 +273,205 @@ class Document(object):
     # We are going to default to json-ld instead of rdflib's default of xml.
     def serialize(self, format='json-ld', **kwargs):
         """Serializes the document's graph to a destination.
-        (Follows same arguments as rdflib.Graph().serialize())"""
+        (Follows same arguments as rdflib.Graph().serialize())
+
+        Compacted JSON-LD is written by write_json_ld() rather than rdflib-jsonld.
+        Pass auto_compact=False (or other rdflib-jsonld options) to use rdflib instead.
+        """
+        if self.stream is not None:
+            raise ValueError('A streaming document is written as it is created; call close() instead.')
+        self._flush()
         if format == 'json-ld':
             if 'context' not in kwargs:
                 kwargs['context'] = self._json_ld_context()
             if 'auto_compact' not in kwargs:
                 kwargs['auto_compact'] = True
+            if kwargs['auto_compact'] and set(kwargs) <= _JSON_LD_OPTIONS:
+                del kwargs['auto_compact']
+                return self.write_json_ld(**kwargs)
         return self.graph.serialize(format=format, **kwargs)
 
 
-#    def serialize_append(self, format='json-ld', destination="new-api_output.json", **kwargs):
-#        """
-#        Serializes the document's graph to append to a  destination file.
-#        """
-#        if format == 'json-ld':
-#            if 'context' not in kwargs:
-#                kwargs['context'] = self._json_ld_context()
-#            if 'auto_compact' not in kwargs:
-#                kwargs['auto_compact'] = True
-#        graph = self.graph.serialize(format=format, **kwargs)
-#        with open(destination, "a") as fin:
-#            fin.write(graph)
-#        fin.close()
+    def write_json_ld(self, destination=None, context=None, encoding=None, indent=None):
+        """Writes the graph as compacted JSON-LD in one pass over its triples.
+
+        The output is an object with the @context and an @graph list holding one
+        flat node object per subject, the same layout rdflib-jsonld produces with
+        auto_compact=True.
+
+        Args:
+            destination: Path or file object to write to. If not provided, the
+                         document is returned (as bytes if an encoding is given).
+            context: JSON-LD context to compact against (defaults to the graph's prefixes
+                     with CASE as @vocab).
+            encoding: Encoding of the output (default utf-8).
+            indent: Indentation of the whole document. By default each node object is
+                    written on its own line, which keeps the fast C JSON encoder in use.
+        """
+        self._flush()
+        if context is None:
+            context = self._json_ld_context()
+        compactor = JSONLDCompactor(context)
+
+        nodes = (compactor.node_object(s, pairs) for s, pairs in _group_by_subject(self.graph))
+
+        if indent is not None:
+            text = json.dumps({'@context': context, '@graph': list(nodes)},
+                              indent=indent, sort_keys=True, ensure_ascii=False)
+        else:
+            parts = [u'{\n  "@context": %s,\n  "@graph": [' % json.dumps(context, sort_keys=True)]
+            parts.append(u','.join(u'\n    ' + json.dumps(node, sort_keys=True, ensure_ascii=False)
+                                   for node in nodes))
+            parts.append(u'\n  ]\n}\n')
+            text = u''.join(parts)
+
+        if destination is None:
+            return text if encoding is None else text.encode(encoding)
+        data = text.encode(encoding or 'utf-8')
+        if hasattr(destination, 'write'):
+            try:
+                destination.write(data)
+            except TypeError:
+                destination.write(data.decode(encoding or 'utf-8'))
+        else:
+            with open(destination, 'wb') as out:
+                out.write(data)
+
+
+    def serialize_append(self, format='json-lines', destination='new-api_output.jsonl', max_bytes=None):
+        """
+        Appends every node added since the last call to the destination file and
+        evicts those triples from the graph, so memory stays flat during a long
+        collection. Node objects keep working and later additions to them are
+        written by the next call.
+
+        Args:
+            format: 'json-lines' (one JSON-LD node object per line) or 'nt' (N-Triples).
+                    Both stay valid when appended to, unlike a single JSON-LD document.
+            destination: Path of the file to append to.
+            max_bytes: Optional size limit. Once a file reaches it, output continues in
+                       a new numbered file (output.jsonl, output.1.jsonl, output.2.jsonl ...).
+                       Files only change between nodes, in both formats, so all the triples
+                       of a node written by one call end up in the same file.
+        """
+        writer_class = _APPEND_WRITERS.get(format)
+        if writer_class is None:
+            raise ValueError('serialize_append() supports {0}, not {1!r}'.format(
+                sorted(_APPEND_WRITERS), format))
+        if self.stream is not None:
+            raise ValueError('A streaming document is written as it is created; call close() instead.')
+        self._flush()
+
+        if self._append_file is None or self._append_file.base_path != destination:
+            if self._append_file is not None:
+                self._append_file.close()
+            self._append_file = RollingFile(destination, max_bytes)
+        self._append_file.max_bytes = max_bytes
+
+        # Each node is written to the file in one write(), so that rollover cannot split it.
+        buffer = io.StringIO()
+        writer = writer_class(buffer)
+        for s, pairs in _group_by_subject(self.graph):
+            for p, o in pairs:
+                writer.add((s, p, o))
+            writer.flush()
+            self._append_file.write(buffer.getvalue())
+            buffer.seek(0)
+            buffer.truncate()
+        self._append_file.flush()
+        self.graph.remove((None, None, None))
+        if self._type_index is not None:
+            self._type_index.clear()
+
+
+    def objects_of_type(self, rdf_type):
+        """
+        Returns the nodes of the given type created through this document, in creation
+        order, without querying the graph.
+
+        Args:
+            rdf_type: The type (can be of type rdflib.URIRef or string, e.g. 'File').
+
+        Only available for documents created with index=True. Nodes evicted by
+        serialize_append() are dropped from the index with their triples.
+        """
+        if self._type_index is None:
+            raise ValueError('objects_of_type() needs a document created with index=True.')
+        return self._type_index.get(_type_uri(rdf_type), [])
+
+
+    def bundles_of(self, core_object):
+        """
+        Returns the PropertyBundles attached to core_object through
+        CoreObject.create_PropertyBundle(), grouped by type (see CoreObject.bundles).
+        """
+        return [bundle for bundles in core_object.bundles.values() for bundle in bundles]
+
+
+    def _index(self, node, rdf_type):
+        if self._type_index is not None:
+            self._type_index[_type_uri(rdf_type or node.RDF_TYPE)].append(node)
 
 
 #====================================================
 #-- CREATE A CASE OBJECT
 
+    def _create(self, cls, rdf_type, properties):
+        """Creates a node of class cls, taking its id from id_factory unless a uri is given."""
+        key = None
+        if self.intern_cache is not None and not properties.get('uri'):
+            key = self.intern_cache.key(cls, rdf_type, properties)
+            if key is not None:
+                node = self.intern_cache.get(key)
+                if node is not None:
+                    if self._awaiting_node is not None:
+                        self._awaiting_node[1] = node.uri
+                        self._awaiting_node = None
+                    return node
+
+        if not properties.get('uri'):
+            properties['uri'] = self.id_factory(rdf_type, properties)
+        if cls.CREATION_TIME and 'creation_time' not in properties:
+            if self.creation_time == 'node':
+                properties['creation_time'] = datetime.datetime.utcnow()
+            else:
+                properties['creation_time'] = self._timestamp
+        node = cls(self._sink, rdf_type=rdf_type, document=self, **properties)
+        self._index(node, rdf_type)
+        if self._awaiting_node is not None:
+            self._awaiting_node[1] = node.uri
+            self._awaiting_node = None
+
+        if key is not None:
+            self.intern_cache.put(key, node, properties)
+        return node
+
     def create_Node(self, rdf_type=None, uri=None, bnode=False, **kwargs):
-        return Node(self.graph, rdf_type=rdf_type, uri=uri, bnode=bnode,  **kwargs)
+        if not uri:
+            uri = self.id_factory(rdf_type, kwargs)
+        node = Node(self._sink, rdf_type=rdf_type, uri=uri, bnode=bnode, document=self, **kwargs)
+        self._index(node, rdf_type)
+        return node
 
     def create_CoreObject(self, _type=None, **kwargs):
         """
         Creates and returns a CoreObject.
         """
-        return CoreObject(self.graph, rdf_type=_type, **kwargs)
+        return self._create(CoreObject, _type, kwargs)
+
+    def create_PropertyBundle(self, _type=None, **kwargs):
+        """
+        Creates and returns a PropertyBundle (a blank node).
+        Use CoreObject.create_PropertyBundle() to also attach it to its CoreObject.
+        """
+        return self._create(PropertyBundle, _type, kwargs)
 
     def create_ContextObject(self, _type=None, **kwargs):
         """
         Creates and returns a Context.
         This class may not have PropertyBundles.
         """
-        return ContextObject(self.graph, rdf_type=_type, **kwargs)
+        return self._create(ContextObject, _type, kwargs)
 
     def create_DuckObject(self, _type=None, **kwargs):
         """
@@ -137,7 +479,7 @@ class Document(object):
         These lonely Ducks have no CASE class parents and are fully duck-typed.
         This class may not have PropertyBundles.
         """
-        return DuckObject(self.graph, rdf_type=_type, **kwargs)
+        return self._create(DuckObject, _type, kwargs)
 
     def create_SubObject(self, _type=None, **kwargs):
         """
@@ -145,29 +487,734 @@ class Document(object):
         This class is for children of one of the above CASE classes.
         This class may not have PropertyBundles.
         """
-        return SubObject(self.graph, rdf_type=_type, **kwargs)
+        return self._create(SubObject, _type, kwargs)
+
+    def create(self, _kind, _type, **kwargs):
+        """
+        Creates and returns an object with the NLG function <_kind>_<_type>, for code that
+        only knows the type at run time (e.g. a mapper reading type names from a file).
+
+            doc.create('propbundle', 'File', uco_object=trace, filename=['report.pdf'])
+
+        The parameters are checked and turned into properties as by the NLG function,
+        with one dictionary lookup per parameter (see GENERIC FACTORY in NLG/constructors.py).
+
+        Args:
+            _kind: 'core', 'core_sub', 'context', 'duck', 'duck_sub', 'propbundle' or 'propbundle_sub'.
+            _type: The NLG type, e.g. 'File'.
+            kwargs: Parameters of the NLG function except uco_document; propbundle types take
+                    the object to add the bundle to as uco_object.
+        """
+        import NLG
+        return NLG.create(self, _kind, _type, kwargs)
+
+#====================================================
+#-- NODE IDENTIFIERS
+#
+# An id factory is called as factory(rdf_type, properties) for every node a Document
+# creates and returns the string used for its URI (or blank node id).
+
+class UUID4Ids(object):
+    """Random UUIDs (the default)."""
+
+    def __call__(self, rdf_type, properties):
+        return str(uuid.uuid4())
+
+
+class SequentialIds(object):
+    """A prefix followed by a counter, the cheapest scheme.
+
+    Ids are only unique within one run, so give each run its own prefix if the
+    output will be merged with other documents.
+    """
+
+    def __init__(self, prefix='node-', start=0):
+        self.prefix = prefix
+        self._counter = itertools.count(start)
+
+    def __call__(self, rdf_type, properties):
+        return self.prefix + str(next(self._counter))
+
+
+class ContentHashIds(object):
+    """UUIDv5 ids derived from the node's type and identifying properties.
+
+    Nodes with the same type and identifying properties get the same id, so their
+    triples merge in the graph and repeated runs produce the same output.
+
+    Args:
+        namespace: UUID namespace for uuid.uuid5().
+        keys: Optional dict of type name -> predicate names identifying that type, as
+              they appear in the output (e.g. {'Hash': ('HashMethod', 'HashValue')}).
+              Types not listed, and nodes with none of their keys set, are identified
+              by all of their properties.
+
+    A node identified by a one-shot iterable (e.g. a generator) gets a random UUID, as
+    the iterable cannot be fingerprinted without consuming it.
+    """
+
+    def __init__(self, namespace=uuid.NAMESPACE_URL, keys=None):
+        self.namespace = namespace
+        self.keys = dict((name, frozenset(names)) for name, names in (keys or {}).items())
+
+    def __call__(self, rdf_type, properties):
+        keys = self.keys.get(_local_name(rdf_type))
+        if keys:
+            identifying = dict((k, v) for k, v in properties.items() if _local_name(k) in keys and
+                               v is not None and not isinstance(v, Missing))
+            if identifying:
+                properties = identifying
+        if _has_one_shot(properties):
+            return str(uuid.uuid4())
+        return str(uuid.uuid5(self.namespace, fingerprint(rdf_type, properties)))
+
+
+def _local_name(rdf_type):
+    """Type or predicate name without its namespace ('File' for both 'File' and CASE.File)."""
+    if isinstance(rdf_type, rdflib.URIRef):
+        return rdf_type.split('#')[-1]
+    return rdf_type
+
+
+def _fingerprint_value(value):
+    if isinstance(value, Node):
+        return '<%s>' % value.uri
+    if isinstance(value, rdflib.term.Node):
+        return value.n3()
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    return '%s:%s' % (type(value).__name__, value)
+
+
+def _has_one_shot(properties):
+    """True if a value of properties is a one-shot iterable (e.g. a generator), which
+    only Node.add() may consume."""
+    return any(is_multiple(value) and iter(value) is value for value in properties.values())
+
+
+def fingerprint(rdf_type, properties):
+    """Canonical string of a node's type and properties.
+
+    Unset (None/Missing) properties are ignored and multi-valued properties (every
+    value is_multiple() is true for) are order-independent, matching what ends up in
+    the graph. Properties are named without their namespace, so a predicate URIRef
+    and its plain name match.
+
+    Raises:
+        ValueError: A value is a one-shot iterable (see _has_one_shot()).
+    """
+    parts = [str(rdf_type)]
+    for name, key in sorted((_local_name(key), key) for key in properties):
+        value = properties[key]
+        if value is None or isinstance(value, Missing):
+            continue
+        if is_multiple(value):
+            if iter(value) is value:
+                raise ValueError('{0} is a one-shot iterable and cannot be fingerprinted.'.format(name))
+            # str() of a large NumPy array is abbreviated with '...'.
+            if numpy is not None and isinstance(value, numpy.ndarray):
+                value = value.tolist()
+            value = '[%s]' % ','.join(sorted(_fingerprint_value(v) for v in value
+                                             if v is not None and not isinstance(v, Missing)))
+        else:
+            value = _fingerprint_value(value)
+        parts.append('%s=%s' % (name, value))
+    return '\n'.join(parts)
+
+
+#====================================================
+#-- INTERNING
+
+class InternCache(object):
+    """Bounded LRU of recently created nodes, keyed by type and properties.
+
+    Only use it for types whose instances are interchangeable values (e.g.
+    ControlledVocabulary, Hash, EmailAddress): two Traces with the same properties
+    would otherwise collapse into one node.
+
+    Args:
+        maxsize: Number of nodes to remember. The least recently used node is
+                 forgotten first, so a later repeat of it is emitted again.
+        types: Optional iterable of type names to intern (e.g. ['Hash']).
+               If not provided, every type is interned.
+    """
+
+    def __init__(self, maxsize=100000, types=None):
+        self.maxsize = maxsize
+        self.types = frozenset(types) if types is not None else None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.triples_saved = 0
+        self._nodes = collections.OrderedDict()
+
+
+    def key(self, cls, rdf_type, properties):
+        """Returns the cache key for a node, or None if it is not interned: its type is
+        not interned or a value is a one-shot iterable, which only Node.add() may consume
+        (and whose item checks, see check_items(), run as it does)."""
+        if self.types is not None and _local_name(rdf_type) not in self.types:
+            return None
+        if _has_one_shot(properties):
+            return None
+        return hashlib.sha1((cls.__name__ + '\n' + fingerprint(rdf_type, properties)).encode('utf-8')).digest()
+
+
+    def get(self, key):
+        """Returns the node stored under key (marking it recently used), or None."""
+        entry = self._nodes.pop(key, None)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._nodes[key] = entry
+        self.hits += 1
+        self.triples_saved += entry[1]
+        return entry[0]
+
+
+    def put(self, key, node, properties):
+        """Remembers a newly created node, evicting the least recently used one if full."""
+        self._nodes[key] = (node, _count_triples(properties))
+        if len(self._nodes) > self.maxsize:
+            self._nodes.popitem(last=False)
+            self.evictions += 1
+
+
+    def __len__(self):
+        return len(self._nodes)
+
+
+    def stats(self):
+        return {'size': len(self._nodes), 'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions, 'triples_saved': self.triples_saved}
+
+
+def _count_triples(properties):
+    """Number of triples a node emitted when created with these properties
+    (including its creation_time, which Document._create adds to them).
+    One-shot iterables are not counted, as counting would consume them; such
+    nodes are never interned (see InternCache.key())."""
+    count = 1   # rdf:type
+    for key, value in properties.items():
+        if key in ('uri', 'document') or value is None or isinstance(value, Missing):
+            continue
+        if is_multiple(value):
+            if iter(value) is not value:
+                count += sum(1 for v in value if v is not None and not isinstance(v, Missing))
+        else:
+            count += 1
+    return count
+
+
+#====================================================
+#-- BULK INGESTION
+
+class TripleBatch(object):
+    """Buffers triples and adds them to a graph in chunks through Graph.addN().
+
+    Nodes created inside Document.batch() write to this object instead of the graph.
+    Once the batch is closed it passes triples straight through to the graph, so
+    nodes that outlive the batch (e.g. a Trace that later gets more PropertyBundles)
+    keep working.
+
+    Args:
+        target: The rdflib.Graph (or streaming writer) to add the triples to.
+        chunk_size: Number of triples per addN() call.
+    """
+
+    def __init__(self, target, chunk_size=10000):
+        self.target = target
+        self.chunk_size = chunk_size
+        self.closed = False
+        self._quads = []
+
+
+    def add(self, triple):
+        """Queues a triple, flushing when the chunk is full."""
+        if self.closed:
+            self.target.add(triple)
+            return
+        self._quads.append(triple + (self.target,))
+        if len(self._quads) >= self.chunk_size:
+            self.flush()
+
+
+    def flush(self):
+        """Adds all queued triples to the target."""
+        if self._quads:
+            quads, self._quads = self._quads, []
+            self.target.addN(quads)
+
+
+    def close(self):
+        self.flush()
+        self.closed = True
+
+
+#====================================================
+#-- STREAMING OUTPUT
+#
+# Writers have the add(triple) / addN(quads) interface of rdflib.Graph so that they
+# can take the graph's place in Document(stream=...).
+
+class _StreamWriter(object):
+
+    def __init__(self, destination):
+        """
+        Args:
+            destination: Path of the file to write, or a writable text file object.
+        """
+        if isinstance(destination, (str, type(u''))):
+            self._file = io.open(destination, 'w', encoding='utf-8')
+            self._owns_file = True
+        else:
+            self._file = destination
+            self._owns_file = False
+
+
+    def addN(self, quads):
+        for s, p, o, _ in quads:
+            self.add((s, p, o))
+
+
+    def flush(self):
+        self._file.flush()
+
+
+    def close(self):
+        self.flush()
+        if self._owns_file:
+            self._file.close()
+
+
+def _nt_escape(value):
+    return (value.replace('\\', '\\\\').replace('"', '\\"')
+                 .replace('\n', '\\n').replace('\r', '\\r'))
+
+
+def _nt_term(term):
+    """N-Triples form of an rdflib term."""
+    if isinstance(term, rdflib.Literal):
+        value = u'"%s"' % _nt_escape(term)
+        if term.language:
+            return value + u'@' + term.language
+        if term.datatype:
+            return value + u'^^<%s>' % term.datatype
+        return value
+    if isinstance(term, rdflib.BNode):
+        return u'_:' + term
+    return u'<%s>' % term
+
+
+class NTriplesWriter(_StreamWriter):
+    """Writes each triple as an N-Triples line as soon as it is added."""
+
+    def add(self, triple):
+        s, p, o = triple
+        self._file.write(u'%s %s %s .\n' % (_nt_term(s), _nt_term(p), _nt_term(o)))
+
+
+class JSONLinesWriter(_StreamWriter):
+    """Writes one compacted JSON-LD node object per line.
+
+    Consecutive triples of the same subject are collected into one node object,
+    so only the node being written is held in memory. A triple added to a node
+    after another node was written (e.g. a CoreObject's propertyBundle link) starts
+    a new line with the same @id, which JSON-LD processors merge.
+
+    Args:
+        destination: Path of the file to write, or a writable text file object.
+        context: JSON-LD context included in every line.
+                 If not provided, @vocab is the CASE namespace and 'xsd' is defined.
+    """
+
+    def __init__(self, destination, context=None):
+        super(JSONLinesWriter, self).__init__(destination)
+        if context is None:
+            context = {'@vocab': str(CASE), 'xsd': str(XSD)}
+        self.context = context
+        self._compactor = JSONLDCompactor(context)
+        self._subject = None
+        self._pairs = []
+
+
+    def add(self, triple):
+        s, p, o = triple
+        if s != self._subject:
+            self._write_node()
+            self._subject = s
+        self._pairs.append((p, o))
+
+
+    def _write_node(self):
+        if self._subject is None:
+            return
+        node = self._compactor.node_object(self._subject, self._pairs)
+        node['@context'] = self.context
+        self._file.write(json.dumps(node, sort_keys=True, ensure_ascii=False) + u'\n')
+        self._subject = None
+        self._pairs = []
+
+
+    def flush(self):
+        self._write_node()
+        super(JSONLinesWriter, self).flush()
+
+
+_APPEND_WRITERS = {'json-lines': JSONLinesWriter, 'nt': NTriplesWriter}
+
+
+class RollingFile(object):
+    """Text file opened for appending that continues in a new numbered file once it
+    reaches max_bytes (output.jsonl, output.1.jsonl, output.2.jsonl ...).
+
+    The size is checked before each write(), so a file never ends in the middle of
+    a write. Reopening the same path resumes at the last file that has room left.
+    """
+
+    def __init__(self, path, max_bytes=None):
+        self.base_path = path
+        self.max_bytes = max_bytes
+        self.index = 0
+        while self.max_bytes and os.path.exists(self.path) and os.path.getsize(self.path) >= self.max_bytes:
+            self.index += 1
+        self._file = None
+        self._size = 0
+
+
+    @property
+    def path(self):
+        """Path of the file currently written to."""
+        if self.index == 0:
+            return self.base_path
+        root, ext = os.path.splitext(self.base_path)
+        return '{0}.{1}{2}'.format(root, self.index, ext)
+
+
+    def write(self, text):
+        if self._file is not None and self.max_bytes and self._size >= self.max_bytes:
+            self._file.close()
+            self._file = None
+            self.index += 1
+        if self._file is None:
+            self._file = io.open(self.path, 'a', encoding='utf-8')
+            self._size = self._file.tell()
+        self._file.write(text)
+        self._size += len(text.encode('utf-8'))
+
+
+    def flush(self):
+        if self._file is not None:
+            self._file.flush()
+
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+#====================================================
+#-- JSON-LD
+
+def _group_by_subject(graph):
+    """Returns (subject, [(predicate, object), ...]) for every subject of graph in one pass."""
+    subjects = collections.OrderedDict()
+    for s, p, o in graph:
+        pairs = subjects.get(s)
+        if pairs is None:
+            pairs = subjects[s] = []
+        pairs.append((p, o))
+    return subjects.items()
+
+
+# Datatypes written as native JSON values (as rdflib-jsonld does).
+_NATIVE_DATATYPES = {
+    XSD.boolean: lambda value: value.toPython(),
+    XSD.integer: lambda value: value.toPython(),
+    XSD.double: lambda value: value.toPython(),
+}
+
+class JSONLDCompactor(object):
+    """Builds compacted JSON-LD node objects from the (predicate, object) pairs of a subject.
+
+    Keys and types are compacted against the context's @vocab first and then its
+    prefixes; IRIs that match neither are written in full.
+    """
+
+    def __init__(self, context):
+        self.context = context
+        self.vocab = context.get('@vocab')
+        # Longest namespace first so that nested namespaces pick the closest prefix.
+        self.prefixes = sorted(((str(ns), pfx) for pfx, ns in context.items() if not pfx.startswith('@')),
+                               key=lambda item: -len(item[0]))
+        self._terms = {}
+        # Predicate -> key of the node object.
+        self._keys = {RDF.type: '@type'}
+
+
+    def term(self, iri):
+        """Compacts a property or type IRI (vocabulary-relative)."""
+        term = self._terms.get(iri)
+        if term is None:
+            if self.vocab and iri.startswith(self.vocab) and len(iri) > len(self.vocab):
+                term = iri[len(self.vocab):]
+            else:
+                term = self.compact_id(iri)
+            self._terms[iri] = term
+        return term
+
+
+    def compact_id(self, iri):
+        """Compacts an @id value (prefixes only, as @vocab does not apply to ids)."""
+        if isinstance(iri, rdflib.BNode):
+            return u'_:' + iri
+        iri = str(iri)
+        # Relative ids (such as the default UUIDs) cannot match a prefix.
+        if ':' in iri:
+            for ns, pfx in self.prefixes:
+                if iri.startswith(ns) and len(iri) > len(ns):
+                    return u'%s:%s' % (pfx, iri[len(ns):])
+        return iri
+
+
+    def value(self, obj):
+        """JSON-LD value of an rdflib object term."""
+        if isinstance(obj, rdflib.Literal):
+            datatype = obj.datatype
+            if datatype is None:
+                if obj.language:
+                    return {'@value': str(obj), '@language': obj.language}
+                return str(obj)
+            native = _NATIVE_DATATYPES.get(datatype)
+            if native is not None:
+                return native(obj)
+            return {'@type': self.term(datatype), '@value': str(obj)}
+        return {'@id': self.compact_id(obj)}
+
+
+    def node_object(self, subject, pairs):
+        """Returns the node object (a dict) of subject with the given (predicate, object) pairs."""
+        node = {'@id': self.compact_id(subject)}
+        types = []
+        keys = self._keys
+        for p, o in pairs:
+            key = keys.get(p)
+            if key is None:
+                key = keys[p] = self.term(p)
+            if key == '@type':
+                types.append(self.term(o))
+                continue
+            value = self.value(o)
+            existing = node.get(key)
+            if existing is None:
+                node[key] = value
+            elif isinstance(existing, list):
+                existing.append(value)
+            else:
+                node[key] = [existing, value]
+        if types:
+            node['@type'] = types[0] if len(types) == 1 else types
+        return node
+
+
+#====================================================
+#-- TYPE HIERARCHY
+#
+# Every node carries a TypeTag for its class and type (node.type_tag). A tag holds a small
+# integer id for the type and the bitset of the ids of its ancestors in the ontology class
+# tree, so testing whether a node's type derives from another one is a single bitwise and,
+# however deep the tree is. The tree is filled by register_types() (NLG.py registers the
+# classes of the CASE ontology).
+
+class TypeTag(object):
+    """The class and type shared by a set of nodes (see type_tag())."""
+
+    __slots__ = ('cls', 'type', 'uri', 'id', 'ancestors')
+
+    def __init__(self, cls, rdf_type):
+        self.cls = cls
+        self.type = rdf_type
+        # The object of the nodes' rdf:type triple.
+        uri = rdf_type or cls.RDF_TYPE
+        self.uri = uri if isinstance(uri, rdflib.term.Node) else cls.NAMESPACE[uri]
+        self.id = type_id(_type_name(rdf_type))
+        self.ancestors = type_ancestors(_type_name(rdf_type))
+
+    def __repr__(self):
+        return 'TypeTag({0}, {1!r})'.format(self.cls.__name__, self.type)
+
+
+# Type name -> id, type name -> parent names, type name -> ancestor bitset, (class, type) -> TypeTag.
+_type_ids = {}
+_type_parents = {}
+_type_ancestors = {}
+_type_tags = {}
+
+def _type_name(rdf_type):
+    """Returns the name of rdf_type in the class tree ('Action' for 'Action' and CASE.Action)."""
+    if isinstance(rdf_type, rdflib.term.Node):
+        return rdf_type.split('#')[-1]
+    return rdf_type
+
+
+def type_id(name):
+    """Returns the id of the type name, assigning the next free one to new names."""
+    number = _type_ids.get(name)
+    if number is None:
+        number = _type_ids[name] = len(_type_ids)
+    return number
+
+
+def type_bit(name):
+    """Returns the bit of the type name in ancestor bitsets."""
+    return 1 << type_id(name)
+
+
+def type_ancestors(name):
+    """Returns the bitset of the ancestors of the type name (not including the type itself)."""
+    bits = _type_ancestors.get(name)
+    if bits is None:
+        # Placeholder while the parents are visited, which also ends cycles.
+        _type_ancestors[name] = 0
+        bits = 0
+        for parent in _type_parents.get(name, ()):
+            bits |= type_bit(parent) | type_ancestors(parent)
+        _type_ancestors[name] = bits
+    return bits
+
+
+def register_types(parents):
+    """
+    Adds types to the class tree. Tags created before are updated.
+
+    Args:
+        parents: Dictionary of type name to the tuple of names of its direct parents
+                 (the rdfs:subClassOf classes in the ontology).
+    """
+    for name, names in parents.items():
+        _type_parents[name] = tuple(names)
+    _type_ancestors.clear()
+    for tag in _type_tags.values():
+        tag.ancestors = type_ancestors(_type_name(tag.type))
+
+
+def type_tag(cls, rdf_type):
+    """
+    Returns the TypeTag of the nodes of class cls created with rdf_type, which every Node
+    stores as node.type_tag. Tags are interned, so a check for many nodes of one NLG type
+    compares each node's tag by identity instead of calling isinstance() and comparing
+    type names.
+
+    Args:
+        cls: The Node class (e.g. CoreObject).
+        rdf_type: The type as given when creating the node (e.g. 'Action').
+    """
+    key = (cls, rdf_type)
+    tag = _type_tags.get(key)
+    if tag is None:
+        tag = _type_tags[key] = TypeTag(cls, rdf_type)
+    return tag
+
+
+#====================================================
+#-- PREDICATES
+#
+# Node.add() turns property names into predicates through this table, so each predicate
+# URIRef is built once and shared by every triple using it. A name is its own predicate
+# name in the CASE namespace; the NLG functions pass predicate URIRefs instead (see
+# NLG/predicates.py), which Node.add() uses as they are.
+
+_predicates = {}
+
+def predicate(name):
+    """Returns the CASE predicate (a shared rdflib.URIRef) for the property name."""
+    uri = _predicates.get(name)
+    if uri is None:
+        uri = _predicates[name] = CASE[name]
+    return uri
+
 
 #====================================================
 #-- CASE OBJECT CLASSES
 
+# Default creation_time of the CASE object classes: the time the node is created.
+NOW = object()
+
+def _creation_time(value):
+    if value is NOW:
+        return datetime.datetime.utcnow()
+    return value
+
+
+# Values Node.add() treats as one value even though they are iterable.
+try:
+    _SINGLE_VALUES = (str, bytes, unicode, bytearray, memoryview, rdflib.term.Node, dict)
+except NameError:
+    _SINGLE_VALUES = (str, bytes, bytearray, memoryview, rdflib.term.Node, dict)
+
+def is_multiple(value):
+    """True if Node.add() adds each item of value as a separate value: lists, tuples,
+    sets, generators and other iterables except strings, binary data (bytes, bytearray,
+    memoryview), rdflib terms and dicts."""
+    return isinstance(value, (list, tuple, set)) or \
+           (not isinstance(value, _SINGLE_VALUES) and hasattr(value, '__iter__'))
+
+
+# Item checks of iterables being added, keyed by id(). See check_items().
+_item_checks = {}
+
+def check_items(iterable, test, fail):
+    """
+    Checks the items of iterable as Node.add() consumes it, for one-shot iterables
+    (such as generators) that cannot be checked beforehand without materializing them.
+    The entry stays (and keeps iterable alive) until Node.add() consumes it, so only
+    register iterables that are about to be added, after any other check has passed.
+
+    Args:
+        iterable: The value about to be passed to Node.add().
+        test: Function (item) -> bool.
+        fail: Function (node) called for the first item failing test. If it raises,
+              the items added so far stay in the graph.
+    """
+    # The entry keeps iterable alive, so its id() cannot be reused while registered.
+    _item_checks[id(iterable)] = (iterable, test, fail)
+
+
+def _check_validation_level(level):
+    if level not in VALIDATION_LEVELS:
+        raise ValueError('validation must be one of {0}, not {1!r}'.format(VALIDATION_LEVELS, level))
+
+
+def _type_uri(rdf_type):
+    """Returns rdf_type as a URIRef, adding the CASE prefix to plain names."""
+    if isinstance(rdf_type, rdflib.term.Node):
+        return rdf_type
+    return Node.NAMESPACE[rdf_type]
+
+
 class Node(object):
     """Implements a generic node in the graph."""
 
     RDF_TYPE = None
+    # Property holding the node's creation time (set by the CASE object classes).
+    CREATION_TIME = None
     # Namespace to use when adding properties that are not of type rdflib.URIRef.
     NAMESPACE = CASE
 
-    def __init__(self, graph, uri=None, bnode=False, rdf_type=None, **kwargs):
+    def __init__(self, graph, uri=None, bnode=False, rdf_type=None, document=None, **kwargs):
         """Initializes and adds a node to the graph.
 
         NOTE: At least the type or a property must be supplied for the Node
         to exist in the graph.
 
         Args:
-            graph: The graph to add this node to. (instance of rdflib.Graph)
+            graph: The graph to add this node to. (instance of rdflib.Graph, or any object
+                   with an add(triple) method such as a TripleBatch)
             uri: Optional string to set th URI to. (If not provided a UUID will be generated.)
             bnode: Whether to create a blank node or a uri reference.
             rdf_type: The RDF type to set this node to.
+            document: The Document that created this node (if any).
             properties: Extra properties to add to this node.
             (More properties can be set after initialization by using the add() function.)
         """
@@ -182,13 +1229,10 @@ class Node(object):
         else:
             self._node = rdflib.URIRef(self.uri)
         self._graph = graph
-        if not rdf_type:
-            rdf_type = self.RDF_TYPE
-
-        # Add namespace prefix to non URIRef to allow abstraction from rdflib.
-        if not isinstance(rdf_type, rdflib.term.Node):
-            rdf_type = self.NAMESPACE[rdf_type]
-        self.add(RDF.type, rdf_type)
+        self.document = document
+        # The tag holds the rdf:type URIRef (RDF_TYPE if rdf_type is not given).
+        self.type_tag = type_tag(self.__class__, rdf_type)
+        self.add(RDF.type, self.type_tag.uri)
         for key, value in iter(kwargs.items()):
             self.add(key, value)
 
@@ -197,16 +1241,29 @@ class Node(object):
         """Adds a property and its value to the node."""
         # type: (object, object) -> object
 
-        # Ignore setting properties with a None value.
-        if value is None:
+        # Ignore setting properties with a None value or an unset NLG parameter.
+        if value is None or value is MISSING or isinstance(value, Missing):
             return
 
         # Lists and other iterables as values are the equivelent of having multiple properties.
+        # They are consumed item by item, so generators are never materialized.
         # NOTE: Lists obviously lose their order.
         # TODO: Add support for ordered lists.
-        if isinstance(value, (list, tuple, set)):
-            for item in value:
-                self.add(property, item)
+        if is_multiple(value):
+            check = _item_checks.pop(id(value), None) if _item_checks else None
+            # NumPy arrays hold NumPy scalars, which rdflib does not map to XSD datatypes.
+            if numpy is not None and isinstance(value, numpy.ndarray):
+                value = value.tolist()
+            if check is None:
+                for item in value:
+                    self.add(property, item)
+            else:
+                iterable, test, fail = check
+                for item in value:
+                    if test is not None and not test(item):
+                        test = None
+                        fail(self)
+                    self.add(property, item)
             return
         if isinstance(value, Node):
             value = value._node
@@ -217,7 +1274,7 @@ class Node(object):
 
         # Automatically convert non-node properties to URIRef using default prefix.
         if not isinstance(property, rdflib.term.Node):
-            property = self.NAMESPACE[property]
+            property = predicate(property) if self.NAMESPACE is CASE else self.NAMESPACE[property]
 
         self._graph.add((self._node, property, value))
 
@@ -225,8 +1282,9 @@ class Node(object):
 class CoreObject(Node):
 
     RDF_TYPE = CASE.CoreObject
+    CREATION_TIME = 'CoreObjectCreationTime'
 
-    def __init__(self, graph, rdf_type=None, **kwargs):
+    def __init__(self, graph, rdf_type=None, creation_time=NOW, **kwargs):
         """Initializes and adds a node to the graph.
         NOTE: At least the type or a property must be supplied for the Node
         to exist in the graph.
@@ -234,6 +1292,8 @@ class CoreObject(Node):
         Args:
             graph: The graph to add this node to. (instance of rdflib.Graph)
             rdf_type: The RDF type to set this node to.
+            creation_time: Value of the creation time property (a datetime or rdflib.Literal).
+                           Defaults to the current time; None leaves it out.
             properties: Extra properties to add to this node.
             (More properties can be set after initialization by using the add() function.)
         """
@@ -241,8 +1301,11 @@ class CoreObject(Node):
         self.type = rdf_type
 
         super(CoreObject, self).__init__(graph, rdf_type=rdf_type, **kwargs)
-        self.add('CoreObjectCreationTime', datetime.datetime.utcnow())
+        self.add(self.CREATION_TIME, _creation_time(creation_time))
+        # Most recently created PropertyBundle.
         self.pb = ""
+        # PropertyBundles by the type they were created with, e.g. self.bundles['File'].
+        self.bundles = collections.OrderedDict()
 
 
     def create_PropertyBundle(self, prop_type=None, **kwargs):
@@ -256,8 +1319,12 @@ class CoreObject(Node):
             The property bundle created (instance of PropertyBundle).
         """
 
-        self.pb = PropertyBundle(self._graph, rdf_type=prop_type, **kwargs)
+        if self.document is not None:
+            self.pb = self.document.create_PropertyBundle(prop_type, **kwargs)
+        else:
+            self.pb = PropertyBundle(self._graph, rdf_type=prop_type, **kwargs)
         self.add(CASE.propertyBundle, self.pb)
+        self.bundles.setdefault(prop_type, []).append(self.pb)
 
         return self.pb
 
@@ -266,7 +1333,7 @@ class PropertyBundle(Node):
 
     RDF_TYPE = CASE.PropertyBundle
 
-    def __init__(self, graph, rdf_type=None, **kwargs):
+    def __init__(self, graph, rdf_type=None, uri=None, document=None, **kwargs):
         """Initializes and adds a node to the graph.
         NOTE: At least the type or a property must be supplied for the Node
         to exist in the graph.
@@ -274,6 +1341,8 @@ class PropertyBundle(Node):
         Args:
             graph: The graph to add this node to. (instance of rdflib.Graph)
             rdf_type: The RDF type to set this node to.
+            uri: Optional string to set the blank node id to.
+            document: The Document that created this node (if any).
             properties: Extra properties to add to this node.
             (More properties can be set after initialization by using the add() function.)
         """
@@ -285,14 +1354,15 @@ class PropertyBundle(Node):
         self.propObj = kwargs
 
         super(PropertyBundle, self).__init__(
-                graph, bnode=True, rdf_type=rdf_type, **kwargs)
+                graph, uri=uri, bnode=True, rdf_type=rdf_type, document=document, **kwargs)
 
 
 class ContextObject(Node):
 
     RDF_TYPE = CASE.ContextObject
+    CREATION_TIME = 'ContextObjectCreationTime'
 
-    def __init__(self, graph, rdf_type=None, **kwargs):
+    def __init__(self, graph, rdf_type=None, creation_time=NOW, **kwargs):
         """Initializes and adds a node to the graph.
         NOTE: At least the type must be supplied for the Node
         to exist in the graph.
@@ -300,6 +1370,8 @@ class ContextObject(Node):
         Args:
             graph: The graph to add this node to. (instance of rdflib.Graph)
             rdf_type: The RDF type to set this node to.
+            creation_time: Value of the creation time property (a datetime or rdflib.Literal).
+                           Defaults to the current time; None leaves it out.
             properties: Extra properties to add to this node.
             (More properties can be set after initialization by using the add() function.)
         """
@@ -307,14 +1379,15 @@ class ContextObject(Node):
         self.type = rdf_type
 
         super(ContextObject, self).__init__(graph, rdf_type=rdf_type, **kwargs)
-        self.add('ContextObjectCreationTime', datetime.datetime.utcnow())
+        self.add(self.CREATION_TIME, _creation_time(creation_time))
 
 
 class DuckObject(Node):
 
     RDF_TYPE = CASE.DuckObject
+    CREATION_TIME = 'DuckObjectCreationTime'
 
-    def __init__(self, graph, rdf_type=None, **kwargs):
+    def __init__(self, graph, rdf_type=None, creation_time=NOW, **kwargs):
         """Initializes and adds a node to the graph.
         NOTE: At least the type must be supplied for the Node
         to exist in the graph.
@@ -322,6 +1395,8 @@ class DuckObject(Node):
         Args:
             graph: The graph to add this node to. (instance of rdflib.Graph)
             rdf_type: The RDF type to set this node to.
+            creation_time: Value of the creation time property (a datetime or rdflib.Literal).
+                           Defaults to the current time; None leaves it out.
             properties: Extra properties to add to this node.
             (More properties can be set after initialization by using the add() function.)
         """
@@ -329,14 +1404,15 @@ class DuckObject(Node):
         self.type = rdf_type
 
         super(DuckObject, self).__init__(graph, rdf_type=rdf_type, **kwargs)
-        self.add('DuckObjectCreationTime', datetime.datetime.utcnow())
+        self.add(self.CREATION_TIME, _creation_time(creation_time))
 
 
 class SubObject(Node):
 
     RDF_TYPE = CASE.SubObject
+    CREATION_TIME = 'SubObjectCreationTime'
 
-    def __init__(self, graph, rdf_type=None, **kwargs):
+    def __init__(self, graph, rdf_type=None, creation_time=NOW, **kwargs):
         """Initializes and adds a node to the graph.
         NOTE: At least the type must be supplied for the Node
         to exist in the graph.
@@ -344,6 +1420,8 @@ class SubObject(Node):
         Args:
             graph: The graph to add this node to. (instance of rdflib.Graph)
             rdf_type: The RDF type to set this node to.
+            creation_time: Value of the creation time property (a datetime or rdflib.Literal).
+                           Defaults to the current time; None leaves it out.
             properties: Extra properties to add to this node.
             (More properties can be set after initialization by using the add() function.)
         """
@@ -351,4 +1429,4 @@ class SubObject(Node):
         self.type = rdf_type
 
         super(SubObject, self).__init__(graph, rdf_type=rdf_type, **kwargs)
-        self.add('SubObjectCreationTime', datetime.datetime.utcnow())
+        self.add(self.CREATION_TIME, _creation_time(creation_time))
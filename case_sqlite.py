@@ -0,0 +1,231 @@
+# NOTICE
+#
+# This software was produced for the U.S. Government under
+# contract SB-1341-14-CQ-0010, and is subject to the Rights
+# in Data-General Clause 52.227-14, Alt. IV (DEC 2007)
+#
+# (c) 2018 The MITRE Corporation. All Rights Reserved.
+
+
+#====================================================
+# CASE API - SQLITE TRIPLE STORE
+#!/usr/bin/env python
+
+"""
+Disk-backed rdflib Store for CASE documents that are too large to keep in memory.
+
+    import case
+    import case_sqlite
+
+    doc = case.Document(graph=case_sqlite.open_graph('investigation.db'))
+    ...
+    doc.graph.close()
+
+The database only needs Python's built-in sqlite3 module. Reopening the same file
+continues where the previous run stopped.
+"""
+
+import os
+import sqlite3
+
+import rdflib
+from rdflib.store import Store, VALID_STORE
+
+
+#====================================================
+#-- TERM ENCODING
+#
+# Terms are stored as text with a one character tag:
+#   <iri           URIRef
+#   _id            BNode
+#   "datatype"lang"lexical form   Literal (the lexical form comes last, so it may contain quotes)
+
+def _encode(term):
+    if isinstance(term, rdflib.Literal):
+        return u'"%s"%s"%s' % (term.datatype or u'', term.language or u'', term)
+    if isinstance(term, rdflib.BNode):
+        return u'_%s' % term
+    return u'<%s' % term
+
+
+def _decode(text):
+    tag = text[0]
+    if tag == u'<':
+        return rdflib.URIRef(text[1:])
+    if tag == u'_':
+        return rdflib.BNode(text[1:])
+    datatype, language, lexical = text[1:].split(u'"', 2)
+    return rdflib.Literal(lexical, lang=language or None, datatype=datatype or None)
+
+
+#====================================================
+#-- STORE
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS triples (
+    s TEXT NOT NULL,
+    p TEXT NOT NULL,
+    o TEXT NOT NULL,
+    PRIMARY KEY (s, p, o)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS triples_pos ON triples (p, o, s);
+CREATE INDEX IF NOT EXISTS triples_osp ON triples (o, s, p);
+CREATE TABLE IF NOT EXISTS namespaces (
+    prefix TEXT PRIMARY KEY,
+    uri TEXT NOT NULL
+);
+"""
+
+class SQLiteStore(Store):
+    """rdflib Store keeping triples in a SQLite database.
+
+    The primary key (s, p, o) and the covering indexes (p, o, s) and (o, s, p)
+    answer every triple pattern from an index. Writes are grouped into
+    transactions of batch_size triples; addN() inserts a whole chunk with one
+    executemany() call, so Document.batch() pays off with this store.
+
+    Pending writes are committed by commit(), close() and whenever batch_size
+    triples have accumulated.
+    """
+
+    context_aware = False
+    formula_aware = False
+    transaction_aware = True
+    graph_aware = False
+
+    def __init__(self, configuration=None, identifier=None, batch_size=10000):
+        self.batch_size = batch_size
+        self._db = None
+        self._pending = 0
+        super(SQLiteStore, self).__init__(configuration, identifier)
+
+
+    def open(self, configuration, create=True):
+        """Opens (or creates) the database file at the path given as configuration."""
+        if not create and not os.path.exists(configuration):
+            raise IOError('No CASE database at {0}'.format(configuration))
+        self._db = sqlite3.connect(configuration)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.executescript(_SCHEMA)
+        return VALID_STORE
+
+
+    def close(self, commit_pending_transaction=True):
+        """Commits pending writes and closes the database.
+
+        rdflib's Graph.close() passes commit_pending_transaction=False by default,
+        so pending writes are committed either way; call rollback() first to drop them.
+        """
+        if self._db is None:
+            return
+        self.commit()
+        self._db.close()
+        self._db = None
+
+
+    def destroy(self, configuration):
+        if self._db is not None:
+            self.rollback()
+            self.close()
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(configuration + suffix):
+                os.remove(configuration + suffix)
+
+
+    def commit(self):
+        self._db.commit()
+        self._pending = 0
+
+
+    def rollback(self):
+        self._db.rollback()
+        self._pending = 0
+
+
+    def _wrote(self, count):
+        self._pending += count
+        if self._pending >= self.batch_size:
+            self.commit()
+
+
+    #------------------------------------------------
+    # Triples
+
+    def add(self, triple, context=None, quoted=False):
+        self._db.execute('INSERT OR IGNORE INTO triples VALUES (?, ?, ?)', [_encode(t) for t in triple])
+        self._wrote(1)
+
+
+    def addN(self, quads):
+        rows = [(_encode(s), _encode(p), _encode(o)) for s, p, o, _ in quads]
+        self._db.executemany('INSERT OR IGNORE INTO triples VALUES (?, ?, ?)', rows)
+        self._wrote(len(rows))
+
+
+    @staticmethod
+    def _where(triple_pattern):
+        clauses = []
+        values = []
+        for column, term in zip('spo', triple_pattern):
+            if term is not None:
+                clauses.append(column + ' = ?')
+                values.append(_encode(term))
+        if not clauses:
+            return '', values
+        return ' WHERE ' + ' AND '.join(clauses), values
+
+
+    def remove(self, triple_pattern, context=None):
+        where, values = self._where(triple_pattern)
+        self._db.execute('DELETE FROM triples' + where, values)
+        self._wrote(1)
+
+
+    def triples(self, triple_pattern, context=None):
+        where, values = self._where(triple_pattern)
+        cursor = self._db.execute('SELECT s, p, o FROM triples' + where, values)
+        for s, p, o in cursor:
+            yield (_decode(s), _decode(p), _decode(o)), iter(())
+
+
+    def __len__(self, context=None):
+        return self._db.execute('SELECT COUNT(*) FROM triples').fetchone()[0]
+
+
+    def contexts(self, triple=None):
+        return iter(())
+
+
+    #------------------------------------------------
+    # Namespaces
+
+    def bind(self, prefix, namespace, override=True):
+        if override:
+            self._db.execute('DELETE FROM namespaces WHERE uri = ?', (str(namespace),))
+            self._db.execute('INSERT OR REPLACE INTO namespaces VALUES (?, ?)', (prefix, str(namespace)))
+        else:
+            self._db.execute('INSERT OR IGNORE INTO namespaces VALUES (?, ?)', (prefix, str(namespace)))
+        self._wrote(1)
+
+
+    def namespace(self, prefix):
+        row = self._db.execute('SELECT uri FROM namespaces WHERE prefix = ?', (prefix,)).fetchone()
+        return rdflib.URIRef(row[0]) if row else None
+
+
+    def prefix(self, namespace):
+        row = self._db.execute('SELECT prefix FROM namespaces WHERE uri = ?', (str(namespace),)).fetchone()
+        return row[0] if row else None
+
+
+    def namespaces(self):
+        for prefix, uri in self._db.execute('SELECT prefix, uri FROM namespaces').fetchall():
+            yield prefix, rdflib.URIRef(uri)
+
+
+def open_graph(path, batch_size=10000):
+    """Returns an rdflib.Graph stored in the SQLite database at path (created if needed)."""
+    store = SQLiteStore(batch_size=batch_size)
+    store.open(path, create=True)
+    return rdflib.Graph(store=store)
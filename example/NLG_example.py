@@ -24,7 +24,7 @@ https://casework.github.io/case/case-v0.1.0-natural-language-glossary.html
 NOTES ON FUNCTION STRUCTURE
 
     CASE objects:         Search "CREATE A CASE OBJECT" in the API (case_example.py) to understand the high-level CASE objects.
-    Parameters:           All parameters use underscores coming in and are set by default to a Missing object.
+    Parameters:           All parameters use underscores coming in and are set by default to MISSING (a case_example.Missing object).
     Required parameters:  The CASE Document class is passed in ('_sub' functions also require their superseding CASE class).
     Ontology parameters:  All other parameters are specified by the CASE ontology, and may be required or optional.
     Function docstrings:  'Any number of' = must be a list (otherwise pass in a single Python object)
@@ -56,16 +56,16 @@ import sys
 import unittest
 import datetime
 
-class Missing(object):
-    def __init__(self):
-        self.is_missing = True
+# Shared with case_example.py so that unset parameters are dropped by case_example.Node.add().
+Missing = case_example.Missing
+MISSING = case_example.MISSING
 
 
 #====================================================
 #-- CORE IN ALPHABETICAL ORDER
 
-def core_Action(uco_document, action_status=Missing(), start_time=Missing(), end_time=Missing(), errors=Missing(),
-                action_count=Missing(), subaction_refs=Missing(), **kwargs):
+def core_Action(uco_document, action_status=MISSING, start_time=MISSING, end_time=MISSING, errors=MISSING,
+                action_count=MISSING, subaction_refs=MISSING, **kwargs):
     '''
     :param ActionStatus: At most one occurrence of type ControlledVocabulary.
     :param StartTime: At most one value of type Timestamp.
@@ -98,7 +98,7 @@ def core_Action(uco_document, action_status=Missing(), start_time=Missing(), end
     return uco_document.create_CoreObject('Action', ActionStatus=action_status, StartTime=start_time, EndTime=end_time, Errors=errors, ActionCount=action_count, SubactionRefs=subaction_refs, **kwargs)
 
 
-def core_ControlledVocabulary(uco_document, value=Missing(), constraining_vocabulary_name=Missing(), constraining_vocabulary_ref=Missing(), **kwargs):
+def core_ControlledVocabulary(uco_document, value=MISSING, constraining_vocabulary_name=MISSING, constraining_vocabulary_ref=MISSING, **kwargs):
     '''
     :param Value: Exactly one value of type String.
     :param ConstrainingVocabularyName: At most one value of type String.
@@ -130,7 +130,7 @@ def core_Identity(uco_document, **kwargs):
     return uco_document.create_CoreObject('Identity', **kwargs)
 
 
-def core_MarkingDefinition(uco_document, definition_type=Missing(), definition=Missing(), **kwargs):
+def core_MarkingDefinition(uco_document, definition_type=MISSING, definition=MISSING, **kwargs):
     '''
     :param DefinitionType: Exactly one value of type String.
     :param Definition: Any number of occurrences of MarkingModel.
@@ -152,7 +152,7 @@ def core_MarkingDefinition(uco_document, definition_type=Missing(), definition=M
     return uco_document.create_CoreObject('MarkingDefinition', DefinitionType=definition_type, Definition=definition, **kwargs)
 
 
-def core_Tool(uco_document, name=Missing(), version=Missing(), tool_type=Missing(), service_pack=Missing(), creator=Missing(), references=Missing(), **kwargs):
+def core_Tool(uco_document, name=MISSING, version=MISSING, tool_type=MISSING, service_pack=MISSING, creator=MISSING, references=MISSING, **kwargs):
     '''
     :param Name: At most one value of type String.
     :param Version: At most one value of type String.
@@ -203,7 +203,7 @@ def core_sub_ForensicAction(uco_document, uco_object, **kwargs):
 #====================================================
 #-- CONTEXT IN ALPHABETICAL ORDER
 
-def context_Grouping(uco_document, context_strings=Missing(), **kwargs):
+def context_Grouping(uco_document, context_strings=MISSING, **kwargs):
     '''
     :param Context: Any number of values of type String.
     :return: A ContextObject object.
@@ -227,10 +227,10 @@ def context_Grouping(uco_document, context_strings=Missing(), **kwargs):
 #====================================================
 #-- PROPERTYBUNDLES IN ALPHABETICAL ORDER
 
-def propbundle_Account(uco_object, account_id=Missing(), expiration_time=Missing(), created_time=Missing(), account_type=Missing(),
-                account_issuer_ref=Missing(), is_active=Missing(), modified_time=Missing(), owner_ref=Missing(), **kwargs):
+def propbundle_Account(uco_object, account_id=MISSING, expiration_time=MISSING, created_time=MISSING, account_type=MISSING,
+                account_issuer_ref=MISSING, is_active=MISSING, modified_time=MISSING, owner_ref=MISSING, **kwargs):
     '''
-    :param AccoundID: Exactly one value of type String.
+    :param AccountID: Exactly one value of type String.
     :param ExprationTime: At most one value of type Timestamp.
     :param CreatedTime: At most one value of type Timestamp.
     :param AccountType: At most one occurrence of type ControlledVocabulary.
@@ -269,7 +269,7 @@ def propbundle_Account(uco_object, account_id=Missing(), expiration_time=Missing
         assert isinstance(owner_ref, case_example.CoreObject),\
         "[propbundle_Account] owner_ref must be of type CoreObject."
 
-    return uco_object.create_PropertyBundle('Account', AccoundID=account_id, ExpirationTime=expiration_time, CreatedTime=created_time,  AccountType=account_type, AccountIssuerRef=account_issuer_ref, IsActive=is_active, ModifiedTime=modified_time, OwnerRef=owner_ref, **kwargs)
+    return uco_object.create_PropertyBundle('Account', AccountID=account_id, ExpirationTime=expiration_time, CreatedTime=created_time,  AccountType=account_type, AccountIssuerRef=account_issuer_ref, IsActive=is_active, ModifiedTime=modified_time, OwnerRef=owner_ref, **kwargs)
 
 
 def propbundle_Identity(uco_object, **kwargs):
@@ -285,7 +285,7 @@ def propbundle_Identity(uco_object, **kwargs):
 #====================================================
 #-- PROPERTYBUNDLE CHILDREN IN ALPHABETICAL ORDER
 
-def propbundle_sub_SimpleName(uco_document, uco_object_propbundle, family_name=Missing(), given_name=Missing(), honorific_prefix=Missing(), honorific_suffix=Missing(), **kwargs):
+def propbundle_sub_SimpleName(uco_document, uco_object_propbundle, family_name=MISSING, given_name=MISSING, honorific_prefix=MISSING, honorific_suffix=MISSING, **kwargs):
     '''
     :param FamilyName: Any number of values of any type.
     :param GivenName: Any number of values of any type.
@@ -20,6 +20,19 @@ from rdflib import RDF
 CASE = rdflib.Namespace('http://case.example.org/core#')
 
 
+class Missing(object):
+    """Marks a parameter that was not supplied.
+
+    NLG functions default every ontology parameter to MISSING and pass all of them
+    through to the create functions below. Node.add() drops Missing values the same
+    way it drops None, so unset parameters never become triples.
+    """
+    def __init__(self):
+        self.is_missing = True
+
+MISSING = Missing()
+
+
 #====================================================
 #-- CREATE A CASE DOCUMENT FOR A SINGLE REPORT
 
@@ -198,8 +211,8 @@ class Node(object):
         """Adds a property and its value to the node."""
         # type: (object, object) -> object
 
-        # Ignore setting properties with a None value.
-        if value is None:
+        # Ignore setting properties with a None value or an unset NLG parameter.
+        if value is None or value is MISSING or isinstance(value, Missing):
             return
 
         # Lists and other iterables as values are the equivelent of having multiple properties.
@@ -18,11 +18,12 @@ setup(
     version='0.1.0',
     description='CASE/UCO API for creating RDF graphs and verifying ontological compliance.',
     long_description=(
-        'The Natural Language Glossary (NLG.py) has the necessary checks for ensuring proper inheritance, vocabulary, required parameters, and types; calling its functions (which return RDF nodes via case.py) is the typical way to use the API. However, in rare circumstances where CASE compliance is not desired case.py functions can be explicitly called to create RDF nodes.'),
+        'The Natural Language Glossary (NLG package) has the necessary checks for ensuring proper inheritance, vocabulary, required parameters, and types; calling its functions (which return RDF nodes via case.py) is the typical way to use the API. However, in rare circumstances where CASE compliance is not desired case.py functions can be explicitly called to create RDF nodes.'),
     install_requires=[
         'rdflib',
         'rdflib-jsonld'
     ],
     py_modules=['case',
-                'NLG'],
+                'case_sqlite'],
+    packages=['NLG'],
 )